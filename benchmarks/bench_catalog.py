@@ -0,0 +1,279 @@
+"""
+Benchmarks for the Localization QA Tool on synthetic .xcstrings catalogs.
+
+Generates a catalog with a configurable shape, then times the parse,
+extract, analyze and report stages separately, as well as applying the
+auto-fixes and writing the fixed catalog, and records their throughput and
+peak memory, along with the headless import time of the entry point. Results can be saved as a baseline and later runs compared
+against it, so performance regressions show up.
+
+    python benchmarks/bench_catalog.py --keys 20000 --languages 12 --save-baseline
+    python benchmarks/bench_catalog.py --keys 20000 --languages 12
+    python benchmarks/bench_catalog.py --keys 60000 --specifier-density 1 --dropped-specifier-rate 0.9
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from utils.catalog_fixes import apply_fixes
+from utils.string_parser import StringParser
+from utils.text_analyzer import TextAnalyzer
+from utils.translation_catalog import TranslationCatalog
+from utils.xcstrings_writer import iter_xcstrings
+from utils.report_generator import ReportGenerator
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+STUB_HELPER = os.path.join(ROOT, 'tests', 'test_data', 'stub_helper.py')
+# Fresh interpreters started to time the entry point import; the fastest counts
+STARTUP_RUNS = 5
+# A stage regresses when it is this much slower than the baseline
+DEFAULT_TOLERANCE = 0.25
+
+LTR_LANGUAGES = ['fr', 'de', 'es', 'it', 'pt', 'nl', 'sv', 'da', 'fi', 'pl', 'ru', 'ja', 'ko', 'zh-Hans', 'tr', 'uk']
+RTL_LANGUAGES = ['ar', 'he', 'fa']
+WORDS = ['account', 'settings', 'save', 'cancel', 'photo', 'message', 'download', 'profile',
+         'network', 'error', 'retry', 'welcome', 'delete', 'share', 'library', 'update']
+SPECIFIERS = ['%@', '%d', '%lld', '%f', '%1$@', '%2$d']
+ACCENTED = str.maketrans('aeiouc', 'áéíöüç')
+ARABIC = 'ابتثجحخدذرزسشصضطظعغفقكلمنهوي'
+
+def generate_catalog(keys: int, languages: int, rtl_share: float, specifier_density: float,
+                     missing_rate: float, seed: int = 0, dropped_specifier_rate: float = 0.0) -> Dict:
+    """Generate a catalog in the .xcstrings JSON shape.
+
+    `rtl_share` is the fraction of target languages that are right-to-left,
+    `specifier_density` the fraction of strings containing a format specifier,
+    `missing_rate` the fraction of translations left empty and
+    `dropped_specifier_rate` the fraction of translations of strings with a
+    specifier that leave it out, for --fix to restore.
+    """
+    rng = random.Random(seed)
+    rtl_count = min(len(RTL_LANGUAGES), round(languages * rtl_share))
+    targets = RTL_LANGUAGES[:rtl_count] + LTR_LANGUAGES[:languages - rtl_count]
+    if len(targets) < languages:
+        targets += [f"x-{i}" for i in range(languages - len(targets))]
+
+    strings = {}
+    for index in range(keys):
+        words = rng.choices(WORDS, k=rng.randint(1, 8))
+        if rng.random() < specifier_density:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(SPECIFIERS))
+        source = ' '.join(words).capitalize()
+        # Translations that drop the specifier are spelled without it
+        kept = [word for word in words if not word.startswith('%')]
+
+        localizations = {'en': {'stringUnit': {'state': 'translated', 'value': source}}}
+        for lang in targets:
+            dropped = len(kept) < len(words) and rng.random() < dropped_specifier_rate
+            if rng.random() < missing_rate:
+                value = ''
+            elif lang in RTL_LANGUAGES:
+                value = ' '.join(
+                    word if word.startswith('%') else ''.join(rng.choices(ARABIC, k=len(word)))
+                    for word in (kept if dropped else words)
+                )
+            else:
+                text = ' '.join(kept).capitalize() if dropped else source
+                value = text.translate(ACCENTED) + ' ' * rng.choice((0, 0, 0, 4, 12))
+            localizations[lang] = {'stringUnit': {'state': 'translated' if value else 'new', 'value': value}}
+        strings[f"key_{index:07d}"] = {'localizations': localizations}
+
+    return {'sourceLanguage': 'en', 'strings': strings, 'version': '1.0'}
+
+def create_analyzer(backend: str, jobs: int) -> TextAnalyzer:
+    """Create the analyzer under test; 'stub' runs the test-suite stand-in helper."""
+    if backend == 'stub':
+        return TextAnalyzer(backend='swift', jobs=jobs, helper_path=STUB_HELPER)
+    return TextAnalyzer(backend=backend, jobs=jobs)
+
+def extract_catalog(xcstrings_data: Dict) -> Tuple[TranslationCatalog, Mapping]:
+    """Extract a catalog as LocalizationTester does, with the dict-shaped view the analyzer reads."""
+    catalog = StringParser.extract_catalog(xcstrings_data)
+    return catalog, catalog.as_translations()
+
+def measure_startup(runs: int = STARTUP_RUNS) -> float:
+    """Return the seconds `import localization_tester` takes in a fresh interpreter."""
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import localization_tester'],
+            cwd=os.path.join(ROOT, 'src'), capture_output=True, text=True, check=True
+        )
+        # Lines look like "import time:  self [us] | cumulative | name"; the module itself is last
+        line = [line for line in result.stderr.splitlines() if line.rstrip().endswith('| localization_tester')][-1]
+        timings.append(int(line.split('|')[1]) / 1e6)
+    return min(timings)
+
+def measure(stage: Callable, track_memory: bool) -> Dict:
+    """Run one stage and return its result with wall time and peak memory."""
+    if track_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = stage()
+    seconds = time.perf_counter() - start
+    peak = None
+    if track_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {'result': result, 'seconds': seconds, 'peak_bytes': peak}
+
+def run_benchmark(args: argparse.Namespace) -> Dict:
+    """Generate the catalog and time every stage."""
+    catalog = generate_catalog(args.keys, args.languages, args.rtl_share,
+                               args.specifier_density, args.missing_rate, args.seed,
+                               args.dropped_specifier_rate)
+    cells = args.keys * (args.languages + 1)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'Benchmark.xcstrings')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(catalog, f, ensure_ascii=False, indent=2)
+        file_bytes = os.path.getsize(path)
+        del catalog
+
+        stages = {}
+        analyzer = create_analyzer(args.backend, args.jobs)
+        try:
+            # Timing and memory are measured in separate passes, since
+            # tracemalloc slows the code it traces considerably.
+            for track_memory in ([False, True] if args.memory else [False]):
+                parsed = measure(lambda: StringParser.parse_xcstrings_file(path), track_memory)
+                extracted = measure(lambda: extract_catalog(parsed['result']), track_memory)
+                extracted_catalog, translations = extracted['result']
+                source_language = extracted_catalog.source_language
+                analyzed = measure(lambda: analyzer.analyze_xcstrings(translations, source_language), track_memory)
+                stats = {
+                    'total_strings': len(extracted_catalog),
+                    'issues_found': sum(len(issues) for issues in analyzed['result'].values())
+                }
+                with open(os.devnull, 'w', encoding='utf-8') as devnull:
+                    reported = measure(
+                        lambda: ReportGenerator(analyzed['result'], stats).write_markdown(devnull),
+                        track_memory
+                    )
+                    # The parsed catalog is not read again, so it is fixed in place
+                    fixed = measure(lambda: apply_fixes(parsed['result']), track_memory)
+                    written = measure(lambda: devnull.writelines(iter_xcstrings(parsed['result'])), track_memory)
+
+                for name, measured in (('parse', parsed), ('extract', extracted), ('analyze', analyzed),
+                                       ('report', reported), ('fix', fixed), ('write', written)):
+                    stage = stages.setdefault(name, {})
+                    if track_memory:
+                        stage['peak_bytes'] = measured['peak_bytes']
+                    else:
+                        stage['seconds'] = measured['seconds']
+                        stage['cells_per_second'] = cells / measured['seconds'] if measured['seconds'] else None
+                del parsed, extracted, extracted_catalog, translations, analyzed, reported, fixed, written
+        finally:
+            analyzer.close()
+
+    startup = measure_startup()
+    stages['startup'] = {'seconds': startup, 'cells_per_second': None}
+
+    return {
+        'config': {
+            'keys': args.keys,
+            'languages': args.languages,
+            'rtl_share': args.rtl_share,
+            'specifier_density': args.specifier_density,
+            'missing_rate': args.missing_rate,
+            'dropped_specifier_rate': args.dropped_specifier_rate,
+            'seed': args.seed,
+            'backend': args.backend,
+            'jobs': args.jobs
+        },
+        'file_bytes': file_bytes,
+        'cells': cells,
+        'stages': stages
+    }
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Return a description of every stage slower than the baseline allows."""
+    if baseline.get('config') != results['config']:
+        print("Baseline was recorded with a different configuration; skipping comparison.")
+        return []
+    regressions = []
+    for name, stage in results['stages'].items():
+        reference = baseline['stages'].get(name, {}).get('seconds')
+        if reference and stage['seconds'] > reference * (1 + tolerance):
+            regressions.append(
+                f"{name}: {stage['seconds']:.3f}s vs baseline {reference:.3f}s "
+                f"(+{(stage['seconds'] / reference - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+def print_results(results: Dict, baseline: Optional[Dict]) -> None:
+    config = results['config']
+    print(f"Catalog: {config['keys']} keys x {config['languages'] + 1} languages, "
+          f"{results['file_bytes'] / 1e6:.1f} MB, backend={config['backend']}, jobs={config['jobs']}")
+    print(f"{'stage':<10}{'seconds':>10}{'cells/s':>14}{'peak MB':>10}{'baseline':>10}")
+    for name, stage in results['stages'].items():
+        peak = f"{stage['peak_bytes'] / 1e6:.1f}" if stage.get('peak_bytes') is not None else '-'
+        reference = (baseline or {}).get('stages', {}).get(name, {}).get('seconds')
+        throughput = f"{stage['cells_per_second']:,.0f}" if stage.get('cells_per_second') else '-'
+        print(f"{name:<10}{stage['seconds']:>10.3f}{throughput:>14}{peak:>10}"
+              f"{f'{reference:.3f}' if reference else '-':>10}")
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the Localization QA pipeline on a synthetic catalog.")
+    parser.add_argument("--keys", type=int, default=10000, help="Number of keys (default: 10000)")
+    parser.add_argument("--languages", type=int, default=10, help="Number of target languages (default: 10)")
+    parser.add_argument("--rtl-share", type=float, default=0.2, help="Fraction of RTL target languages (default: 0.2)")
+    parser.add_argument("--specifier-density", type=float, default=0.3,
+                        help="Fraction of strings with a format specifier (default: 0.3)")
+    parser.add_argument("--missing-rate", type=float, default=0.05,
+                        help="Fraction of translations left empty (default: 0.05)")
+    parser.add_argument("--dropped-specifier-rate", type=float, default=0.0,
+                        help="Fraction of translations of strings with a format specifier that drop it, "
+                             "for the fix stage to restore (default: 0.0)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--backend", choices=('python', 'stub', 'swift'), default='python',
+                        help="Analysis backend; 'stub' uses the test-suite helper over the bridge (default: python)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Analysis workers (default: 1)")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="Skip the peak-memory pass")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline file (default: benchmarks/baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown before a stage counts as a regression (default: 0.25)")
+    parser.add_argument("--output", help="Also write the results as JSON to this file")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    results = run_benchmark(args)
+
+    baseline = None
+    if os.path.isfile(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
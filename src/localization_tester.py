@@ -1,19 +1,56 @@
 import os
+import sys
+import time
+import argparse
 import datetime
-from typing import Dict, List
+from contextlib import nullcontext
+from typing import Dict, Iterator, List, Optional, Tuple
 from utils.string_parser import StringParser
-from utils.text_analyzer import TextAnalyzer
-from utils.report_generator import ReportGenerator
-import tkinter as tk
-from tkinter import filedialog
+from utils.catalog_fixes import PSEUDO_LANGUAGE, apply_fixes, pseudo_localize
+from utils.text_analyzer import TextAnalyzer, BACKENDS
+from utils.python_backend import PythonBackend
+from utils.report_generator import ReportGenerator, REPORT_FORMATS, REPORT_EXTENSIONS, TeeStream, open_report_file
+from utils.result_cache import ResultCache
+from utils.incremental_analyzer import IncrementalAnalyzer
+from utils.run_metrics import RunMetrics
+from utils.issue_store import Issue, IssueStore, make_issue
+from utils.coverage_index import CoverageIndex, popcount
+from utils.issue_baseline import IssueBaseline
+from utils.text_width import TruncationChecker
 
 class LocalizationTester:
-    def __init__(self, strings_file: str):
+    def __init__(self, strings_file: str, backend: str = 'auto', jobs: int = 1,
+                 cache_file: Optional[str] = None, streaming: bool = False,
+                 helper_path: Optional[str] = None, profile: bool = False,
+                 profile_output: Optional[str] = None, baseline_file: Optional[str] = None,
+                 widths_file: Optional[str] = None):
+        if baseline_file and streaming:
+            raise ValueError("A baseline needs the whole catalog and cannot be used with streaming")
         self.strings_file = strings_file
+        # Stream the catalog instead of loading it whole (no incremental reuse)
+        self.streaming = streaming
         self.report_folder = os.path.join(os.path.dirname(strings_file), "reports")
         self.string_parser = StringParser()
-        self.text_analyzer = TextAnalyzer()
-        self.issues = {}
+        self.cache = ResultCache(cache_file) if cache_file else None
+        # Stage timers and backend call latencies; `profile` adds cProfile and tracemalloc
+        self.metrics = RunMetrics(profile=profile)
+        self.profile_output = profile_output
+        self.profile_summary = None
+        # UI width limits per key, for flagging translations that would be truncated
+        truncation = TruncationChecker.from_file(widths_file) if widths_file else None
+        self.text_analyzer = TextAnalyzer(backend=backend, jobs=jobs, cache=self.cache,
+                                          helper_path=helper_path, metrics=self.metrics,
+                                          truncation=truncation)
+        self.incremental = IncrementalAnalyzer(self.text_analyzer)
+        self.catalog = None
+        # Which keys each language has translated, from the last analysis
+        self.coverage = None
+        self.issues = IssueStore()
+        # Accepted issues; when set, reports only list issues missing from it
+        self.baseline = IssueBaseline(baseline_file) if baseline_file else None
+        self.baseline_diff = None
+        # (mtime, size) of the strings file at the last analysis pass
+        self.signature = None
         self.stats = {
             "total_strings": 0,
             "languages": [],
@@ -23,48 +60,365 @@ class LocalizationTester:
 
     def analyze_project(self) -> None:
         """Run all localization tests on the project."""
+        self.metrics.start_profiling()
+        try:
+            if self.streaming:
+                self._run_streaming_analysis()
+            else:
+                self._run_analysis()
+        finally:
+            self.text_analyzer.close()
+            self.profile_summary = self.metrics.stop_profiling(self.profile_output)
+            self.stats["metrics"] = self.metrics.as_dict()
+
+    def _run_streaming_analysis(self) -> None:
+        """Analyze the strings file as a stream of records with bounded memory."""
         if not os.path.isfile(self.strings_file):
             print(f"No .xcstrings file found at {self.strings_file}!")
             return
 
+        def counted(records):
+            for record in records:
+                coverage.add(*record)
+                yield record
+
+        try:
+            # Parsing and analysis are interleaved, so they are timed as one stage
+            with self.metrics.stage("stream"):
+                reader = self.string_parser.stream_xcstrings_file(self.strings_file)
+                coverage = CoverageIndex(reader.source_language)
+                self.issues = IssueStore(
+                    self.text_analyzer.analyze_stream(counted(reader), reader.source_language)
+                )
+        except ValueError as e:
+            # json.JSONDecodeError is a ValueError
+            print(f"Error parsing {self.strings_file}: {str(e)}")
+            print("Failed to parse .xcstrings file!")
+            return
+
+        self.stats["total_strings"] = reader.key_count
+        self._update_coverage(coverage)
+        self._update_issue_stats()
+
+    def _run_analysis(self) -> Optional[Dict]:
+        """Parse the strings file and bring the issues up to date.
+
+        Only entries that changed since the previous pass are re-analyzed.
+        Returns the re-analyzed languages per key, or None if the file could
+        not be read.
+        """
+        if not os.path.isfile(self.strings_file):
+            print(f"No .xcstrings file found at {self.strings_file}!")
+            return None
+
         # Parse strings file
-        xcstrings_data = self.string_parser.parse_xcstrings_file(self.strings_file)
+        with self.metrics.stage("parse"):
+            xcstrings_data = self.string_parser.parse_xcstrings_file(self.strings_file)
         if not xcstrings_data:
             print("Failed to parse .xcstrings file!")
-            return
+            return None
 
-        # Extract translations
-        translations, source_language = self.string_parser.extract_translations(xcstrings_data)
+        # Extract translations into a compact catalog; the analyzers read it
+        # through its dict-shaped view
+        with self.metrics.stage("extract"):
+            catalog = self.string_parser.extract_catalog(xcstrings_data)
+        del xcstrings_data
+        translations, source_language = catalog.as_translations(), catalog.source_language
 
         # Update stats
-        self.stats["total_strings"] = len(translations)
-        self.stats["languages"] = list(set(
-            lang for trans in translations.values()
-            for lang in trans.keys()
-        ))
+        self.stats["total_strings"] = len(catalog)
+
+        # Analyze changed translations; the pair counts in stats are for this pass only
+        self.text_analyzer.reset_dedup_stats()
+        with self.metrics.stage("analyze"):
+            changed = self.incremental.update(translations, source_language)
+            self.issues = self.incremental.store()
+            self._update_coverage(catalog.coverage())
+        if self.cache is not None:
+            # Commit the pass, so a watching or serving process never holds
+            # the cache file's write lock while it waits for changes
+            self.cache.flush()
+        self.catalog = catalog
+        self._update_issue_stats()
+        if self.baseline is not None:
+            with self.metrics.stage("baseline"):
+                self._apply_baseline()
+        return changed
+
+    def _baseline_entries(self) -> Iterator[Tuple[Issue, str, str]]:
+        """Pair every current issue with the source and translated text it was found in."""
+        catalog = self.catalog
+        for issue in self.issues:
+            source = catalog.get(issue.key, catalog.source_language)
+            translation = catalog.get(issue.key, issue.language)
+            yield issue, source[0] if source else '', translation[0] if translation else ''
+
+    def _apply_baseline(self) -> None:
+        """Compare the current issues with the baseline and record the difference in stats."""
+        self.baseline_diff = self.baseline.compare(self._baseline_entries())
+        self.stats["new_issues"] = len(self.baseline_diff.new_issues)
+        self.stats["resolved_issues"] = len(self.baseline_diff.resolved)
+        self.stats["baseline_issues"] = self.baseline_diff.known
+
+    def update_baseline(self) -> int:
+        """Accept every current issue into the baseline; returns the number accepted."""
+        if self.baseline is None or self.catalog is None:
+            return 0
+        count = self.baseline.accept(self._baseline_entries())
+        self._apply_baseline()
+        return count
+
+    def has_regressions(self) -> bool:
+        """Return whether the last analysis found issues that are not in the baseline."""
+        return self.baseline_diff is not None and len(self.baseline_diff.new_issues) > 0
+
+    def _update_coverage(self, coverage: CoverageIndex) -> None:
+        """Record per-language coverage and states, and report languages keys have no string unit for.
+
+        The analyzer only sees the languages each key has, so missing
+        translations of absent languages are added here, after its issues.
+        """
+        self.coverage = coverage
+        self.issues.extend(make_issue(key, lang, 'missing_translations') for key, lang in coverage.absent_cells())
+        self.stats["languages"] = coverage.languages
+        self.stats["completion"] = coverage.completion_by_language()
+        self.stats["incomplete_keys"] = popcount(coverage.missing_anywhere())
+        for state in ('stale', 'needs_review'):
+            self.stats[state] = coverage.state_counts(state)
+
+    def _update_issue_stats(self) -> None:
+        """Refresh the issue counters in stats from the current issues."""
+        self.stats["issues_found"] = len(self.issues)
+        self.stats["missing_translations"] = self.issues.count(category="missing_translations")
+        self.stats["issues_by_severity"] = self.issues.counts_by("severity")
+        self.stats.update(self.text_analyzer.dedup_stats())
+        if self.cache is not None:
+            self.stats.update(self.cache.stats())
+        self.stats["metrics"] = self.metrics.as_dict()
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        """Return the modification time and size of the strings file, or None if it is missing."""
+        try:
+            file_stat = os.stat(self.strings_file)
+        except OSError:
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    def refresh(self) -> Optional[Dict]:
+        """Re-analyze the strings file incrementally if it was modified since the last pass.
+
+        Returns the re-analyzed languages per key, or None when the file is
+        unchanged or could not be read.
+        """
+        signature = self._file_signature()
+        if signature is None or signature == self.signature:
+            return None
+        self.signature = signature
+        return self._run_analysis()
+
+    def close(self) -> None:
+        """Stop the analysis backend and flush the cache after the last pass."""
+        self.text_analyzer.close()
+
+    def watch(self, interval: float = 1.0, max_passes: Optional[int] = None) -> None:
+        """Re-analyze the strings file incrementally whenever it is modified.
+
+        The file is polled every `interval` seconds; `max_passes` stops the
+        watcher after that many analysis passes (mainly for tests).
+        """
+        passes = 0
+        try:
+            while max_passes is None or passes < max_passes:
+                signature = self._file_signature()
+                if signature is not None and signature != self.signature:
+                    changed = self.refresh()
+                    passes += 1
+                    if changed is not None:
+                        entries = sum(len(languages) for languages in changed.values())
+                        new = f" ({self.stats['new_issues']} new)" if self.baseline is not None else ""
+                        print(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] "
+                              f"Re-analyzed {entries} entries in {len(changed)} keys: "
+                              f"{self.stats['issues_found']} issues{new}")
+                    continue
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def generate_report(self, report_format: str = 'markdown', output: Optional[str] = None,
+                        compress: bool = False, echo: bool = False) -> Optional[str]:
+        """Stream the test report to a file and return its path.
 
-        # Analyze translations
-        self.issues = self.text_analyzer.analyze_xcstrings(translations, source_language)
+        See write_report for the arguments. With a baseline only new and
+        resolved issues are listed. The report stage is timed too; its
+        timings land in stats after the report has been written.
+        """
+        if self.baseline_diff is not None:
+            generator = ReportGenerator(self.baseline_diff.new_issues, self.stats,
+                                        resolved=self.baseline_diff.resolved)
+        else:
+            generator = ReportGenerator(self.issues, self.stats)
+        report_file = write_report(generator, self.report_folder, report_format, output, compress, echo, self.metrics)
+        self.stats["metrics"] = self.metrics.as_dict()
+        return report_file
 
-        # Update issue stats
-        self.stats["issues_found"] = sum(len(issues) for issues in self.issues.values())
-        self.stats["missing_translations"] = len(self.issues["missing_translations"])
+def write_report(generator: ReportGenerator, report_folder: str, report_format: str = 'markdown',
+                 output: Optional[str] = None, compress: bool = False, echo: bool = False,
+                 metrics: Optional[RunMetrics] = None) -> Optional[str]:
+    """Stream a report to its destination without building it in memory.
 
-    def generate_report(self) -> str:
-        """Generate test report in Markdown format."""
-        generator = ReportGenerator(self.issues, self.stats)
-        report = generator.generate_markdown_report()
+    Without `output` the report goes to a timestamped file in report_folder;
+    `-` writes it to stdout only. `compress` gzips the file and `echo` also
+    prints the report while it is written. Returns the path of the report
+    file, or None when it went to stdout.
+    """
+    if output is None:
+        os.makedirs(report_folder, exist_ok=True)
+        extension = REPORT_EXTENSIONS[report_format] + ('.gz' if compress else '')
+        output = os.path.join(report_folder, f"localization_report_{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}{extension}")
+    echo = echo and output != '-'
 
-        # Save report to file
-        os.makedirs(self.report_folder, exist_ok=True)
-        report_file = os.path.join(self.report_folder, f"localization_report_{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.md")
-        with open(report_file, "w") as f:
-            f.write(report)
+    with metrics.stage("report") if metrics is not None else nullcontext():
+        with open_report_file(output, compress) as stream:
+            generator.write(TeeStream(stream, sys.stdout) if echo else stream, report_format)
+    if output == '-':
+        print()
+        return None
+    if echo:
+        print()
 
-        print(f"Report saved to {report_file}")
-        return report
+    print(f"Report saved to {output}")
+    return output
+
+# Directories that never contain source catalogs worth checking
+SKIPPED_DIRECTORIES = {'.git', '.build', '.swiftpm', 'build', 'DerivedData', 'Pods', 'Carthage', 'node_modules', 'reports'}
+
+def find_xcstrings_files(root: str) -> List[str]:
+    """Find every .xcstrings file under root, in a stable order."""
+    found = []
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories[:] = sorted(d for d in subdirectories if d not in SKIPPED_DIRECTORIES)
+        found.extend(os.path.join(directory, name) for name in sorted(files) if name.endswith('.xcstrings'))
+    return found
+
+def fix_catalog(strings_file: str) -> int:
+    """Apply the auto-fixes to a catalog and save it in place; returns the number of strings fixed."""
+    xcstrings_data = StringParser.parse_xcstrings_file(strings_file)
+    if not xcstrings_data:
+        return 0
+    fixes = apply_fixes(xcstrings_data)
+    if fixes:
+        StringParser.write_xcstrings_file(xcstrings_data, strings_file)
+    print(f"Fixed {len(fixes)} strings in {strings_file}")
+    return len(fixes)
+
+def write_pseudo_catalog(strings_file: str, output: str) -> bool:
+    """Save a copy of a catalog with a pseudo-localization of every key added to it."""
+    xcstrings_data = StringParser.parse_xcstrings_file(strings_file)
+    if not xcstrings_data:
+        return False
+    count = pseudo_localize(xcstrings_data)
+    StringParser.write_xcstrings_file(xcstrings_data, output)
+    print(f"Pseudo-localized {count} keys as {PSEUDO_LANGUAGE} into {output}")
+    return True
+
+def _analyze_catalog(strings_file: str, backend: str, cache_file: Optional[str],
+                     helper_path: Optional[str], widths_file: Optional[str] = None) -> Tuple[Dict, Dict]:
+    """Analyze one catalog of a project in a worker; returns its issues and stats."""
+    tester = LocalizationTester(strings_file, backend=backend, cache_file=cache_file,
+                                helper_path=helper_path, widths_file=widths_file)
+    tester.analyze_project()
+    if tester.cache is not None:
+        tester.cache.close()
+    return tester.issues, tester.stats
+
+class ProjectTester:
+    """Runs the localization tests on every .xcstrings catalog under a project root."""
+
+    def __init__(self, project_root: str, backend: str = 'auto', jobs: int = 1,
+                 cache_file: Optional[str] = None, helper_path: Optional[str] = None,
+                 widths_file: Optional[str] = None):
+        self.project_root = project_root
+        self.report_folder = os.path.join(project_root, "reports")
+        self.backend = backend
+        self.helper_path = helper_path
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.cache_file = cache_file
+        self.widths_file = widths_file
+        self.metrics = RunMetrics()
+        # Relative catalog path -> {"issues": ..., "stats": ...}
+        self.catalogs = {}
+        self.stats = {
+            "total_catalogs": 0,
+            "total_strings": 0,
+            "languages": [],
+            "missing_translations": 0,
+            "issues_found": 0
+        }
+
+    def _resolve_backend(self) -> str:
+        """Decide which backend 'auto' means here, without keeping it running."""
+        if self.backend != 'auto':
+            return self.backend
+        analyzer = TextAnalyzer(backend='auto', helper_path=self.helper_path)
+        analyzer.close()
+        return 'python' if isinstance(analyzer.swift_helper, PythonBackend) else 'swift'
+
+    def analyze_project(self) -> None:
+        """Discover and analyze all catalogs concurrently."""
+        strings_files = find_xcstrings_files(self.project_root)
+        if not strings_files:
+            print(f"No .xcstrings files found under {self.project_root}!")
+            return
+
+        # Imported here to keep multiprocessing out of single-file runs and startup
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        backend = self._resolve_backend()
+        # In-process analysis is CPU-bound; the Swift helper does its work in subprocesses
+        executor_class = ProcessPoolExecutor if backend == 'python' else ThreadPoolExecutor
+        # Per-catalog stage timings are in each catalog's stats
+        with self.metrics.stage("analyze"), \
+                executor_class(max_workers=min(self.jobs, len(strings_files))) as executor:
+            results = executor.map(
+                _analyze_catalog,
+                strings_files,
+                [backend] * len(strings_files),
+                [self.cache_file] * len(strings_files),
+                [self.helper_path] * len(strings_files),
+                [self.widths_file] * len(strings_files)
+            )
+            self.catalogs = {
+                os.path.relpath(path, self.project_root): {"issues": issues, "stats": stats}
+                for path, (issues, stats) in zip(strings_files, results)
+            }
+
+        languages = set()
+        for catalog in self.catalogs.values():
+            languages.update(catalog["stats"]["languages"])
+        self.stats["total_catalogs"] = len(self.catalogs)
+        self.stats["languages"] = sorted(languages)
+        for stat in ("total_strings", "missing_translations", "issues_found", "incomplete_keys", "analyzed_pairs",
+                     "unique_pairs"):
+            self.stats[stat] = sum(catalog["stats"].get(stat, 0) for catalog in self.catalogs.values())
+        analyzed = self.stats["analyzed_pairs"]
+        self.stats["dedup_ratio"] = round(1 - self.stats["unique_pairs"] / analyzed, 4) if analyzed else 0.0
+        self.stats["metrics"] = self.metrics.as_dict()
+
+    def generate_report(self, report_format: str = 'markdown', output: Optional[str] = None,
+                        compress: bool = False, echo: bool = False) -> Optional[str]:
+        """Stream one aggregated report with a section per catalog and return its path."""
+        generator = ReportGenerator({}, self.stats, catalogs=self.catalogs)
+        report_file = write_report(generator, self.report_folder, report_format, output, compress, echo, self.metrics)
+        self.stats["metrics"] = self.metrics.as_dict()
+        return report_file
 
 def select_xcstrings_file() -> str:
+    # tkinter needs a display; only load it when a file actually has to be picked
+    import tkinter as tk
+    from tkinter import filedialog
+
     root = tk.Tk()
     root.withdraw()
     file_path = filedialog.askopenfilename(
@@ -73,15 +427,140 @@ def select_xcstrings_file() -> str:
     )
     return file_path
 
-def main():
-    strings_file = select_xcstrings_file()
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Localization QA for .xcstrings files.")
+    parser.add_argument("strings_file", nargs="?",
+                        help="Path to an .xcstrings file, or a project directory to scan for every "
+                             ".xcstrings file (opens a file dialog when omitted)")
+    parser.add_argument("--backend", choices=BACKENDS, default="auto",
+                        help="Analysis backend (default: auto)")
+    parser.add_argument("--helper", metavar="PATH",
+                        help="Path to the LocalizationHelper binary "
+                             "(default: $LOCALIZATION_HELPER_PATH or the helper built in this checkout)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Number of parallel analysis workers, or of catalogs analyzed at once "
+                             "when scanning a project; 0 uses every CPU core (default: 1)")
+    parser.add_argument("--cache", metavar="FILE",
+                        help="Cache analysis results in FILE so unchanged strings are skipped on later runs")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and re-analyze changed entries whenever the file is saved")
+    parser.add_argument("--serve", action="store_true",
+                        help="Keep the catalogs loaded and answer issue queries over HTTP on localhost, "
+                             "re-analyzing changed files incrementally")
+    parser.add_argument("--port", type=int, default=8765,
+                        help="Port of the --serve endpoint on 127.0.0.1 (default: 8765)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stream the catalog with bounded memory instead of loading it whole")
+    parser.add_argument("--profile", action="store_true",
+                        help="Capture the analysis with cProfile and tracemalloc and print the hottest functions")
+    parser.add_argument("--profile-output", metavar="FILE",
+                        help="With --profile, also save the raw cProfile data to FILE")
+    parser.add_argument("--format", choices=REPORT_FORMATS, default="markdown",
+                        help="Report format (default: markdown)")
+    parser.add_argument("-o", "--output", metavar="FILE",
+                        help="Write the report to FILE, or to stdout with '-' "
+                             "(default: a timestamped file in the reports folder, also printed)")
+    parser.add_argument("--gzip", action="store_true",
+                        help="Compress the report file with gzip")
+    parser.add_argument("--baseline", metavar="FILE",
+                        help="Only report issues not accepted in the baseline FILE and exit with status 1 "
+                             "when there are any")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Accept every current issue into the --baseline file instead of reporting")
+    parser.add_argument("--fix", action="store_true",
+                        help="Before analyzing, normalize trailing whitespace and restore dropped format "
+                             "specifiers in translations, mark them needs_review and save the catalog")
+    parser.add_argument("--pseudo", metavar="FILE",
+                        help=f"Also write a copy of the catalog with accented, expanded {PSEUDO_LANGUAGE} "
+                             "translations of every key to FILE, for overflow testing")
+    parser.add_argument("--widths", metavar="FILE",
+                        help="Flag translations wider than the UI width set for their key in the JSON FILE")
+    args = parser.parse_args(argv)
+    if args.update_baseline and not args.baseline:
+        parser.error("--update-baseline requires --baseline")
+    if args.baseline and args.stream:
+        parser.error("--baseline cannot be combined with --stream")
+    if args.serve and (args.stream or args.watch or args.update_baseline):
+        parser.error("--serve cannot be combined with --stream, --watch or --update-baseline")
+    if args.pseudo and args.strings_file and os.path.isdir(args.strings_file):
+        parser.error("--pseudo applies to a single .xcstrings file, not a project directory")
+    if args.baseline and args.strings_file and os.path.isdir(args.strings_file):
+        parser.error("--baseline applies to a single .xcstrings file, not a project directory")
+    if args.watch and args.strings_file and os.path.isdir(args.strings_file):
+        parser.error("--watch applies to a single .xcstrings file, not a project directory; "
+                     "use --serve to keep every catalog of a project up to date")
+    return args
+
+def serve(args: argparse.Namespace, strings_files: List[str], root: str) -> None:
+    """Serve issue queries on the catalogs until interrupted."""
+    # Imported here so runs that do not serve never load http.server
+    from utils.query_server import QueryServer
+
+    catalogs = {
+        os.path.relpath(path, root): LocalizationTester(path, backend=args.backend, jobs=args.jobs,
+                                                       cache_file=args.cache, helper_path=args.helper,
+                                                       baseline_file=args.baseline, widths_file=args.widths)
+        for path in strings_files
+    }
+    server = QueryServer(catalogs, port=args.port)
+    print(f"Serving {len(catalogs)} catalogs on {server.url} (Ctrl+C to stop)...")
+    server.serve_forever()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.strings_file and os.path.isdir(args.strings_file):
+        if args.fix:
+            for path in find_xcstrings_files(args.strings_file):
+                fix_catalog(path)
+        if args.serve:
+            strings_files = find_xcstrings_files(args.strings_file)
+            if not strings_files:
+                print(f"No .xcstrings files found under {args.strings_file}!")
+                return 0
+            serve(args, strings_files, args.strings_file)
+            return 0
+        project = ProjectTester(args.strings_file, backend=args.backend, jobs=args.jobs,
+                                cache_file=args.cache, helper_path=args.helper, widths_file=args.widths)
+        project.analyze_project()
+        if project.catalogs:
+            project.generate_report(args.format, args.output, args.gzip, echo=args.output is None)
+        return 0
+
+    strings_file = args.strings_file or select_xcstrings_file()
+    if strings_file and args.fix:
+        fix_catalog(strings_file)
+    if strings_file and args.pseudo:
+        write_pseudo_catalog(strings_file, args.pseudo)
+    if strings_file and args.serve:
+        serve(args, [strings_file], os.path.dirname(strings_file))
+        return 0
     if strings_file:
-        tester = LocalizationTester(strings_file)
+        tester = LocalizationTester(strings_file, backend=args.backend, jobs=args.jobs,
+                                    cache_file=args.cache, streaming=args.stream,
+                                    helper_path=args.helper, profile=args.profile,
+                                    profile_output=args.profile_output, baseline_file=args.baseline,
+                                    widths_file=args.widths)
+        if args.watch:
+            print(f"Watching {strings_file} for changes (Ctrl+C to stop)...")
+            tester.watch()
+            return 0
         tester.analyze_project()
-        report = tester.generate_report()
-        print(report)
+        if args.update_baseline:
+            count = tester.update_baseline()
+            tester.baseline.close()
+            print(f"Accepted {count} issues into {args.baseline}")
+            return 0
+        tester.generate_report(args.format, args.output, args.gzip, echo=args.output is None)
+        if tester.profile_summary:
+            print(tester.profile_summary)
+        if tester.baseline is not None:
+            tester.baseline.close()
+        if tester.has_regressions():
+            print(f"{tester.stats['new_issues']} new issues are not in the baseline")
+            return 1
     else:
         print("No .xcstrings file selected.")
+    return 0
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
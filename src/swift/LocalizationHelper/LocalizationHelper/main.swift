@@ -10,6 +10,58 @@ guard args.count >= 2 else {
 
 let command = args[1]
 
+// MARK: - Persistent Mode
+// In "serve" mode the helper reads newline-delimited JSON requests such as
+// {"id": 1, "command": "validate", "args": ["Hello", "Bonjour"]} from stdin
+// and answers each one with a single JSON line carrying the same id.
+func handleRequest(_ command: String, _ arguments: [String]) -> [String: Any]? {
+    switch command {
+    case "analyze" where arguments.count >= 1:
+        return LocalizationHelper.analyzeText(arguments[0])
+    case "validate" where arguments.count >= 2:
+        return LocalizationHelper.validateTranslation(source: arguments[0], translated: arguments[1])
+    case "layout" where arguments.count >= 2:
+        let width = arguments.count >= 3 ? Double(arguments[2]) ?? 375.0 : 375.0
+        return LocalizationHelper.simulateLayoutForLanguage(arguments[0], text: arguments[1], width: CGFloat(width))
+    default:
+        return nil
+    }
+}
+
+func serveRequests() {
+    while let line = readLine() {
+        if line.isEmpty {
+            continue
+        }
+
+        var response: [String: Any] = ["id": NSNull()]
+        if let data = line.data(using: .utf8),
+           let request = (try? JSONSerialization.jsonObject(with: data, options: [])) as? [String: Any] {
+            response["id"] = request["id"] ?? NSNull()
+            let requestCommand = request["command"] as? String ?? ""
+            let arguments = request["args"] as? [String] ?? []
+            if let result = handleRequest(requestCommand, arguments) {
+                response["result"] = result
+            } else {
+                response["error"] = "Invalid request for command: \(requestCommand)"
+            }
+        } else {
+            response["error"] = "Malformed request"
+        }
+
+        // NaN/infinite ratios (e.g. empty source text) cannot be encoded as JSON
+        if !JSONSerialization.isValidJSONObject(response) {
+            response = ["id": response["id"] ?? NSNull(), "error": "Result could not be encoded as JSON"]
+        }
+
+        if let jsonData = try? JSONSerialization.data(withJSONObject: response, options: []),
+           let jsonString = String(data: jsonData, encoding: .utf8) {
+            print(jsonString)
+            fflush(stdout)
+        }
+    }
+}
+
 switch command {
 case "analyze":
     guard args.count >= 4 else {
@@ -53,6 +105,9 @@ case "layout":
         print(jsonString)
     }
 
+case "serve":
+    serveRequests()
+
 default:
     print("Unknown command: \(command)")
     exit(1)
@@ -6,9 +6,18 @@ Provides parsing, analysis, and report generation functionality.
 from .string_parser import StringParser
 from .text_analyzer import TextAnalyzer
 from .report_generator import ReportGenerator
+from .python_backend import PythonBackend
+from .result_cache import ResultCache
+from .translation_catalog import TranslationCatalog
+from .issue_store import Issue, IssueStore
 
 __all__ = [
     'StringParser',
     'TextAnalyzer',
-    'ReportGenerator'
+    'ReportGenerator',
+    'PythonBackend',
+    'ResultCache',
+    'TranslationCatalog',
+    'Issue',
+    'IssueStore'
 ]
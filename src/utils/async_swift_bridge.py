@@ -0,0 +1,81 @@
+import asyncio
+import json
+import os
+from typing import Dict, Any, List, Optional
+from .swift_bridge import find_helper
+
+# Helper processes run at once by default
+DEFAULT_CONCURRENCY = 4 * (os.cpu_count() or 1)
+# Seconds to wait for one helper call by default
+DEFAULT_CALL_TIMEOUT = 30.0
+
+class AsyncSwiftBridge:
+    """Asynchronous SwiftBridge running one helper process per call.
+
+    Up to `max_concurrency` helper processes run at the same time, so many
+    validations can be in flight at once. A call that takes longer than
+    `timeout` seconds, or whose task is cancelled, kills its helper process.
+    """
+
+    def __init__(self, helper_path: Optional[str] = None, max_concurrency: int = DEFAULT_CONCURRENCY,
+                 timeout: Optional[float] = DEFAULT_CALL_TIMEOUT):
+        self.helper_path = find_helper(helper_path)
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        # Created on first use, so it belongs to the running event loop
+        self._semaphore = None
+
+    async def _run(self, command: str, args: List[str]) -> Dict[str, Any]:
+        """Run one helper command in its own process and parse its output."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            process = await asyncio.create_subprocess_exec(
+                self.helper_path, command, *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            try:
+                stdout, _ = await asyncio.wait_for(process.communicate(), self.timeout)
+            finally:
+                # Timed out or cancelled; don't leave the helper running
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+        return json.loads(stdout.decode('utf-8'))
+
+    async def analyze_text(self, text: str, width: float = 375.0) -> Dict[str, Any]:
+        """Analyze text using Swift helper."""
+        try:
+            return await self._run("analyze", [text, str(width)])
+        except asyncio.TimeoutError:
+            print(f"Error analyzing text: timed out after {self.timeout}s")
+            return {}
+        except Exception as e:
+            print(f"Error analyzing text: {e}")
+            return {}
+
+    async def validate_translation(self, source: str, translation: str) -> Dict[str, Any]:
+        """Validate translation using Swift helper."""
+        try:
+            return await self._run("validate", [source, translation])
+        except asyncio.TimeoutError:
+            print(f"Error validating translation: timed out after {self.timeout}s")
+            return {}
+        except Exception as e:
+            print(f"Error validating translation: {e}")
+            return {}
+
+    async def check_layout(self, language: str, text: str) -> Dict[str, Any]:
+        """Check layout considerations using Swift helper."""
+        try:
+            return await self._run("layout", [language, text])
+        except asyncio.TimeoutError:
+            print(f"Error checking layout: timed out after {self.timeout}s")
+            return {}
+        except Exception as e:
+            print(f"Error checking layout: {e}")
+            return {}
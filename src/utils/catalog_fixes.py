@@ -0,0 +1,234 @@
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from .format_specifiers import SPECIFIER_TEXT_PATTERN, SourceFormat, check_translation_specifiers, parse_source
+from .string_parser import matching_source_path, string_unit_nodes, variation_key
+from .xcstrings_writer import insert_member
+
+# State given to translations changed by an auto-fix, so a translator confirms them
+FIXED_STATE = 'needs_review'
+# Language of pseudo-localized catalogs: accented English
+PSEUDO_LANGUAGE = 'en-XA'
+# How much longer pseudo-localized text is than its source, by source length; from IBM's
+# guidelines on how much translations of short and long English strings grow
+PSEUDO_EXPANSION = ((10, 1.0), (20, 0.8), (30, 0.6), (50, 0.4), (70, 0.31))
+PSEUDO_MIN_EXPANSION = 0.3
+PSEUDO_PADDING = '~'
+_ACCENTED = str.maketrans(
+    'AaBbCcDdEeFfGgHhIiJjKkLlMmNnOoPpQqRrSsTtUuVvWwXxYyZz',
+    'ÅåƁƀÇçÐðÉéƑƒĜĝĤĥÎîĴĵĶķĻļṀṁÑñÖöÞþǪǫŔŕŠšŢţÛûṼṽŴŵẊẋÝýŽž'
+)
+# Leading position of a specifier such as %2$@
+_POSITION = re.compile(r'%[1-9][0-9]*\$')
+
+class CatalogFix(NamedTuple):
+    """Auto-fixes applied to one string unit."""
+    # Entry key as in reports, e.g. 'files[plural.one]'
+    key: str
+    language: str
+    # 'format_specifiers' and/or 'trailing_whitespace'
+    fixes: Tuple[str, ...]
+
+def trailing_whitespace(text: str) -> str:
+    return text[len(text.rstrip()):]
+
+def has_literal_percent(text: str) -> bool:
+    """Check whether text has a % that is neither a specifier nor an escaped %%."""
+    return '%' in SPECIFIER_TEXT_PATTERN.sub('', text)
+
+class SourceFixes(NamedTuple):
+    """What the auto-fixes need to know about a source text; worked out once per source."""
+    format: SourceFormat
+    # Specifiers by position as written without their positions, e.g. '%@' for '%2$@';
+    # None when dropped specifiers of the source are not restored
+    restorable: Optional[Dict[int, str]]
+    # What a translation without any specifier gets appended; None when it cannot be restored
+    all_dropped: Optional[str]
+    trailing: str
+
+def source_fixes(source: str) -> SourceFixes:
+    """Parse a source once for fixing all of its translations."""
+    source_format = parse_source(source)
+    restorable = all_dropped = None
+    # A source mixing specifiers with bare percent signs is too ambiguous to
+    # repair unattended, and `*` widths and precisions take arguments of
+    # their own; both are left to a translator
+    if (source_format.specifiers and not has_literal_percent(source)
+            and all(spec.text.startswith('%') for spec in source_format.specifiers)):
+        restorable = {spec.position: _POSITION.sub('%', spec.text, 1) for spec in source_format.specifiers}
+        # Arguments can only follow in order if none is skipped
+        if list(restorable) == list(range(1, len(restorable) + 1)):
+            all_dropped = ' '.join(restorable.values())
+    return SourceFixes(source_format, restorable, all_dropped, trailing_whitespace(source))
+
+def restore_specifiers(source: SourceFixes, translation: str) -> Optional[str]:
+    """Append the format specifiers a translation dropped from its source.
+
+    Returns None when no argument is missing, when the source's specifiers
+    are not restorable, or when the translation has mismatches a translator
+    has to resolve: an extra, retyped or reordered argument, or a dropped
+    argument that could only be restored by switching the translation to
+    positional specifiers.
+    """
+    if source.restorable is None:
+        return None
+    if '%' not in translation:
+        if source.all_dropped is None:
+            return None
+        return translation.rstrip() + ' ' + source.all_dropped + trailing_whitespace(translation)
+    mismatches, found = check_translation_specifiers(source.format, translation)
+    if not mismatches or any(mismatch.kind != 'missing' for mismatch in mismatches):
+        return None
+
+    missing = [mismatch.position for mismatch in mismatches]
+    texts = source.restorable
+    if any('$' in spec.text for spec in found):
+        restored = [f"%{position}${texts[position][1:]}" for position in missing]
+    elif missing == list(range(len(found) + 1, len(found) + len(missing) + 1)):
+        # Only the last arguments are missing, so they can follow in order
+        restored = [texts[position] for position in missing]
+    else:
+        return None
+    return translation.rstrip() + ' ' + ' '.join(restored) + trailing_whitespace(translation)
+
+def fix_translation(source: str, translation: str,
+                    formats: Optional[Dict[str, SourceFixes]] = None) -> Tuple[str, Tuple[str, ...]]:
+    """Apply every auto-fix to one translation; returns the text and the fixes applied.
+
+    `formats` caches parsed sources across calls.
+    """
+    if not translation.strip():
+        return translation, ()
+    fixes = formats.get(source) if formats is not None else None
+    if fixes is None:
+        fixes = source_fixes(source)
+        if formats is not None:
+            formats[source] = fixes
+
+    fixed = translation
+    applied = []
+    restored = restore_specifiers(fixes, fixed)
+    if restored is not None:
+        fixed = restored
+        applied.append('format_specifiers')
+    # Most translations end like their source, without whitespace
+    if translation[-1:].isspace() or fixes.trailing:
+        trailing = trailing_whitespace(translation)
+        if trailing != fixes.trailing:
+            fixed = fixed.rstrip() + fixes.trailing
+            applied.append('trailing_whitespace')
+    return fixed, tuple(applied)
+
+def _source_units(key: str, localizations: Dict, source_language: str) -> Dict[str, str]:
+    """Return the source text of each variation path of a key."""
+    source_node = localizations.get(source_language)
+    units = {path: unit.get('value', '') for path, unit in string_unit_nodes(source_node)} if source_node else {}
+    # Without a source unit, Xcode uses the key as the source text
+    return units or {'': key}
+
+def apply_fixes(xcstrings_data: Dict) -> List[CatalogFix]:
+    """Apply the auto-fixes to every translation of a catalog, in place.
+
+    Trailing whitespace is made the same as the source's, and format
+    specifiers dropped from the end of a translation are appended to it,
+    unless the source also has percent signs that are not specifiers.
+    Every changed string unit is marked FIXED_STATE.
+    """
+    source_language = xcstrings_data.get('sourceLanguage', 'en')
+    formats = {}
+    fixes = []
+    for key, string_data in xcstrings_data.get('strings', {}).items():
+        if string_data.get('shouldTranslate') is False:
+            continue
+        localizations = string_data.get('localizations', {})
+        source_units = None
+        for lang, lang_data in localizations.items():
+            if lang == source_language:
+                continue
+            if 'variations' in lang_data or 'substitutions' in lang_data:
+                units = string_unit_nodes(lang_data)
+            else:
+                # Plain strings, most of a catalog, have a single unit
+                units = (('', lang_data['stringUnit']),) if 'stringUnit' in lang_data else ()
+            for path, unit in units:
+                value = unit.get('value', '')
+                if not value:
+                    continue
+                if source_units is None:
+                    source_units = _source_units(key, localizations, source_language)
+                source = source_units.get(path)
+                if source is None:
+                    source = source_units[matching_source_path(source_units, path)]
+                fixed, applied = fix_translation(source, value, formats)
+                if applied:
+                    unit['value'] = fixed
+                    insert_member(unit, 'state', FIXED_STATE)
+                    fixes.append(CatalogFix(variation_key(key, path), lang, applied))
+    return fixes
+
+def pseudo_expansion(length: int) -> float:
+    """Return by how much of its length a source is expanded when pseudo-localized."""
+    for limit, expansion in PSEUDO_EXPANSION:
+        if length <= limit:
+            return expansion
+    return PSEUDO_MIN_EXPANSION
+
+def pseudo_text(text: str) -> str:
+    """Pseudo-localize a string: accent its letters, pad it and bracket it.
+
+    "Delete %@?" becomes "[Ðéļéţé %@? ~~~~~~~~~~]". Format specifiers and the
+    surrounding whitespace are kept, so the result is a valid translation.
+    """
+    core = text.strip()
+    if not core:
+        return text
+    if '%' in core:
+        pieces = []
+        last = 0
+        for match in SPECIFIER_TEXT_PATTERN.finditer(core):
+            pieces.append(core[last:match.start()].translate(_ACCENTED))
+            pieces.append(match.group(0))
+            last = match.end()
+        pieces.append(core[last:].translate(_ACCENTED))
+        accented = ''.join(pieces)
+    else:
+        accented = core.translate(_ACCENTED)
+    padding = PSEUDO_PADDING * max(1, round(len(core) * pseudo_expansion(len(core))))
+    leading = text[:len(text) - len(text.lstrip())]
+    return f"{leading}[{accented} {padding}]{trailing_whitespace(text)}"
+
+def _pseudo_node(node: Dict) -> Dict:
+    """Copy a source localization with its string units pseudo-localized."""
+    pseudo = {}
+    for name, value in node.items():
+        if name == 'stringUnit':
+            pseudo[name] = {'state': 'translated', 'value': pseudo_text(value.get('value', ''))}
+        elif isinstance(value, dict):
+            pseudo[name] = _pseudo_node(value)
+        else:
+            pseudo[name] = value
+    return pseudo
+
+def pseudo_localize(xcstrings_data: Dict, language: str = PSEUDO_LANGUAGE) -> int:
+    """Add a pseudo-localization of every translatable key to a catalog, in place.
+
+    Variations and substitutions of the source are kept, so every plural
+    and device form is expanded too. Returns the number of keys localized.
+    """
+    source_language = xcstrings_data.get('sourceLanguage', 'en')
+    count = 0
+    for key, string_data in xcstrings_data.get('strings', {}).items():
+        if string_data.get('shouldTranslate') is False:
+            continue
+        localizations = string_data.get('localizations')
+        source_node = localizations.get(source_language) if localizations else None
+        if source_node is None:
+            # Without a source unit, Xcode uses the key as the source text
+            pseudo = {'stringUnit': {'state': 'translated', 'value': pseudo_text(key)}}
+        else:
+            pseudo = _pseudo_node(source_node)
+        if localizations is None:
+            insert_member(string_data, 'localizations', {language: pseudo})
+        else:
+            insert_member(localizations, language, pseudo)
+        count += 1
+    return count
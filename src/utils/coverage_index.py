@@ -0,0 +1,275 @@
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from .plural_rules import plural_categories
+
+# Maps the 0/1 bytes of a column to the digits of a binary number
+_BIT_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+# State byte of cells without a string unit; TranslationCatalog's ABSENT (-1) as a byte
+ABSENT_STATE = 0xFF
+# Maps state bytes to 1 for cells with a string unit and 0 for absent ones
+_UNIT_BYTES = bytes([1] * ABSENT_STATE + [0])
+
+def _to_bitset(column: bytes) -> int:
+    """Pack a column of 0/1 bytes into an int whose bit i is byte i."""
+    if not column:
+        return 0
+    return int(column.translate(_BIT_DIGITS)[::-1], 2)
+
+def popcount(bits: int) -> int:
+    """Count the set bits of a bitset."""
+    return bin(bits).count('1')
+
+def iter_rows(bits: int) -> Iterator[int]:
+    """Yield the indices of the set bits of a bitset, in ascending order."""
+    digits = bin(bits)[:1:-1]
+    row = digits.find('1')
+    while row != -1:
+        yield row
+        row = digits.find('1', row + 1)
+
+class CoverageIndex:
+    """Which keys every language has a string unit and a translation for, and in which state.
+
+    Cells are recorded in byte columns per language while a catalog is
+    read: the code of the string unit state, and whether the value is
+    non-empty. They are packed into bitsets over key indices when first
+    queried, so questions about missing keys, completion and states are a
+    few bitwise or byte operations over whole languages, whatever the
+    catalog size. Languages a key has no string unit for count as missing,
+    not only string units with an empty value, except for variation entries
+    a language does not need (see _not_needed).
+    """
+
+    __slots__ = ('source_language', 'keys', 'state_names', '_key_index', '_state_codes', '_states',
+                 '_translated', '_bitsets', '_groups')
+
+    def __init__(self, source_language: str = 'en', state_names: Sequence[str] = ('',)):
+        self.source_language = source_language
+        self.keys = []
+        # State code -> name; codes are the bytes stored in the state columns
+        self.state_names = list(state_names)
+        self._key_index = {}
+        self._state_codes = {name: code for code, name in enumerate(self.state_names)}
+        # Language -> one byte per key: the state code, ABSENT_STATE without a string unit
+        self._states = {}
+        # Language -> one byte per key: 1 where the value is not empty
+        self._translated = {}
+        # Language -> (units, translated, needed) bitsets and not-needed rows; dropped whenever a cell is added
+        self._bitsets = None
+        # Rows of the entries of keys with variations, by key; dropped whenever a key is added
+        self._groups = None
+
+    @classmethod
+    def from_columns(cls, keys: List[str], values: Dict[str, Sequence[Optional[str]]], states: Dict[str, bytes],
+                     state_names: Sequence[str], source_language: str = 'en') -> 'CoverageIndex':
+        """Build the index from columns indexed by key.
+
+        `values` holds None where a key has no string unit; `states` holds
+        the state code of each cell as a byte, ABSENT_STATE where there is none.
+        """
+        index = cls(source_language, state_names)
+        index.keys = list(keys)
+        index._key_index = dict(zip(index.keys, range(len(index.keys))))
+        for lang, column in values.items():
+            index._states[lang] = bytearray(states[lang])
+            index._translated[lang] = bytearray(map(bool, column))
+        return index
+
+    @classmethod
+    def from_translations(cls, translations: Dict, source_language: str = 'en') -> 'CoverageIndex':
+        """Build the index from the nested dict returned by extract_translations."""
+        index = cls(source_language)
+        for key, translations_data in translations.items():
+            index.add_key(key)
+            for lang, trans_data in translations_data.items():
+                index.add(key, lang, trans_data.get('value', ''), trans_data.get('state', ''))
+        return index
+
+    def add_key(self, key: str) -> int:
+        """Register a key, even one without string units, and return its index."""
+        row = self._key_index.get(key)
+        if row is None:
+            row = self._key_index[key] = len(self.keys)
+            self.keys.append(key)
+            self._groups = None
+        return row
+
+    def add(self, key: str, lang: str, value: str, state: str = '') -> None:
+        """Record the string unit of one cell."""
+        row = self._key_index.get(key)
+        if row is None:
+            row = self.add_key(key)
+        code = self._state_codes.get(state)
+        if code is None:
+            code = self._state_codes[state] = len(self.state_names)
+            self.state_names.append(state)
+        states = self._states.get(lang)
+        if states is None:
+            states = self._states[lang] = bytearray()
+            self._translated[lang] = bytearray()
+        translated = self._translated[lang]
+        if row >= len(states):
+            # Columns grow lazily, so languages only used by a few keys stay small
+            states.extend(bytes([ABSENT_STATE]) * (row + 1 - len(states)))
+            translated.extend(bytes(row + 1 - len(translated)))
+        states[row] = code
+        translated[row] = 1 if value else 0
+        self._bitsets = None
+
+    @property
+    def languages(self) -> List[str]:
+        """Every language of the catalog, in first-seen order."""
+        return list(self._states)
+
+    @property
+    def target_languages(self) -> List[str]:
+        """Every language but the source language."""
+        return [lang for lang in self._states if lang != self.source_language]
+
+    def _variation_groups(self) -> List[List[Tuple[int, List[str]]]]:
+        """Return the rows of every key with variations with their variation steps, grouped by key.
+
+        A plain entry of the same key, which some languages translate
+        without variations, is in the group with an empty step list.
+        """
+        if self._groups is None:
+            # Imported here: string_parser imports the catalog, which imports this module
+            from .string_parser import split_variation_key
+
+            groups = {}
+            for row, entry_key in enumerate(self.keys):
+                if entry_key.endswith(']'):
+                    key, path = split_variation_key(entry_key)
+                    if path:
+                        groups.setdefault(key, []).append((row, path.split('/')))
+            for key, rows in groups.items():
+                row = self._key_index.get(key)
+                if row is not None:
+                    rows.append((row, []))
+            self._groups = list(groups.values())
+        return self._groups
+
+    def _not_needed(self, lang: str) -> Set[int]:
+        """Return the rows of variation entries a language has no string unit for and does not need.
+
+        Those are plural forms outside the language's CLDR categories,
+        device or substitution variations of keys the language translates
+        in another form, and the plain entry of keys with variations.
+        """
+        categories = plural_categories(lang)
+        states = self._states.get(lang, b'')
+        rows = set()
+        for group in self._variation_groups():
+            absent = [(row, steps) for row, steps in group if row >= len(states) or states[row] == ABSENT_STATE]
+            localized = len(absent) < len(group)
+            for row, steps in absent:
+                if not steps:
+                    # The plain entry of a key with variations; the variation entries are checked instead
+                    rows.add(row)
+                for step in steps:
+                    if (step[:7] == 'plural.' and step[7:] not in categories
+                            or localized and step.startswith(('device.', 'substitutions.'))):
+                        rows.add(row)
+                        break
+        return rows
+
+    def _bitset(self, lang: str) -> Tuple[int, int, int, Set[int]]:
+        """Return the (units, translated, needed) bitsets of a language and its not-needed rows."""
+        if self._bitsets is None:
+            self._bitsets = {}
+        bitsets = self._bitsets.get(lang)
+        if bitsets is None:
+            not_needed = self._not_needed(lang)
+            needed = self.all_keys
+            if not_needed:
+                mask = bytearray(len(self.keys))
+                for row in not_needed:
+                    mask[row] = 1
+                needed &= ~_to_bitset(mask)
+            if lang in self._states:
+                bitsets = (_to_bitset(self._states[lang].translate(_UNIT_BYTES)), _to_bitset(self._translated[lang]),
+                           needed, not_needed)
+            else:
+                bitsets = (0, 0, needed, not_needed)
+            self._bitsets[lang] = bitsets
+        return bitsets
+
+    @property
+    def all_keys(self) -> int:
+        """Bitset with the bit of every key set."""
+        return (1 << len(self.keys)) - 1
+
+    def missing(self, lang: str) -> int:
+        """Bitset of the keys a language needs but has no translation for."""
+        _, translated, needed, _ = self._bitset(lang)
+        return needed & ~translated
+
+    def absent(self, lang: str) -> int:
+        """Bitset of the keys a language needs but has no string unit for."""
+        units, _, needed, _ = self._bitset(lang)
+        return needed & ~units
+
+    def missing_anywhere(self) -> int:
+        """Bitset of the keys missing a needed translation in at least one target language."""
+        missing = 0
+        for lang in self.target_languages:
+            missing |= self.missing(lang)
+        return missing
+
+    def in_state(self, lang: str, state: str) -> int:
+        """Bitset of the keys whose string unit in a language has a state."""
+        code = self._state_codes.get(state)
+        column = self._states.get(lang)
+        if code is None or column is None:
+            return 0
+        selected = bytearray(256)
+        selected[code] = 1
+        return _to_bitset(column.translate(selected))
+
+    def key_names(self, bits: int) -> List[str]:
+        """Return the keys whose bits are set, in catalog order."""
+        keys = self.keys
+        return [keys[row] for row in iter_rows(bits)]
+
+    def missing_keys(self, lang: str) -> List[str]:
+        """Return the keys without a translation in a language."""
+        return self.key_names(self.missing(lang))
+
+    def state_keys(self, lang: str, state: str) -> List[str]:
+        """Return the keys in a state in a language, e.g. every 'stale' key."""
+        return self.key_names(self.in_state(lang, state))
+
+    def completion(self, lang: str) -> float:
+        """Return the percentage of the keys a language needs that it has translated."""
+        _, translated, needed, _ = self._bitset(lang)
+        needed_count = popcount(needed)
+        if not needed_count:
+            return 100.0
+        return round(100 * popcount(translated & needed) / needed_count, 2)
+
+    def completion_by_language(self) -> Dict[str, float]:
+        """Return the completion percentage of every target language."""
+        return {lang: self.completion(lang) for lang in self.target_languages}
+
+    def missing_counts(self) -> Dict[str, int]:
+        """Return how many keys every target language is missing."""
+        return {lang: popcount(self.missing(lang)) for lang in self.target_languages}
+
+    def state_counts(self, state: str) -> Dict[str, int]:
+        """Return how many keys of every target language are in a state."""
+        code = self._state_codes.get(state)
+        if code is None:
+            return {lang: 0 for lang in self.target_languages}
+        return {lang: self._states[lang].count(code) for lang in self.target_languages}
+
+    def absent_cells(self) -> Iterator[Tuple[str, str]]:
+        """Yield (key, language) for every target language a key has no string unit for, key-major."""
+        languages = self.target_languages
+        absent_anywhere = 0
+        for lang in languages:
+            absent_anywhere |= self.absent(lang)
+        columns = [(lang, self._states[lang], self._bitset(lang)[3]) for lang in languages]
+        keys = self.keys
+        for row in iter_rows(absent_anywhere):
+            for lang, states, not_needed in columns:
+                if (row >= len(states) or states[row] == ABSENT_STATE) and row not in not_needed:
+                    yield keys[row], lang
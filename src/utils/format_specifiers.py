@@ -0,0 +1,178 @@
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# One printf/NSString format specifier: optional argument position, flags,
+# width, precision, length modifier and conversion. `%%` is matched too so
+# that it is skipped as a literal percent sign. The printf space flag is left
+# out: a `%` followed by whitespace is a percent sign in text such as
+# "100% done" or "20 % de réduction", not a specifier.
+SPECIFIER_REGEX = (
+    r"%(?:(?P<position>[1-9][0-9]*)\$)?"
+    r"(?P<flags>[-+0#']*)"
+    r"(?P<width>\*(?:[1-9][0-9]*\$)?|[0-9]+)?"
+    r"(?:\.(?P<precision>\*(?:[1-9][0-9]*\$)?|[0-9]*))?"
+    r"(?P<length>hh|h|ll|l|q|L|z|t|j)?"
+    r"(?P<conversion>[@dDiuUxXoOfFeEgGaAcCsSp%])"
+)
+SPECIFIER_PATTERN = re.compile(SPECIFIER_REGEX)
+# The same pattern without groups, so findall returns the specifiers as written
+SPECIFIER_TEXT_PATTERN = re.compile(re.sub(r'\(\?P<\w+>', '(?:', SPECIFIER_REGEX))
+# Argument type read by each conversion; integer sizes come from the length modifier
+CONVERSION_TYPES = {
+    '@': 'object',
+    'd': 'int', 'i': 'int', 'u': 'int', 'x': 'int', 'X': 'int', 'o': 'int', 'c': 'int',
+    'D': 'long', 'U': 'long', 'O': 'long',
+    'f': 'double', 'F': 'double', 'e': 'double', 'E': 'double',
+    'g': 'double', 'G': 'double', 'a': 'double', 'A': 'double',
+    's': 'cstring', 'S': 'unistring', 'C': 'unichar', 'p': 'pointer'
+}
+LONG_LENGTHS = ('l', 'll', 'q', 'z', 't', 'j')
+
+class FormatSpecifier(NamedTuple):
+    """One argument consumed by a format string."""
+    # 1-based argument index, explicit (%2$@) or implied by order of appearance
+    position: int
+    # Argument type the conversion reads, e.g. 'object' or 'long'
+    type: str
+    # Text of the specifier as written, e.g. '%1$lld'
+    text: str
+
+class SpecifierMismatch(NamedTuple):
+    """One difference between the arguments of a source and its translation."""
+    # 'missing', 'extra', 'type_changed' or 'reordered'
+    kind: str
+    position: int
+    # Specifier in the source and in the translation; None when absent
+    expected: Optional[str]
+    found: Optional[str]
+
+    def describe(self) -> str:
+        if self.kind == 'missing':
+            return f"missing {self.expected} (argument {self.position})"
+        if self.kind == 'extra':
+            return f"extra {self.found} (argument {self.position})"
+        if self.kind == 'reordered':
+            return f"argument {self.position} reordered: {self.expected} became {self.found}"
+        return f"argument {self.position} changed type: {self.expected} became {self.found}"
+
+class SourceFormat(NamedTuple):
+    """Parsed specifiers of a source string, as cached per source."""
+    # Specifiers as written, in order of appearance
+    texts: List[str]
+    specifiers: Tuple[FormatSpecifier, ...]
+
+def _argument_type(match) -> str:
+    arg_type = CONVERSION_TYPES[match.group('conversion')]
+    if arg_type == 'int' and match.group('length') in LONG_LENGTHS:
+        return 'long'
+    return arg_type
+
+def parse_specifiers(text: str) -> Tuple[FormatSpecifier, ...]:
+    """Return the arguments a format string consumes, ordered by position.
+
+    Specifiers without an explicit position take the next implied one; a
+    `*` width or precision consumes an int argument of its own.
+    """
+    if '%' not in text:
+        return ()
+    arguments = {}
+    implied = 0
+    for match in SPECIFIER_PATTERN.finditer(text):
+        if match.group('conversion') == '%':
+            continue
+        for star in (match.group('width'), match.group('precision')):
+            if star and star[0] == '*':
+                if len(star) > 1:
+                    arguments.setdefault(int(star[1:-1]), FormatSpecifier(int(star[1:-1]), 'int', star))
+                else:
+                    implied += 1
+                    arguments.setdefault(implied, FormatSpecifier(implied, 'int', star))
+        position = match.group('position')
+        if position is None:
+            implied += 1
+            position = implied
+        else:
+            position = int(position)
+        # The first use of a repeated positional argument decides its type
+        arguments.setdefault(position, FormatSpecifier(position, _argument_type(match), match.group(0)))
+    return tuple(arguments[position] for position in sorted(arguments))
+
+def compare_specifiers(expected: Tuple[FormatSpecifier, ...],
+                       found: Tuple[FormatSpecifier, ...]) -> List[SpecifierMismatch]:
+    """List how the arguments of a translation differ from those of its source.
+
+    Arguments whose types were swapped with each other are reported as
+    reordered; fixing those needs positional specifiers such as %2$@.
+    """
+    if expected == found or [spec[:2] for spec in expected] == [spec[:2] for spec in found]:
+        return []
+    if not found:
+        # Every argument was dropped, as in most translations that need fixing
+        return [SpecifierMismatch('missing', spec.position, spec.text, None) for spec in expected]
+    source = {spec.position: spec for spec in expected}
+    translation = {spec.position: spec for spec in found}
+
+    mismatches = []
+    changed = []
+    for position in sorted(source.keys() | translation.keys()):
+        wanted, got = source.get(position), translation.get(position)
+        if got is None:
+            mismatches.append(SpecifierMismatch('missing', position, wanted.text, None))
+        elif wanted is None:
+            mismatches.append(SpecifierMismatch('extra', position, None, got.text))
+        elif wanted.type != got.type:
+            changed.append((wanted, got))
+
+    # Changed types that are a permutation of each other are swapped arguments
+    reordered = sorted(wanted.type for wanted, _ in changed) == sorted(got.type for _, got in changed)
+    kind = 'reordered' if reordered and len(changed) > 1 else 'type_changed'
+    mismatches.extend(SpecifierMismatch(kind, wanted.position, wanted.text, got.text) for wanted, got in changed)
+    mismatches.sort(key=lambda mismatch: mismatch.position)
+    return mismatches
+
+def parse_source(text: str) -> SourceFormat:
+    """Parse a source string once for checking all of its translations."""
+    if '%' not in text:
+        return SourceFormat([], ())
+    return SourceFormat(SPECIFIER_TEXT_PATTERN.findall(text), parse_specifiers(text))
+
+def check_translation(source: SourceFormat, translation: str) -> List[SpecifierMismatch]:
+    """Return the specifier mismatches of a translation of a parsed source.
+
+    Translations that spell their specifiers exactly like the source, the
+    common case, are accepted without being parsed.
+    """
+    texts = SPECIFIER_TEXT_PATTERN.findall(translation) if '%' in translation else []
+    if texts == source.texts:
+        return []
+    return compare_specifiers(source.specifiers, parse_specifiers(translation))
+
+def check_translation_specifiers(source: SourceFormat,
+                                 translation: str) -> Tuple[List[SpecifierMismatch], Tuple[FormatSpecifier, ...]]:
+    """Like check_translation, also returning the parsed specifiers of the translation."""
+    texts = SPECIFIER_TEXT_PATTERN.findall(translation) if '%' in translation else []
+    if texts == source.texts:
+        # Spelled like the source, so they parse like it too
+        return [], source.specifiers
+    found = parse_specifiers(translation)
+    return compare_specifiers(source.specifiers, found), found
+
+class SpecifierChecker:
+    """Compares the format specifiers of translations with their sources.
+
+    Each source is shared by every language of its key, so its parsed
+    specifiers are cached and only the translations are parsed per pair.
+    """
+
+    def __init__(self):
+        self._sources: Dict[str, SourceFormat] = {}
+
+    def source_format(self, source: str) -> SourceFormat:
+        parsed = self._sources.get(source)
+        if parsed is None:
+            parsed = self._sources[source] = parse_source(source)
+        return parsed
+
+    def check(self, source: str, translation: str) -> List[SpecifierMismatch]:
+        """Return the specifier mismatches of one translation."""
+        return check_translation(self.source_format(source), translation)
@@ -0,0 +1,107 @@
+from typing import Dict, List, Set
+from .text_analyzer import TextAnalyzer
+from .issue_store import Issue, IssueStore
+from .source_profile import is_outlier, median_length
+
+class IncrementalAnalyzer:
+    """Keeps the translations and issues of a catalog between analysis passes.
+
+    Each update compares the new translations with the previous ones and only
+    re-analyzes the (key, language) entries that changed, so repeated saves of
+    a large catalog do not pay for a full analysis pass.
+    """
+
+    def __init__(self, text_analyzer: TextAnalyzer):
+        self.text_analyzer = text_analyzer
+        self.translations = {}
+        self.source_language = None
+        # key -> language -> [Issue], only for entries with issues
+        self._issues_by_entry = {}
+
+    @staticmethod
+    def diff(old: Dict, new: Dict, source_language: str) -> Dict[str, Set[str]]:
+        """Return the target languages to re-analyze for every changed key.
+
+        A key whose source text changed needs all of its languages re-analyzed.
+        Outliers are relative to the median length of a key, so unchanged
+        languages whose outlier status moves with the median are included.
+        Keys and languages that were removed are not part of the result.
+        """
+        changed = {}
+        for key, new_data in new.items():
+            old_data = old.get(key)
+            if old_data is None or old_data.get(source_language) != new_data.get(source_language):
+                languages = set(new_data)
+            else:
+                languages = {lang for lang, trans_data in new_data.items() if old_data.get(lang) != trans_data}
+                if languages or len(old_data) != len(new_data):
+                    old_median, new_median = median_length(old_data), median_length(new_data)
+                    if old_median != new_median:
+                        for lang, trans_data in new_data.items():
+                            length = len(trans_data.get('value', ''))
+                            if length and is_outlier(length, old_median) != is_outlier(length, new_median):
+                                languages.add(lang)
+            languages.discard(source_language)
+            if languages:
+                changed[key] = languages
+        return changed
+
+    def update(self, translations: Dict, source_language: str) -> Dict[str, Set[str]]:
+        """Bring the issue set up to date with translations.
+
+        Returns the languages that were re-analyzed per key.
+        """
+        if source_language != self.source_language:
+            # Every comparison is against the source, so start over
+            self.translations = {}
+            self._issues_by_entry = {}
+
+        changed = self.diff(self.translations, translations, source_language)
+        if not self.translations:
+            # Nothing to reuse; analyze the catalog as a whole
+            subset, key_languages = translations, None
+        else:
+            # Changed keys keep all their languages, since outliers are
+            # relative to the median of the whole key; only the changed
+            # languages are re-checked
+            subset = {key: translations[key] for key in changed}
+            key_languages = changed
+
+        # Drop issues of removed keys and languages, and of entries about to be redone
+        for key in list(self._issues_by_entry):
+            if key not in translations:
+                del self._issues_by_entry[key]
+                continue
+            entry_issues = self._issues_by_entry[key]
+            languages = changed.get(key, ())
+            for lang in list(entry_issues):
+                if lang in languages or lang not in translations[key]:
+                    del entry_issues[lang]
+            if not entry_issues:
+                del self._issues_by_entry[key]
+
+        for issue in self.text_analyzer.analyze_records(subset, source_language, key_languages):
+            self._issues_by_entry.setdefault(issue.key, {}).setdefault(issue.language, []).append(issue)
+
+        self.translations = translations
+        self.source_language = source_language
+        return changed
+
+    def issues(self) -> Dict[str, List[str]]:
+        """Return the current issues in the same shape and order as a full pass."""
+        return TextAnalyzer.group_records(self._records())
+
+    def store(self) -> IssueStore:
+        """Return the current issues as an indexed store, in full-pass order."""
+        return IssueStore(self._records())
+
+    def _records(self) -> List[Issue]:
+        """Return current issues in key-major catalog order."""
+        records = []
+        for key, translations_data in self.translations.items():
+            entry_issues = self._issues_by_entry.get(key)
+            if not entry_issues:
+                continue
+            for lang in translations_data:
+                records.extend(entry_issues.get(lang, ()))
+        return records
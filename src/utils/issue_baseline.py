@@ -0,0 +1,124 @@
+import hashlib
+import threading
+from typing import Iterable, List, NamedTuple, Tuple
+from .issue_store import Issue, IssueStore, format_issue
+
+# Fingerprints of resolved issues looked up per query
+LOOKUP_CHUNK_SIZE = 500
+
+class BaselineDiff(NamedTuple):
+    """Result of comparing the issues of a run with a baseline."""
+    new_issues: IssueStore
+    # Report sentences of accepted issues that no longer occur
+    resolved: List[str]
+    # Issues of this run that are accepted in the baseline
+    known: int
+
+class IssueBaseline:
+    """SQLite file of accepted issues, for gating CI on new issues only.
+
+    An accepted issue is identified by its key, language, category and a hash
+    of the source and translated text, so an issue comes back as new once
+    either text changes. Entries are stored under a 64-bit fingerprint of
+    those fields, which keeps comparing a run against hundreds of thousands
+    of entries to a single indexed scan and one hash per issue.
+
+    Issues are passed in as (issue, source text, translated text) entries.
+    A baseline may be used from any thread, such as the poller of --serve.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # Imported here so runs without a baseline never load sqlite3
+        import sqlite3
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS accepted ("
+            "fingerprint INTEGER PRIMARY KEY, key TEXT NOT NULL, language TEXT NOT NULL, "
+            "category TEXT NOT NULL, content_hash TEXT NOT NULL, message TEXT NOT NULL)"
+        )
+
+    @staticmethod
+    def content_hash(source: str, translation: str) -> str:
+        """Hash the texts an issue was found in."""
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(source.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(translation.encode('utf-8'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def fingerprint(issue: Issue, source: str, translation: str) -> int:
+        """Return the signed 64-bit fingerprint an issue is stored under."""
+        digest = hashlib.blake2b(
+            f"{issue.key}\0{issue.language}\0{issue.category}\0{source}\0{translation}".encode('utf-8'),
+            digest_size=8
+        )
+        return int.from_bytes(digest.digest(), 'big', signed=True)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM accepted").fetchone()[0]
+
+    def compare(self, entries: Iterable[Tuple[Issue, str, str]]) -> BaselineDiff:
+        """Split issues into new and accepted ones.
+
+        Also returns the accepted issues that did not occur in this run.
+        """
+        with self._lock:
+            accepted = {row[0] for row in self._db.execute("SELECT fingerprint FROM accepted")}
+        new_issues = IssueStore()
+        known = 0
+        # fingerprint() inlined with local lookups; this runs once per issue
+        blake2b = hashlib.blake2b
+        from_bytes = int.from_bytes
+        for issue, source, translation in entries:
+            key, language, category = issue[:3]
+            fingerprint = from_bytes(
+                blake2b(f"{key}\0{language}\0{category}\0{source}\0{translation}".encode('utf-8'),
+                        digest_size=8).digest(),
+                'big', signed=True
+            )
+            if fingerprint in accepted:
+                # Whatever is left in accepted afterwards was resolved
+                accepted.discard(fingerprint)
+                known += 1
+            else:
+                new_issues.add(issue)
+
+        missing = list(accepted)
+        rows = []
+        with self._lock:
+            for start in range(0, len(missing), LOOKUP_CHUNK_SIZE):
+                chunk = missing[start:start + LOOKUP_CHUNK_SIZE]
+                rows.extend(self._db.execute(
+                    f"SELECT key, language, category, message FROM accepted "
+                    f"WHERE fingerprint IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ))
+        # Sorted once over every chunk; Python orders strings like SQLite's default collation
+        rows.sort()
+        return BaselineDiff(new_issues, [row[3] for row in rows], known)
+
+    def accept(self, entries: Iterable[Tuple[Issue, str, str]]) -> int:
+        """Replace the baseline with the given issues; returns the entry count."""
+        rows = (
+            (self.fingerprint(issue, source, translation), issue.key, issue.language, issue.category,
+             self.content_hash(source, translation), format_issue(issue))
+            for issue, source, translation in entries
+        )
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM accepted")
+            self._db.executemany(
+                "INSERT OR REPLACE INTO accepted (fingerprint, key, language, category, content_hash, message) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return len(self)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,159 @@
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+# Issue categories, in report order
+CATEGORIES = ('missing_translations', 'length_issues', 'truncation_issues', 'format_issues', 'rtl_issues',
+              'state_issues', 'consistency_issues')
+SEVERITIES = ('error', 'warning', 'info')
+# Severity of every issue of a category
+CATEGORY_SEVERITY = {
+    'missing_translations': 'error',
+    'length_issues': 'warning',
+    'truncation_issues': 'warning',
+    'format_issues': 'error',
+    'rtl_issues': 'info',
+    'state_issues': 'warning',
+    'consistency_issues': 'warning'
+}
+# Report text of each category, filled from the issue and its metrics
+MESSAGE_TEMPLATES = {
+    'missing_translations': "Missing translation for '{key}' in {language}",
+    'length_issues': "Text length issue in '{key}' for {language}: ratio {length_ratio:.2f}",
+    'truncation_issues': "Text too wide in '{key}' for {language}: {text_width:.0f}pt of {max_width:.0f}pt",
+    'format_issues': "Format specifier mismatch in '{key}' for {language}",
+    'rtl_issues': "RTL considerations needed for '{key}' in {language}",
+    'state_issues': "Translation state issue in '{key}' for {language}",
+    'consistency_issues': "Inconsistent translation of '{key}' in {language}"
+}
+
+# Metric appended to the report text of a category when an issue carries it
+MESSAGE_DETAILS = {'format_issues': 'mismatches', 'state_issues': 'detail', 'consistency_issues': 'details'}
+
+class Issue(NamedTuple):
+    """One issue found in a catalog.
+
+    `metrics` holds the measurements behind the issue, such as the length
+    ratio or the specifier mismatches, and is None for issues that have none.
+    """
+    key: str
+    language: str
+    category: str
+    severity: str
+    metrics: Optional[Dict[str, Any]] = None
+
+def make_issue(key: str, language: str, category: str, metrics: Optional[Dict[str, Any]] = None) -> Issue:
+    """Create an issue with the severity of its category."""
+    return Issue(key, language, category, CATEGORY_SEVERITY.get(category, 'warning'), metrics)
+
+def format_issue(issue: Issue) -> str:
+    """Render an issue as the sentence shown in reports."""
+    template = MESSAGE_TEMPLATES.get(issue.category)
+    if template is None:
+        return f"{issue.category.replace('_', ' ').capitalize()} in '{issue.key}' for {issue.language}"
+    message = template.format(key=issue.key, language=issue.language, **(issue.metrics or {}))
+    detail = MESSAGE_DETAILS.get(issue.category)
+    if detail is not None and issue.metrics and detail in issue.metrics:
+        message += f": {issue.metrics[detail]}"
+    return message
+
+class IssueStore:
+    """Issues of a catalog, indexed by key, language and category.
+
+    Issues keep the order they were added in, which for analyzer output is
+    key-major catalog order. Filters on indexed fields only visit the
+    matching issues.
+    """
+
+    __slots__ = ('_issues', '_by_key', '_by_language', '_by_category')
+
+    def __init__(self, issues: Iterable[Issue] = ()):
+        self._issues = []
+        # Field value -> positions in _issues, in ascending order
+        self._by_key = {}
+        self._by_language = {}
+        self._by_category = {}
+        self.extend(issues)
+
+    def add(self, issue: Issue) -> None:
+        position = len(self._issues)
+        self._issues.append(issue)
+        self._by_key.setdefault(issue.key, []).append(position)
+        self._by_language.setdefault(issue.language, []).append(position)
+        self._by_category.setdefault(issue.category, []).append(position)
+
+    def extend(self, issues: Iterable[Issue]) -> None:
+        for issue in issues:
+            self.add(issue)
+
+    def __len__(self) -> int:
+        return len(self._issues)
+
+    def __iter__(self) -> Iterator[Issue]:
+        return iter(self._issues)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, IssueStore) and self._issues == other._issues
+
+    def _positions(self, key: Optional[str], language: Optional[str],
+                   category: Optional[str]) -> Optional[List[int]]:
+        """Return the smallest index list matching the given fields, or None if none were given."""
+        candidates = [
+            index.get(value, [])
+            for index, value in ((self._by_key, key), (self._by_language, language), (self._by_category, category))
+            if value is not None
+        ]
+        return min(candidates, key=len) if candidates else None
+
+    def filter(self, key: Optional[str] = None, language: Optional[str] = None,
+               category: Optional[str] = None, severity: Optional[str] = None) -> List[Issue]:
+        """Return the issues matching every given field, in store order."""
+        positions = self._positions(key, language, category)
+        issues = self._issues if positions is None else [self._issues[position] for position in positions]
+        return [
+            issue for issue in issues
+            if (key is None or issue.key == key)
+            and (language is None or issue.language == language)
+            and (category is None or issue.category == category)
+            and (severity is None or issue.severity == severity)
+        ]
+
+    def count(self, key: Optional[str] = None, language: Optional[str] = None,
+              category: Optional[str] = None, severity: Optional[str] = None) -> int:
+        """Count the issues matching every given field."""
+        given = [value for value in (key, language, category, severity) if value is not None]
+        if not given:
+            return len(self._issues)
+        if len(given) == 1 and severity is None:
+            return len(self._positions(key, language, category))
+        return len(self.filter(key, language, category, severity))
+
+    def group_by(self, field: str) -> Dict[str, List[Issue]]:
+        """Group the issues by one field of Issue, in order of first appearance."""
+        index = {'key': self._by_key, 'language': self._by_language, 'category': self._by_category}.get(field)
+        if index is not None:
+            return {value: [self._issues[position] for position in positions] for value, positions in index.items()}
+        groups = {}
+        for issue in self._issues:
+            groups.setdefault(getattr(issue, field), []).append(issue)
+        return groups
+
+    def counts_by(self, field: str) -> Dict[str, int]:
+        """Count the issues per value of one field of Issue."""
+        index = {'key': self._by_key, 'language': self._by_language, 'category': self._by_category}.get(field)
+        if index is not None:
+            return {value: len(positions) for value, positions in index.items()}
+        counts = {}
+        for issue in self._issues:
+            value = getattr(issue, field)
+            counts[value] = counts.get(value, 0) + 1
+        return counts
+
+    def categories(self) -> List[str]:
+        """Return every category in report order, followed by any unknown ones."""
+        return list(CATEGORIES) + [category for category in self._by_category if category not in CATEGORIES]
+
+    def messages(self) -> Dict[str, List[str]]:
+        """Format the issues into the per-category lists of report sentences."""
+        return {
+            category: [format_issue(self._issues[position]) for position in self._by_category.get(category, ())]
+            for category in self.categories()
+        }
@@ -0,0 +1,38 @@
+from functools import lru_cache
+from typing import FrozenSet
+
+# Cardinal plural categories of each language, from the CLDR plural rules.
+# Xcode asks for exactly these forms in a plural variation.
+CLDR_PLURAL_CATEGORIES = {
+    ('other',): (
+        'bo', 'id', 'ja', 'jv', 'km', 'ko', 'lo', 'ms', 'my', 'th', 'vi', 'yue', 'zh'
+    ),
+    ('one', 'other'): (
+        'af', 'am', 'as', 'az', 'bg', 'bn', 'da', 'de', 'el', 'en', 'et', 'eu', 'fa', 'fi', 'fil',
+        'gl', 'gu', 'hi', 'hu', 'hy', 'is', 'ka', 'kk', 'kn', 'ky', 'mk', 'ml', 'mn', 'mr', 'nb',
+        'ne', 'nl', 'nn', 'no', 'or', 'pa', 'ps', 'si', 'so', 'sq', 'sv', 'sw', 'ta', 'te', 'tk',
+        'tl', 'tr', 'ug', 'ur', 'uz', 'zu'
+    ),
+    ('one', 'many', 'other'): ('ca', 'es', 'fr', 'it', 'pt'),
+    ('one', 'few', 'other'): ('bs', 'hr', 'ro', 'sr'),
+    ('one', 'two', 'other'): ('he', 'iw'),
+    ('zero', 'one', 'other'): ('lv',),
+    ('one', 'few', 'many', 'other'): ('be', 'cs', 'lt', 'pl', 'ru', 'sk', 'uk'),
+    ('one', 'two', 'few', 'other'): ('sl',),
+    ('one', 'two', 'few', 'many', 'other'): ('ga', 'mt'),
+    ('zero', 'one', 'two', 'few', 'many', 'other'): ('ar', 'cy')
+}
+# Language code -> plural categories, precomputed from the table above
+PLURAL_CATEGORIES = {
+    language: frozenset(categories)
+    for categories, languages in CLDR_PLURAL_CATEGORIES.items()
+    for language in languages
+}
+# Every language has this category; it is all that is required of unknown ones
+PLURAL_OTHER = 'other'
+
+@lru_cache(maxsize=None)
+def plural_categories(language: str) -> FrozenSet[str]:
+    """Return the plural categories a language needs, e.g. for 'pt-BR' or 'zh-Hans'."""
+    base = language.replace('_', '-').split('-')[0].lower()
+    return PLURAL_CATEGORIES.get(base, frozenset((PLURAL_OTHER,)))
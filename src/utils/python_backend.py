@@ -0,0 +1,136 @@
+import math
+import re
+from array import array
+from itertools import compress
+from operator import not_
+from typing import Dict, Any, List, Optional, Sequence
+from .format_specifiers import SPECIFIER_TEXT_PATTERN, SourceFormat, SpecifierChecker, check_translation, parse_source, parse_specifiers
+
+# Same specifier pattern as LocalizationHelper.findFormatSpecifiers
+FORMAT_SPECIFIER_PATTERN = re.compile(r'%[0-9]*(?:@|d|f|s)')
+# Characters Foundation treats as newlines in CharacterSet.newlines
+NEWLINE_PATTERN = re.compile('[\n\r\x0b\x0c\x85\u2028\u2029]')
+DIRECTIONAL_OVERRIDES = ('\u202a', '\u202b', '\u202c', '\u202d', '\u202e')
+RTL_LANGUAGE_PREFIXES = ('ar', 'he', 'fa')
+
+# Approximate metrics of the 13pt macOS system font used by the Swift helper
+AVERAGE_CHAR_WIDTH = 7.0
+LINE_HEIGHT = 16.0
+DEFAULT_WIDTH = 375.0
+
+class PythonBackend:
+    """In-process implementation of the LocalizationHelper analyses.
+
+    Format specifiers are compared argument by argument, including
+    positional (%1$@), long (%lld) and width/precision forms, and each
+    mismatch is described under `specifierMismatches`.
+    """
+
+    def __init__(self):
+        self.specifiers = SpecifierChecker()
+
+    def close(self) -> None:
+        """Nothing to release; present for parity with SwiftBridge."""
+
+    @staticmethod
+    def find_format_specifiers(text: str) -> List[str]:
+        """Return the format specifiers in text, in order of appearance."""
+        return FORMAT_SPECIFIER_PATTERN.findall(text)
+
+    @staticmethod
+    def is_rtl_language(language: str) -> bool:
+        """Check whether a language code is laid out right-to-left."""
+        return language.startswith(RTL_LANGUAGE_PREFIXES)
+
+    def analyze_text(self, text: str, width: float = DEFAULT_WIDTH) -> Dict[str, Any]:
+        """Analyze text the same way as LocalizationHelper.analyzeText."""
+        return {
+            'length': len(text),
+            'lines': len(NEWLINE_PATTERN.split(text)),
+            'words': len(text.split()),
+            'hasDirectionalOverrides': any(c in text for c in DIRECTIONAL_OVERRIDES),
+            'formatSpecifiers': self.find_format_specifiers(text)
+        }
+
+    def validate_translation(self, source: str, translation: str) -> Dict[str, Any]:
+        """Validate a translation the same way as LocalizationHelper.validateTranslation."""
+        source_format = self.specifiers.source_format(source)
+        mismatches = check_translation(source_format, translation)
+        # The Swift helper divides by zero here; treat an empty source as no change
+        length_ratio = len(translation) / len(source) if source else 1.0
+
+        recommendations = []
+        if length_ratio > 1.5:
+            recommendations.append(
+                f"Translation is {int(length_ratio * 100)}% longer than source - consider shortening"
+            )
+        if mismatches:
+            recommendations.append("Format specifiers don't match - please verify")
+
+        return {
+            'lengthRatio': length_ratio,
+            'specifiersMatch': not mismatches,
+            'specifierMismatches': [mismatch.describe() for mismatch in mismatches],
+            'sourceSpecifiers': [specifier.text for specifier in source_format.specifiers],
+            'translatedSpecifiers': [specifier.text for specifier in parse_specifiers(translation)],
+            'source': self.analyze_text(source),
+            'translated': self.analyze_text(translation),
+            'recommendation': "; ".join(recommendations) if recommendations else "No issues found"
+        }
+
+    def validate_batch(self, sources: Sequence[str], translations: Sequence[str],
+                       source_specifiers: Optional[Dict[str, SourceFormat]] = None
+                       ) -> Dict[str, Sequence]:
+        """Validate whole columns of source/translation pairs at once.
+
+        Returns parallel columns of `lengthRatio`, `specifiersMatch` and
+        `specifierMismatches` values, matching what validate_translation
+        reports for each pair. Sources repeat across languages, so callers
+        validating several columns can pass the same `source_specifiers` dict
+        to parse each distinct source only once.
+        """
+        if source_specifiers is None:
+            source_specifiers = {}
+        for text in set(sources).difference(source_specifiers):
+            source_specifiers[text] = parse_source(text)
+        source_lengths = array('q', map(len, sources))
+        translated_lengths = array('q', map(len, translations))
+
+        source_formats = list(map(source_specifiers.__getitem__, sources))
+        # Same fast path as check_translation, a column at a time: specifiers
+        # spelled exactly like the source's need no parsing
+        matches = [
+            source.texts == (SPECIFIER_TEXT_PATTERN.findall(translation) if '%' in translation else [])
+            for source, translation in zip(source_formats, translations)
+        ]
+        mismatches = [()] * len(matches)
+        for row in compress(range(len(matches)), map(not_, matches)):
+            found = check_translation(source_formats[row], translations[row])
+            matches[row] = not found
+            mismatches[row] = tuple(mismatch.describe() for mismatch in found)
+
+        return {
+            'lengthRatio': array('d', [
+                translated / source if source else 1.0
+                for source, translated in zip(source_lengths, translated_lengths)
+            ]),
+            'specifiersMatch': matches,
+            'specifierMismatches': mismatches
+        }
+
+    def check_layout(self, language: str, text: str, width: float = DEFAULT_WIDTH) -> Dict[str, Any]:
+        """Estimate layout the same way as LocalizationHelper.simulateLayoutForLanguage."""
+        text_width = 0.0
+        line_count = 0
+        for line in NEWLINE_PATTERN.split(text):
+            line_width = len(line) * AVERAGE_CHAR_WIDTH
+            line_count += max(1, math.ceil(line_width / width))
+            text_width = max(text_width, min(line_width, width))
+
+        return {
+            'width': text_width,
+            'height': line_count * LINE_HEIGHT,
+            'isRTL': self.is_rtl_language(language),
+            'recommendedMinWidth': math.ceil(text_width * 1.1),
+            'textAnalysis': self.analyze_text(text)
+        }
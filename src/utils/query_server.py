@@ -0,0 +1,216 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from .issue_store import CATEGORIES, SEVERITIES, IssueStore, format_issue
+
+# The server only ever listens on the loopback interface
+LOCALHOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+# Seconds between checks of the catalog files for changes
+DEFAULT_POLL_INTERVAL = 1.0
+# Issues returned by one /issues request when the client sets no limit
+DEFAULT_LIMIT = 1000
+
+class CatalogSnapshot(NamedTuple):
+    """Issues and stats of a catalog as of its last analysis pass; never modified once published."""
+    issues: IssueStore
+    stats: Dict[str, Any]
+
+class QueryError(Exception):
+    """A query the server cannot answer, with the HTTP status to answer it with."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+class QueryServer:
+    """Serves the issues of loaded catalogs as JSON over HTTP on localhost.
+
+    Each catalog is a LocalizationTester, or any object with its refresh(),
+    close(), `issues` and `stats`. A background thread polls the catalogs
+    and re-analyzes changed files incrementally; after each pass the
+    catalog's issues and a copy of its stats are published as a new
+    snapshot. Requests are handled on threads of their own and only read
+    published snapshots, so they never wait for an analysis pass.
+
+    Endpoints (all GET):
+        /catalogs   names and issue counts of the loaded catalogs
+        /stats      summary stats, of every catalog or of ?catalog=NAME
+        /issues     issues filtered by key, language, category, severity
+                    and catalog, paged with limit and offset
+    """
+
+    def __init__(self, catalogs: Dict[str, Any], port: int = DEFAULT_PORT,
+                 interval: float = DEFAULT_POLL_INTERVAL):
+        self.catalogs = catalogs
+        self.interval = interval
+        # Catalog name -> latest snapshot; replaced as a whole, never updated in place
+        self.snapshots: Dict[str, CatalogSnapshot] = {}
+        self._refresh_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._poller: Optional[threading.Thread] = None
+        # Thread running serve_forever when started with start()
+        self._serving: Optional[threading.Thread] = None
+        self.httpd = ThreadingHTTPServer((LOCALHOST, port), _QueryHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.query_server = self
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def refresh(self) -> List[str]:
+        """Re-analyze the catalogs whose files changed and publish their snapshots.
+
+        Returns the names of the catalogs that were re-analyzed.
+        """
+        refreshed = []
+        with self._refresh_lock:
+            for name, tester in self.catalogs.items():
+                try:
+                    changed = tester.refresh()
+                except Exception as e:
+                    # Keep serving the last snapshot; the other catalogs are still refreshed
+                    print(f"Error re-analyzing {name}: {e}")
+                    continue
+                if changed is None and name in self.snapshots:
+                    continue
+                snapshot = CatalogSnapshot(tester.issues, dict(tester.stats))
+                self.snapshots = {**self.snapshots, name: snapshot}
+                refreshed.append(name)
+        return refreshed
+
+    def _poll(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.refresh()
+
+    def _start_polling(self) -> None:
+        self._poller = threading.Thread(target=self._poll, daemon=True)
+        self._poller.start()
+
+    def start(self) -> 'QueryServer':
+        """Load the catalogs, then serve and poll them on background threads."""
+        self.refresh()
+        self._start_polling()
+        self._serving = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._serving.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Load the catalogs and serve requests until interrupted."""
+        self.refresh()
+        self._start_polling()
+        try:
+            self.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop serving and polling, and shut down the analysis of every catalog."""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        if self._serving is not None:
+            self.httpd.shutdown()
+            self._serving.join()
+        if self._poller is not None:
+            self._poller.join()
+        self.httpd.server_close()
+        for tester in self.catalogs.values():
+            tester.close()
+
+    def _snapshot(self, name: str) -> CatalogSnapshot:
+        snapshot = self.snapshots.get(name)
+        if snapshot is None:
+            raise QueryError(404, f"Unknown catalog '{name}'")
+        return snapshot
+
+    def list_catalogs(self) -> Dict[str, Any]:
+        """Return the loaded catalogs with their string and issue counts."""
+        return {"catalogs": [
+            {"name": name, "total_strings": snapshot.stats.get("total_strings", 0),
+             "issues_found": len(snapshot.issues)}
+            for name, snapshot in self.snapshots.items()
+        ]}
+
+    def stats(self, catalog: Optional[str] = None) -> Dict[str, Any]:
+        """Return the stats of one catalog, or of every catalog by name."""
+        if catalog is not None:
+            return self._snapshot(catalog).stats
+        return {"catalogs": {name: snapshot.stats for name, snapshot in self.snapshots.items()}}
+
+    def issues(self, catalog: Optional[str] = None, key: Optional[str] = None, language: Optional[str] = None,
+               category: Optional[str] = None, severity: Optional[str] = None,
+               limit: int = DEFAULT_LIMIT, offset: int = 0) -> Dict[str, Any]:
+        """Return a page of the issues matching every given field, with the total number of matches."""
+        if category is not None and category not in CATEGORIES:
+            raise QueryError(400, f"Unknown category '{category}'")
+        if severity is not None and severity not in SEVERITIES:
+            raise QueryError(400, f"Unknown severity '{severity}'")
+        snapshots = self.snapshots
+        names = [catalog] if catalog is not None else list(snapshots)
+        matches = []
+        for name in names:
+            snapshot = snapshots.get(name)
+            if snapshot is None:
+                raise QueryError(404, f"Unknown catalog '{name}'")
+            matches.extend((name, issue) for issue in snapshot.issues.filter(key, language, category, severity))
+        return {
+            "total": len(matches),
+            "offset": offset,
+            "issues": [
+                {"catalog": name, **issue._asdict(), "message": format_issue(issue)}
+                for name, issue in matches[offset:offset + limit]
+            ]
+        }
+
+    def query(self, path: str, params: Dict[str, str]) -> Tuple[int, Dict[str, Any]]:
+        """Answer a request for an endpoint; returns the HTTP status and the JSON body."""
+        try:
+            if path == '/catalogs':
+                return 200, self.list_catalogs()
+            if path == '/stats':
+                return 200, self.stats(params.get('catalog'))
+            if path == '/issues':
+                return 200, self.issues(
+                    catalog=params.get('catalog'), key=params.get('key'), language=params.get('language'),
+                    category=params.get('category'), severity=params.get('severity'),
+                    limit=_count_param(params, 'limit', DEFAULT_LIMIT), offset=_count_param(params, 'offset', 0)
+                )
+            raise QueryError(404, f"Unknown endpoint '{path}'")
+        except QueryError as e:
+            return e.status, {"error": str(e)}
+
+def _count_param(params: Dict[str, str], name: str, default: int) -> int:
+    """Read a non-negative integer query parameter."""
+    value = params.get(name)
+    if value is None:
+        return default
+    if not value.isdigit():
+        raise QueryError(400, f"'{name}' must be a non-negative integer")
+    return int(value)
+
+class _QueryHandler(BaseHTTPRequestHandler):
+    # Keep-alive lets a client send many queries over one connection
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        # A repeated parameter keeps its last value
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        status, body = self.server.query_server.query(url.path.rstrip('/') or '/', params)
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        # Requests are frequent and not worth a line each on the console
+        pass
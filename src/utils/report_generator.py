@@ -1,61 +1,326 @@
+import io
 import json
-import markdown
+import sys
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+from .issue_store import IssueStore, format_issue
+
+REPORT_FORMATS = ('markdown', 'console', 'json', 'jsonl')
+# File extension of each report format
+REPORT_EXTENSIONS = {'markdown': '.md', 'console': '.txt', 'json': '.json', 'jsonl': '.jsonl'}
+# Write buffer of report files, so line-by-line writing stays cheap
+REPORT_BUFFER_SIZE = 1 << 16
+
+@contextmanager
+def open_report_file(path: str, compress: bool = False) -> Iterator[TextIO]:
+    """Open a report destination for streaming text output.
+
+    `-` writes to stdout. Paths ending in .gz, or any path when `compress` is
+    set, are gzip-compressed.
+    """
+    if path == '-':
+        yield sys.stdout
+        sys.stdout.flush()
+        return
+    if compress or path.endswith('.gz'):
+        # Only loaded when a compressed report is asked for
+        import gzip
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            yield f
+        return
+    with open(path, 'w', encoding='utf-8', buffering=REPORT_BUFFER_SIZE) as f:
+        yield f
+
+class TeeStream:
+    """Text stream that writes to several streams at once, e.g. a file and stdout."""
+
+    def __init__(self, *streams: TextIO):
+        self.streams = streams
+
+    def write(self, text: str) -> int:
+        for stream in self.streams:
+            stream.write(text)
+        return len(text)
 
 class ReportGenerator:
-    def __init__(self, issues: Dict[str, List[str]], stats: Dict[str, any]):
+    """Renders issues and stats as Markdown, console text, JSON or JSON Lines.
+
+    Issues are given as an IssueStore, or as lists of report sentences per
+    category; stored issues are only formatted to text while rendering.
+    The write_* methods stream a report to a text stream line by line, so
+    memory use does not grow with the size of the report; the generate_*
+    methods return the same report as a string.
+    """
+
+    def __init__(self, issues: Union[IssueStore, Dict[str, List[str]]], stats: Dict[str, any],
+                 catalogs: Optional[Dict[str, Dict]] = None, resolved: Optional[List[str]] = None):
         self.issues = issues
         self.stats = stats
+        # Per-catalog {"issues": ..., "stats": ...} when reporting on a whole project
+        self.catalogs = catalogs or {}
+        # Sentences of baseline issues that no longer occur, when gating on a baseline
+        self.resolved = resolved or []
         self.timestamp = datetime.now()
 
-    def generate_console_report(self) -> str:
-        """Generate a console-friendly report."""
-        report = [f"=== Localization Test Report ({self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}) ===\n"]
-        
+    @staticmethod
+    def _categories(issues: Union[IssueStore, Dict[str, List[str]]]) -> Iterator[Tuple[str, int, Iterable[str]]]:
+        """Yield (category, count, report sentences) for every category."""
+        if isinstance(issues, IssueStore):
+            for category in issues.categories():
+                matching = issues.filter(category=category)
+                yield category, len(matching), map(format_issue, matching)
+        else:
+            for category, category_issues in issues.items():
+                yield category, len(category_issues), category_issues
+
+    @staticmethod
+    def _write_lines(stream: TextIO, lines: Iterable[str]) -> None:
+        """Write lines separated by newlines, as "\\n".join would."""
+        first = True
+        for line in lines:
+            if not first:
+                stream.write("\n")
+            stream.write(line)
+            first = False
+
+    def write(self, stream: TextIO, report_format: str = 'markdown') -> None:
+        """Stream the report in one of REPORT_FORMATS to a text stream."""
+        writers = {
+            'markdown': self.write_markdown,
+            'console': self.write_console,
+            'json': self.write_json,
+            'jsonl': self.write_jsonl
+        }
+        if report_format not in writers:
+            raise ValueError(f"Unknown report format '{report_format}'. Expected one of: {', '.join(REPORT_FORMATS)}")
+        writers[report_format](stream)
+
+    def _console_lines(self) -> Iterator[str]:
+        """Yield the lines of the console report."""
+        yield f"=== Localization Test Report ({self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}) ===\n"
+
         # Add statistics
-        report.append("Statistics:")
+        yield "Statistics:"
         for key, value in self.stats.items():
-            report.append(f"  {key}: {value}")
-        report.append("")
+            if key != "metrics":
+                yield f"  {key}: {value}"
+        yield ""
+
+        # Add timings
+        metrics = self.stats.get("metrics")
+        if metrics:
+            yield "Performance:"
+            for stage, timing in metrics["stages"].items():
+                yield f"  {stage}: {timing['wall_seconds']:.3f}s wall, {timing['cpu_seconds']:.3f}s CPU"
+            for kind, calls in metrics["backend_calls"].items():
+                yield (f"  backend {kind}: {calls['count']} calls, "
+                       f"mean {calls['mean_ms']:.3f}ms, max {calls['max_ms']:.3f}ms")
+            yield ""
 
         # Add issues
-        for category, category_issues in self.issues.items():
-            if category_issues:
-                report.append(f"\n{category.replace('_', ' ').title()}:")
+        for category, count, category_issues in self._categories(self.issues):
+            if count:
+                yield f"\n{category.replace('_', ' ').title()}:"
                 for issue in category_issues:
-                    report.append(f"  ⚠️  {issue}")
-        
-        return "\n".join(report)
+                    yield f"  ⚠️  {issue}"
 
-    def generate_markdown_report(self) -> str:
-        """Generate a detailed markdown report."""
-        report = [
-            "# Localization QA Report",
-            f"Generated: {self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n",
-            "## Summary",
-        ]
+        # Add issues fixed since the baseline
+        if self.resolved:
+            yield "\nResolved:"
+            for issue in self.resolved:
+                yield f"  ✅ {issue}"
+
+        # Add per-catalog issues
+        for path, catalog in self.catalogs.items():
+            yield f"\n--- {path} ({catalog['stats'].get('issues_found', 0)} issues) ---"
+            for category, count, category_issues in self._categories(catalog['issues']):
+                if count:
+                    yield f"\n{category.replace('_', ' ').title()}:"
+                    for issue in category_issues:
+                        yield f"  ⚠️  {issue}"
+
+    def write_console(self, stream: TextIO) -> None:
+        """Stream a console-friendly report."""
+        self._write_lines(stream, self._console_lines())
+
+    def generate_console_report(self) -> str:
+        """Generate a console-friendly report."""
+        report = io.StringIO()
+        self.write_console(report)
+        return report.getvalue()
+
+    @classmethod
+    def _markdown_issues(cls, issues: Union[IssueStore, Dict[str, List[str]]], heading: str) -> Iterator[str]:
+        """Render issues as one Markdown section per non-empty category."""
+        for category, count, category_issues in cls._categories(issues):
+            if count:
+                yield f"{heading} {category.replace('_', ' ').title()}"
+                for issue in category_issues:
+                    yield f"- ⚠️  {issue}"
+                yield ""
+
+    @staticmethod
+    def _markdown_metrics(metrics: Dict) -> Iterator[str]:
+        """Render stage timings and backend call latencies as Markdown tables."""
+        yield "\n## Performance\n"
+        yield "| Stage | Wall (s) | CPU (s) | Runs |"
+        yield "| --- | ---: | ---: | ---: |"
+        for stage, timing in metrics["stages"].items():
+            yield f"| {stage} | {timing['wall_seconds']:.3f} | {timing['cpu_seconds']:.3f} | {timing['runs']} |"
+
+        if metrics["backend_calls"]:
+            yield "\n| Backend call | Count | Mean (ms) | Max (ms) | Latency histogram |"
+            yield "| --- | ---: | ---: | ---: | --- |"
+            for kind, calls in metrics["backend_calls"].items():
+                histogram = ", ".join(f"{bucket}: {count}" for bucket, count in calls["histogram"].items() if count)
+                yield f"| {kind} | {calls['count']} | {calls['mean_ms']:.3f} | {calls['max_ms']:.3f} | {histogram} |"
+
+        if "peak_memory_bytes" in metrics:
+            yield f"\nPeak traced memory: {metrics['peak_memory_bytes'] / 1e6:.1f} MB"
+
+    def _markdown_lines(self) -> Iterator[str]:
+        """Yield the lines of the Markdown report."""
+        yield "# Localization QA Report"
+        yield f"Generated: {self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        yield "## Summary"
 
         # Add statistics
         for key, value in self.stats.items():
-            report.append(f"- **{key}**: {value}")
-        
+            if key != "metrics":
+                yield f"- **{key}**: {value}"
+
         # Add issues
-        report.append("\n## Issues by Category\n")
-        for category, category_issues in self.issues.items():
-            if category_issues:
-                report.append(f"### {category.replace('_', ' ').title()}")
-                for issue in category_issues:
-                    report.append(f"- ⚠️  {issue}")
-                report.append("")
+        if isinstance(self.issues, IssueStore) or self.issues:
+            yield "\n## Issues by Category\n"
+            yield from self._markdown_issues(self.issues, "###")
+
+        # Add issues fixed since the baseline
+        if self.resolved:
+            yield "\n## Resolved Issues\n"
+            for issue in self.resolved:
+                yield f"- ✅ {issue}"
+
+        # Add per-catalog breakdown
+        if self.catalogs:
+            yield "\n## Catalogs\n"
+            yield "| Catalog | Strings | Languages | Missing | Issues |"
+            yield "| --- | ---: | ---: | ---: | ---: |"
+            for path, catalog in self.catalogs.items():
+                stats = catalog['stats']
+                yield (f"| {path} | {stats.get('total_strings', 0)} | {len(stats.get('languages', []))} "
+                       f"| {stats.get('missing_translations', 0)} | {stats.get('issues_found', 0)} |")
+            for path, catalog in self.catalogs.items():
+                yield f"\n### {path}\n"
+                yield from self._markdown_issues(catalog['issues'], "####")
 
-        return "\n".join(report)
+        # Add timings
+        if self.stats.get("metrics"):
+            yield from self._markdown_metrics(self.stats["metrics"])
+
+    def write_markdown(self, stream: TextIO) -> None:
+        """Stream a detailed markdown report."""
+        self._write_lines(stream, self._markdown_lines())
+
+    def generate_markdown_report(self) -> str:
+        """Generate a detailed markdown report."""
+        report = io.StringIO()
+        self.write_markdown(report)
+        return report.getvalue()
+
+    @staticmethod
+    def _issue_data(issue) -> Dict:
+        """Return a stored issue as JSON data, with its report sentence."""
+        data = issue._asdict()
+        data["message"] = format_issue(issue)
+        return data
+
+    @staticmethod
+    def _json_value(value, indent: str) -> str:
+        """Encode a value as indented JSON that continues at the given indentation."""
+        return json.dumps(value, indent=2).replace("\n", "\n" + indent)
+
+    @classmethod
+    def _write_json_issues(cls, stream: TextIO, issues: Union[IssueStore, Dict[str, List[str]]],
+                           indent: str) -> None:
+        """Stream issues per category as a JSON object, one issue per line.
+
+        Stored issues keep their fields and are encoded as they are pulled
+        from the store, so the issues are never all held as JSON data.
+        """
+        if isinstance(issues, IssueStore):
+            categories = ((category, map(cls._issue_data, issues.filter(category=category)))
+                          for category in issues.categories())
+        else:
+            categories = issues.items()
+        inner = indent + "  "
+        separator = "{"
+        for category, category_issues in categories:
+            stream.write(f"{separator}\n{inner}{json.dumps(category)}: [")
+            item_separator = "\n"
+            for issue in category_issues:
+                # Compact encoding runs in json's C encoder; indent= would not
+                stream.write(item_separator + inner + "  " + json.dumps(issue))
+                item_separator = ",\n"
+            stream.write("]" if item_separator == "\n" else f"\n{inner}]")
+            separator = ","
+        stream.write("{}" if separator == "{" else f"\n{indent}}}")
+
+    def write_json(self, stream: TextIO) -> None:
+        """Stream a JSON report.
+
+        The envelope is written by hand and every issue is encoded on its
+        own line as it is reached, so memory use does not grow with the
+        number of issues.
+        """
+        stream.write(f'{{\n  "timestamp": {json.dumps(self.timestamp.isoformat())},'
+                     f'\n  "stats": {self._json_value(self.stats, "  ")},\n  "issues": ')
+        self._write_json_issues(stream, self.issues, "  ")
+        if self.resolved:
+            stream.write(f',\n  "resolved": {self._json_value(self.resolved, "  ")}')
+        if self.catalogs:
+            stream.write(',\n  "catalogs": ')
+            separator = "{"
+            for path, catalog in self.catalogs.items():
+                stream.write(f"{separator}\n    {json.dumps(path)}: ")
+                member_separator = "{"
+                for name, value in catalog.items():
+                    stream.write(f"{member_separator}\n      {json.dumps(name)}: ")
+                    if name == 'issues':
+                        self._write_json_issues(stream, value, "      ")
+                    else:
+                        stream.write(self._json_value(value, "      "))
+                    member_separator = ","
+                stream.write("{}" if member_separator == "{" else "\n    }")
+                separator = ","
+            stream.write("\n  }")
+        stream.write("\n}")
 
     def generate_json_report(self) -> str:
         """Generate a JSON report."""
-        report_data = {
-            "timestamp": self.timestamp.isoformat(),
-            "stats": self.stats,
-            "issues": self.issues
-        }
-        return json.dumps(report_data, indent=2)
+        report = io.StringIO()
+        self.write_json(report)
+        return report.getvalue()
+
+    def write_jsonl(self, stream: TextIO) -> None:
+        """Stream a JSON Lines report.
+
+        The first line is a summary with the timestamp and stats; every
+        further line is one issue, tagged with its catalog in project reports.
+        """
+        stream.write(json.dumps({"type": "summary", "timestamp": self.timestamp.isoformat(), "stats": self.stats}))
+        stream.write("\n")
+        for path, issues in [(None, self.issues)] + [(path, catalog['issues']) for path, catalog in self.catalogs.items()]:
+            tag = {"type": "issue"} if path is None else {"type": "issue", "catalog": path}
+            if isinstance(issues, IssueStore):
+                for issue in issues:
+                    stream.write(json.dumps(dict(tag, **self._issue_data(issue))))
+                    stream.write("\n")
+                continue
+            for category, category_issues in issues.items():
+                for issue in category_issues:
+                    stream.write(json.dumps(dict(tag, category=category, message=issue)))
+                    stream.write("\n")
+        for issue in self.resolved:
+            stream.write(json.dumps({"type": "resolved", "message": issue}))
+            stream.write("\n")
@@ -0,0 +1,144 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+# Bump whenever analysis results change so stale cache entries are ignored.
+# 2: specifier mismatch details, text widths, variation entries and source profiles
+ANALYZER_VERSION = "2"
+
+DEFAULT_MEMORY_ENTRIES = 10000
+DEFAULT_MAX_ENTRIES = 1000000
+# Writes to the cache file between commits, so a crash loses at most this many
+# and other processes sharing the file are not locked out until flush()
+COMMIT_INTERVAL = 1000
+# Seconds to wait for another process holding the cache file's write lock
+BUSY_TIMEOUT = 30.0
+
+class ResultCache:
+    """Content-addressed cache of analysis results.
+
+    Results are kept in an in-memory LRU layer in front of an optional SQLite
+    file, so unchanged strings are not re-analyzed across runs. The file is
+    bounded to `max_entries`; the least recently used entries are evicted on
+    flush. Writes are committed every `commit_interval` writes, and the file
+    is in WAL mode, so several processes can share it.
+    """
+
+    def __init__(self, path: Optional[str] = None,
+                 memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 commit_interval: int = COMMIT_INTERVAL):
+        self.path = path
+        self.memory_entries = memory_entries
+        self.max_entries = max_entries
+        self.commit_interval = commit_interval
+        # Writes since the last commit
+        self._pending = 0
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        # Monotonic access counter used to order entries for LRU eviction
+        self._clock = 0
+        self._db = None
+        if path is not None:
+            # Imported here so runs without a cache file never load sqlite3
+            import sqlite3
+            self._db = sqlite3.connect(path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+            # Readers do not block the writer, nor the writer readers
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, accessed INTEGER NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+            self._clock = self._db.execute("SELECT COALESCE(MAX(accessed), 0) FROM results").fetchone()[0]
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the analyzer version and the given parts into a cache key."""
+        digest = hashlib.sha256(ANALYZER_VERSION.encode('utf-8'))
+        for part in parts:
+            digest.update(b'\0')
+            digest.update(part.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key, or None on a miss."""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+
+            if self._db is not None:
+                row = self._db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self._clock += 1
+                    self._db.execute("UPDATE results SET accessed = ? WHERE key = ?", (self._clock, key))
+                    self._wrote()
+                    value = json.loads(row[0])
+                    self._remember(key, value)
+                    self.hits += 1
+                    return value
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a result under key."""
+        with self._lock:
+            self._remember(key, value)
+            if self._db is not None:
+                self._clock += 1
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results (key, value, accessed) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), self._clock)
+                )
+                self._wrote()
+
+    def _wrote(self) -> None:
+        """Count a write to the cache file, committing every commit_interval writes."""
+        self._pending += 1
+        if self._pending >= self.commit_interval:
+            self._db.commit()
+            self._pending = 0
+
+    def _remember(self, key: str, value: Dict[str, Any]) -> None:
+        """Add an entry to the in-memory LRU layer, evicting the oldest."""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def flush(self) -> None:
+        """Evict entries beyond max_entries and commit the cache file."""
+        with self._lock:
+            if self._db is None:
+                return
+            count = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            if count > self.max_entries:
+                self._db.execute(
+                    "DELETE FROM results WHERE key IN "
+                    "(SELECT key FROM results ORDER BY accessed ASC LIMIT ?)",
+                    (count - self.max_entries,)
+                )
+            self._db.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        """Flush and close the cache file."""
+        self.flush()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit and miss counters for the report."""
+        return {
+            "cache_hits": self.hits,
+            "cache_misses": self.misses
+        }
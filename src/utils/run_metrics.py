@@ -0,0 +1,136 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional
+
+# Upper bounds, in milliseconds, of the backend call latency histogram buckets
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+# Functions listed when printing the cProfile summary
+PROFILE_TOP_FUNCTIONS = 25
+
+class RunMetrics:
+    """Timing instrumentation for one QA run.
+
+    Records wall and CPU time per pipeline stage, and the count and latency
+    histogram of calls into the analysis backend. With `profile` enabled the
+    run is also captured with cProfile and tracemalloc. CPU time is that of
+    this process; work done in worker processes or the Swift helper only
+    shows up as wall time.
+    """
+
+    def __init__(self, profile: bool = False):
+        self.profile = profile
+        # Stage name -> {"wall_seconds", "cpu_seconds", "runs"}, in first-run order
+        self.stages = {}
+        # Backend call kind -> {"count", "total_seconds", "max_seconds", "histogram"}
+        self.backend_calls = {}
+        self.peak_memory_bytes = None
+        self._profiler = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as one run of a stage."""
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            with self._lock:
+                stage = self.stages.setdefault(name, {"wall_seconds": 0.0, "cpu_seconds": 0.0, "runs": 0})
+                stage["wall_seconds"] += wall
+                stage["cpu_seconds"] += cpu
+                stage["runs"] += 1
+
+    def timed_call(self, kind: str, function, *args):
+        """Call a backend function and record its latency under kind."""
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.record_call(kind, time.perf_counter() - start)
+
+    def record_call(self, kind: str, seconds: float) -> None:
+        """Record one backend call that took `seconds`."""
+        bucket = bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)
+        with self._lock:
+            calls = self.backend_calls.get(kind)
+            if calls is None:
+                calls = self.backend_calls[kind] = {
+                    "count": 0, "total_seconds": 0.0, "max_seconds": 0.0,
+                    "histogram": [0] * (len(LATENCY_BUCKETS_MS) + 1)
+                }
+            calls["count"] += 1
+            calls["total_seconds"] += seconds
+            calls["max_seconds"] = max(calls["max_seconds"], seconds)
+            calls["histogram"][bucket] += 1
+
+    def start_profiling(self) -> None:
+        """Start cProfile and tracemalloc capture if profiling is enabled."""
+        if not self.profile or self._profiler is not None:
+            return
+        # Only loaded when profiling was asked for
+        import cProfile
+        import tracemalloc
+        tracemalloc.start()
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def stop_profiling(self, output_file: Optional[str] = None) -> Optional[str]:
+        """Stop capture and return a summary of the most expensive functions.
+
+        The raw profile is written to `output_file` when given, for use with
+        pstats or snakeviz.
+        """
+        if self._profiler is None:
+            return None
+        import io
+        import pstats
+        import tracemalloc
+
+        profiler, self._profiler = self._profiler, None
+        profiler.disable()
+        self.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        if output_file:
+            profiler.dump_stats(output_file)
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(PROFILE_TOP_FUNCTIONS)
+        return summary.getvalue()
+
+    @staticmethod
+    def histogram_labels() -> List[str]:
+        """Return the labels of the latency histogram buckets."""
+        return [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the metrics as JSON-serializable data for stats and reports."""
+        labels = self.histogram_labels()
+        with self._lock:
+            metrics = {
+                "stages": {
+                    name: {
+                        "wall_seconds": round(stage["wall_seconds"], 6),
+                        "cpu_seconds": round(stage["cpu_seconds"], 6),
+                        "runs": stage["runs"]
+                    }
+                    for name, stage in self.stages.items()
+                },
+                "backend_calls": {
+                    kind: {
+                        "count": calls["count"],
+                        "total_seconds": round(calls["total_seconds"], 6),
+                        "mean_ms": round(calls["total_seconds"] * 1000 / calls["count"], 3),
+                        "max_ms": round(calls["max_seconds"] * 1000, 3),
+                        "histogram": dict(zip(labels, calls["histogram"]))
+                    }
+                    for kind, calls in self.backend_calls.items()
+                }
+            }
+        if self.peak_memory_bytes is not None:
+            metrics["peak_memory_bytes"] = self.peak_memory_bytes
+        return metrics
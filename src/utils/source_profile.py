@@ -0,0 +1,129 @@
+import unicodedata
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from .format_specifiers import SourceFormat, parse_source
+
+# Final punctuation of a sentence, by kind, in the scripts catalogs commonly use
+TERMINAL_PUNCTUATION = {
+    '.': 'period', '。': 'period', '｡': 'period', '।': 'period', '۔': 'period', '።': 'period',
+    '။': 'period', '៕': 'period',
+    '?': 'question', '？': 'question', '؟': 'question', '՞': 'question',
+    '!': 'exclamation', '！': 'exclamation',
+    ':': 'colon', '：': 'colon',
+    '…': 'ellipsis'
+}
+# Languages whose sentences do not end with a full stop
+NO_PERIOD_LANGUAGES = ('th', 'lo')
+# Translations longer than this multiple of the median length of their key are outliers
+OUTLIER_RATIO = 3.0
+# Fewer non-empty values than this give no meaningful median
+OUTLIER_MIN_VALUES = 3
+
+class SourceProfile(NamedTuple):
+    """Features of a source string that every translation of it is checked against."""
+    length: int
+    # Parsed format specifiers, shared with the backend's specifier check
+    format: SourceFormat
+    # Unicode script of the first letter, e.g. 'LATIN'; None without letters
+    script: Optional[str]
+    leading_space: bool
+    trailing_space: bool
+    # Kind of final punctuation (see TERMINAL_PUNCTUATION) and the text it is written as
+    ending: Optional[str]
+    ending_text: str
+
+def terminal_punctuation(text: str) -> Tuple[Optional[str], str]:
+    """Return the kind of final punctuation of text and how it is written.
+
+    Trailing whitespace is ignored; text without final punctuation gives (None, '').
+    """
+    text = text.rstrip()
+    last = text[-1:]
+    kind = TERMINAL_PUNCTUATION.get(last)
+    if kind is None:
+        return None, ''
+    if kind == 'period' and text.endswith('...'):
+        return 'ellipsis', '...'
+    return kind, last
+
+def script_of(text: str) -> Optional[str]:
+    """Return the Unicode script name of the first letter of text."""
+    for char in text:
+        if char.isalpha():
+            return unicodedata.name(char, 'UNKNOWN').split(' ')[0]
+    return None
+
+def profile_source(text: str) -> SourceProfile:
+    """Compute the profile of a source string."""
+    ending, ending_text = terminal_punctuation(text)
+    return SourceProfile(
+        length=len(text),
+        format=parse_source(text),
+        script=script_of(text),
+        leading_space=text[:1].isspace(),
+        trailing_space=text[-1:].isspace(),
+        ending=ending,
+        ending_text=ending_text
+    )
+
+def compare_profile(profile: SourceProfile, language: str, text: str) -> List[str]:
+    """Describe how a translation departs from the whitespace and punctuation of its source."""
+    ending, ending_text = terminal_punctuation(text)
+    if (ending == profile.ending and text[-1:].isspace() == profile.trailing_space
+            and text[:1].isspace() == profile.leading_space):
+        return []
+
+    found = []
+    if text[:1].isspace() != profile.leading_space:
+        found.append('leading whitespace ' + ('dropped' if profile.leading_space else 'added'))
+    if text[-1:].isspace() != profile.trailing_space:
+        found.append('trailing whitespace ' + ('dropped' if profile.trailing_space else 'added'))
+    # Strings without letters, like "%@" or "12:00", are not sentences
+    if ending != profile.ending and profile.script is not None:
+        if ending is None:
+            if not (profile.ending == 'period' and language.startswith(NO_PERIOD_LANGUAGES)):
+                found.append(f"missing final '{profile.ending_text}'")
+        elif profile.ending is None:
+            found.append(f"adds final '{ending_text}'")
+        else:
+            found.append(f"ends with '{ending_text}' instead of '{profile.ending_text}'")
+    return found
+
+def compare_column(profiles: Sequence[SourceProfile], language: str, texts: Sequence[str]) -> List[Sequence[str]]:
+    """compare_profile for a column of translations of one language.
+
+    Most translations end like their source, so those are settled on their
+    first and last characters without a call per translation.
+    """
+    found = []
+    ending_of = TERMINAL_PUNCTUATION.get
+    for profile, text in zip(profiles, texts):
+        last = text[-1:]
+        if (ending_of(last) == profile.ending and not profile.trailing_space and not last.isspace()
+                and text[:1].isspace() == profile.leading_space and (last != '.' or not text.endswith('...'))):
+            found.append(())
+        else:
+            found.append(compare_profile(profile, language, text))
+    return found
+
+def middle_length(lengths: List[int]) -> Optional[float]:
+    """Return the median of the non-zero lengths of a key, sorting them in place."""
+    lengths.sort()
+    # Empty values sort first and do not count
+    start = lengths.count(0)
+    count = len(lengths) - start
+    if count < OUTLIER_MIN_VALUES:
+        return None
+    middle = start + count // 2
+    return lengths[middle] if count % 2 else (lengths[middle - 1] + lengths[middle]) / 2
+
+def median_length(translations_data: Dict) -> Optional[float]:
+    """Return the median length of the non-empty values of a key."""
+    return middle_length([len(trans_data.get('value', '')) for trans_data in translations_data.values()])
+
+def is_outlier(length: int, median: Optional[float]) -> bool:
+    """Check whether a value is far longer than the other values of its key."""
+    return median is not None and length > OUTLIER_RATIO * median
+
+def describe_outlier(length: int, median: float) -> str:
+    """Describe how much longer an outlier is than its key's median."""
+    return f"{length / median:.1f}x the median length of the key"
@@ -1,5 +1,273 @@
+import codecs
+import itertools
 import json
-from typing import Dict, Optional
+import mmap
+from typing import Dict, FrozenSet, Iterator, Optional, Tuple
+from .translation_catalog import TranslationCatalog
+from .plural_rules import PLURAL_OTHER, plural_categories
+from .xcstrings_writer import write_xcstrings
+
+# Characters read from the file per refill of the streaming buffer
+STREAM_CHUNK_SIZE = 1 << 20
+JSON_WHITESPACE = ' \t\n\r'
+
+# (key, language, value, state) for one string unit in a catalog
+TranslationRecord = Tuple[str, str, str, str]
+# State given to the plural forms a language is missing, like Xcode's new strings
+MISSING_FORM_STATE = 'new'
+
+def variation_key(key: str, path: str) -> str:
+    """Return the entry key of a string unit, e.g. 'files[plural.one]'.
+
+    `path` joins the variation steps leading to the unit with '/', such as
+    'device.iphone/plural.one' or 'substitutions.count/plural.few'; units
+    of plain strings have an empty path and keep their key.
+    """
+    return f"{key}[{path}]" if path else key
+
+def split_variation_key(entry_key: str) -> Tuple[str, str]:
+    """Split an entry key into its key and variation path."""
+    if entry_key.endswith(']'):
+        key, _, path = entry_key[:-1].rpartition('[')
+        if path.startswith(('plural.', 'device.', 'substitutions.')):
+            return key, path
+    return entry_key, ''
+
+def iter_string_units(node: Dict, required_forms: Optional[FrozenSet[str]] = None,
+                      path: str = '') -> Iterator[Tuple[str, str, str]]:
+    """Yield (variation path, value, state) for every string unit of a localization.
+
+    Plural variations missing one of `required_forms` yield an empty unit
+    for that form, so incomplete plurals show up as missing translations.
+    """
+    unit = node.get('stringUnit')
+    if unit is not None:
+        yield path, unit.get('value', ''), unit.get('state', '')
+    prefix = path + '/' if path else ''
+    for kind, forms in node.get('variations', {}).items():
+        for form, child in forms.items():
+            yield from iter_string_units(child, required_forms, f"{prefix}{kind}.{form}")
+        if kind == 'plural' and required_forms is not None:
+            for form in sorted(required_forms.difference(forms)):
+                yield f"{prefix}plural.{form}", '', MISSING_FORM_STATE
+    for name, substitution in node.get('substitutions', {}).items():
+        yield from iter_string_units(substitution, required_forms, f"{prefix}substitutions.{name}")
+
+def source_paths(path: str) -> Iterator[str]:
+    """Yield the source variation paths a translated unit is compared with, best first.
+
+    The same path comes first, then the path with its plural forms replaced
+    by 'other', then the same for ever shorter prefixes of the path.
+    """
+    steps = path.split('/') if path else []
+    while True:
+        yield '/'.join(steps)
+        others = [f"plural.{PLURAL_OTHER}" if step.startswith('plural.') else step for step in steps]
+        if others != steps:
+            yield '/'.join(others)
+        if not steps:
+            return
+        steps.pop()
+
+def matching_source_path(available: Dict[str, object], path: str) -> Optional[str]:
+    """Return which of the source's variation paths a translated unit is compared with.
+
+    `available` maps the source's variation paths to its units; returns
+    None when the source has no units.
+    """
+    if not available:
+        return None
+    for candidate in source_paths(path):
+        if candidate in available:
+            return candidate
+    # Translated without the variations the source has; compare with its 'other' form
+    return next((source_path for source_path in available
+                 if all(step.endswith('.' + PLURAL_OTHER) for step in source_path.split('/')
+                        if step.startswith('plural.'))), next(iter(available)))
+
+def string_unit_nodes(node: Dict, path: str = '') -> Iterator[Tuple[str, Dict]]:
+    """Yield (variation path, stringUnit object) for every string unit of a localization, for editing."""
+    unit = node.get('stringUnit')
+    if unit is not None:
+        yield path, unit
+    prefix = path + '/' if path else ''
+    for kind, forms in node.get('variations', {}).items():
+        for form, child in forms.items():
+            yield from string_unit_nodes(child, f"{prefix}{kind}.{form}")
+    for name, substitution in node.get('substitutions', {}).items():
+        yield from string_unit_nodes(substitution, f"{prefix}substitutions.{name}")
+
+def flatten_variations(key: str, localizations: Dict, source_language: str) -> Iterator[TranslationRecord]:
+    """Yield a record per string unit of a key with variations or substitutions.
+
+    Every unit becomes an entry of its own, keyed by variation_key. Entries
+    the source language has no unit for get the source unit they are
+    compared with, e.g. its 'other' form for a plural form only some
+    languages have, so every form is validated against a matching source.
+    """
+    entries = {}
+    for lang, lang_data in localizations.items():
+        required_forms = None if lang == source_language else plural_categories(lang)
+        for path, value, state in iter_string_units(lang_data, required_forms):
+            entries.setdefault(path, {})[lang] = (value, state)
+
+    source_units = {path: units[source_language] for path, units in entries.items() if source_language in units}
+    for path, units in entries.items():
+        if source_language not in units and source_units:
+            source = source_units[matching_source_path(source_units, path)]
+            yield variation_key(key, path), source_language, source[0], source[1]
+        entry_key = variation_key(key, path)
+        for lang, (value, state) in units.items():
+            yield entry_key, lang, value, state
+
+def has_variations(localizations: Dict) -> bool:
+    """Check whether any localization of a key has variations or substitutions."""
+    return any('variations' in lang_data or 'substitutions' in lang_data for lang_data in localizations.values())
+
+class XcstringsReader:
+    """Incremental reader for .xcstrings files.
+
+    Only the top-level object and the "strings" object are walked by hand;
+    each string entry is decoded on its own, so memory stays bounded by the
+    largest single entry rather than the size of the catalog.
+    """
+
+    def __init__(self, file_path: str, use_mmap: bool = False, chunk_size: int = STREAM_CHUNK_SIZE):
+        self.file_path = file_path
+        self.use_mmap = use_mmap
+        self.chunk_size = chunk_size
+        self.source_language = None
+        # Number of keys read so far, including keys without string units
+        self.key_count = 0
+        self._decoder = json.JSONDecoder()
+        self._pending = iter(())
+        self._chunks = None
+        self._buffer = ''
+        self._pos = 0
+
+    def _read_chunks(self) -> Iterator[str]:
+        """Yield the decoded text of the file in chunks."""
+        if self.use_mmap:
+            with open(self.file_path, 'rb') as f:
+                if f.seek(0, 2) == 0:
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    # Chunks may split multi-byte characters; the incremental decoder joins them
+                    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+                    for offset in range(0, len(mapped), self.chunk_size):
+                        yield decoder.decode(mapped[offset:offset + self.chunk_size])
+                    yield decoder.decode(b'', final=True)
+        else:
+            with open(self.file_path, 'r', encoding='utf-8-sig') as f:
+                while True:
+                    chunk = f.read(self.chunk_size)
+                    if not chunk:
+                        return
+                    yield chunk
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer; False once the file is exhausted."""
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in JSON_WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be char."""
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' but found '{found}' in {self.file_path}")
+        self._pos += 1
+
+    def _decode(self):
+        """Decode the next complete JSON value, reading more of the file as needed."""
+        self._peek()
+        while True:
+            try:
+                value, self._pos = self._decoder.raw_decode(self._buffer, self._pos)
+                return value
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+
+    def _members(self) -> Iterator[str]:
+        """Yield the member names of the object at the current position.
+
+        The caller must consume each member's value before resuming.
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            name = self._decode()
+            self._expect(':')
+            yield name
+            separator = self._peek()
+            self._pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise ValueError(f"Expected ',' or '}}' but found '{separator}' in {self.file_path}")
+
+    def open(self) -> 'XcstringsReader':
+        """Start reading and resolve the source language."""
+        records = self.records()
+        # Xcode writes sourceLanguage before strings, so one record is enough to learn it
+        first = next(records, None)
+        if self.source_language is None:
+            # Otherwise it comes after the strings; scan ahead without keeping anything
+            scanner = XcstringsReader(self.file_path, use_mmap=self.use_mmap, chunk_size=self.chunk_size)
+            for _ in scanner.records():
+                pass
+            self.source_language = scanner.source_language or 'en'
+            # Variations are compared with source forms, so start over knowing the language
+            records.close()
+            self._pending = self.records()
+            return self
+        self._pending = itertools.chain([first] if first is not None else [], records)
+        return self
+
+    def __iter__(self) -> Iterator[TranslationRecord]:
+        return self._pending
+
+    def records(self) -> Iterator[TranslationRecord]:
+        """Yield a record for every string unit, in file order."""
+        self._chunks = self._read_chunks()
+        self._buffer = ''
+        self._pos = 0
+        self.key_count = 0
+        for name in self._members():
+            if name != 'strings':
+                value = self._decode()
+                if name == 'sourceLanguage':
+                    self.source_language = value
+                continue
+            for key in self._members():
+                string_data = self._decode()
+                self.key_count += 1
+                localizations = string_data.get('localizations', {})
+                if has_variations(localizations):
+                    yield from flatten_variations(key, localizations, self.source_language)
+                    continue
+                for lang, lang_data in localizations.items():
+                    if 'stringUnit' in lang_data:
+                        string_unit = lang_data['stringUnit']
+                        yield key, lang, string_unit.get('value', ''), string_unit.get('state', '')
+        if self._peek():
+            raise ValueError(f"Unexpected data after the catalog in {self.file_path}")
 
 class StringParser:
     @staticmethod
@@ -20,8 +288,13 @@ class StringParser:
         source_language = xcstrings_data.get('sourceLanguage', 'en')
         
         for key, string_data in xcstrings_data.get('strings', {}).items():
-            translations[key] = {}
             localizations = string_data.get('localizations', {})
+            if has_variations(localizations):
+                # One entry per plural/device form and substitution
+                for entry_key, lang, value, state in flatten_variations(key, localizations, source_language):
+                    translations.setdefault(entry_key, {})[lang] = {'value': value, 'state': state}
+                continue
+            translations[key] = {}
             
             for lang, lang_data in localizations.items():
                 if 'stringUnit' in lang_data:
@@ -31,3 +304,36 @@ class StringParser:
                     }
                     
         return translations, source_language
+
+    @staticmethod
+    def extract_catalog(xcstrings_data: Dict) -> TranslationCatalog:
+        """Extract translations from xcstrings data into a compact columnar catalog."""
+        catalog = TranslationCatalog(xcstrings_data.get('sourceLanguage', 'en'))
+
+        for key, string_data in xcstrings_data.get('strings', {}).items():
+            localizations = string_data.get('localizations', {})
+            if has_variations(localizations):
+                for entry_key, lang, value, state in flatten_variations(key, localizations, catalog.source_language):
+                    catalog.set(entry_key, lang, value, state)
+                continue
+            catalog.add_key(key)
+            for lang, lang_data in localizations.items():
+                if 'stringUnit' in lang_data:
+                    string_unit = lang_data['stringUnit']
+                    catalog.set(key, lang, string_unit.get('value', ''), string_unit.get('state', ''))
+
+        return catalog
+
+    @staticmethod
+    def write_xcstrings_file(xcstrings_data: Dict, file_path: str) -> None:
+        """Write xcstrings data to a file atomically, formatted the way Xcode saves catalogs."""
+        write_xcstrings(xcstrings_data, file_path)
+
+    @staticmethod
+    def stream_xcstrings_file(file_path: str, use_mmap: bool = False) -> XcstringsReader:
+        """Open an .xcstrings file for streaming.
+
+        The returned reader knows the catalog's source language and yields
+        (key, language, value, state) records as it reads the file.
+        """
+        return XcstringsReader(file_path, use_mmap=use_mmap).open()
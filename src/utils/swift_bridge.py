@@ -1,36 +1,165 @@
 import subprocess
 import json
 import os
-from typing import Dict, Any
+import itertools
+import threading
+from typing import Dict, Any, List, Optional
+
+# Environment variable that overrides where the helper binary is looked up
+HELPER_PATH_ENV = 'LOCALIZATION_HELPER_PATH'
+# Default location of the built helper, relative to the src directory
+DEFAULT_HELPER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'swift', 'LocalizationHelper', 'LocalizationHelper', 'LocalizationHelper'
+)
+# Seconds to wait for the helper to exit after its stdin is closed
+SHUTDOWN_TIMEOUT = 5.0
+# How many times a request is retried after the helper process dies
+MAX_RESTARTS = 1
+
+def find_helper(helper_path: Optional[str] = None) -> str:
+    """Return the path of the helper binary, raising FileNotFoundError if it does not exist.
+
+    An explicit path wins, then the environment, then the helper built in this checkout.
+    """
+    path = helper_path or os.environ.get(HELPER_PATH_ENV) or DEFAULT_HELPER_PATH
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"LocalizationHelper binary not found at {path}. Please build the Swift helper first."
+        )
+    return path
 
 class SwiftBridge:
-    def __init__(self):
-        # Find the root of the Git repository dynamically using git command
+    def __init__(self, helper_path: Optional[str] = None, persistent: bool = True):
+        self.helper_path = find_helper(helper_path)
+
+        # In persistent mode a single `LocalizationHelper serve` process is
+        # started lazily and reused for every request.
+        self.persistent = persistent
+        self._process = None
+        self._request_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self) -> None:
+        """Start the persistent helper process if it is not already running."""
+        if self._process is not None and self._process.poll() is None:
+            return
+        self._terminate()
+        self._process = subprocess.Popen(
+            [self.helper_path, "serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            bufsize=1
+        )
+        if not self._handshake():
+            # Helpers built before serve mode print usage text and exit
+            print(f"{self.helper_path} does not support serve mode; running one process per call")
+            self._terminate()
+            self.persistent = False
+
+    def _handshake(self) -> bool:
+        """Check that a newly started helper answers requests with JSON."""
+        try:
+            self._process.stdin.write(json.dumps({"id": 0, "command": "analyze", "args": [""]}) + "\n")
+            self._process.stdin.flush()
+            line = self._process.stdout.readline()
+        except OSError:
+            return False
         try:
-            repo_root = subprocess.check_output(['git', 'rev-parse', '--show-toplevel'], universal_newlines=True).strip()
-            if not repo_root:
-                raise ValueError("Git repository root could not be determined.")
-        except subprocess.CalledProcessError:
-            raise FileNotFoundError("This is not a Git repository. Please clone the repository first.")
-        
-        # Define the relative path to LocalizationHelper from the repository root
-        self.helper_path = os.path.join(repo_root, 'src', 'swift', 'LocalizationHelper', 'LocalizationHelper', 'LocalizationHelper')
-        
-        # Check if the helper exists at the derived path
-        if not os.path.exists(self.helper_path):
-            raise FileNotFoundError(
-                f"LocalizationHelper binary not found at {self.helper_path}. Please build the Swift helper first."
-            )
+            response = json.loads(line)
+        except ValueError:
+            return False
+        return isinstance(response, dict) and response.get("id") == 0
+
+    def close(self) -> None:
+        """Shut down the persistent helper process cleanly."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=SHUTDOWN_TIMEOUT)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        process.stdout.close()
+
+    def _terminate(self) -> None:
+        """Kill the helper process, e.g. after it crashed or desynchronized."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if process.poll() is None:
+            process.kill()
+        process.wait()
+        for stream in (process.stdin, process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+    def _send_request(self, command: str, args: List[str]) -> Dict[str, Any]:
+        """Send one request to the persistent helper and wait for its response."""
+        with self._lock:
+            request_id = next(self._request_ids)
+            request = json.dumps({"id": request_id, "command": command, "args": args}, ensure_ascii=False)
+
+            for _ in range(MAX_RESTARTS + 1):
+                self.start()
+                if not self.persistent:
+                    line = None
+                    break
+                try:
+                    self._process.stdin.write(request + "\n")
+                    self._process.stdin.flush()
+                    line = self._process.stdout.readline()
+                except OSError:
+                    line = ""
+                if line:
+                    break
+                # The helper died before answering; restart it and retry
+                self._terminate()
+            else:
+                raise RuntimeError("LocalizationHelper exited unexpectedly")
+
+            if line is None:
+                return self._run_once(command, args)
+            response = json.loads(line)
+            if response.get("id") != request_id:
+                self._terminate()
+                raise RuntimeError(f"Response id {response.get('id')} does not match request id {request_id}")
+
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return response["result"]
+
+    def _run(self, command: str, args: List[str]) -> Dict[str, Any]:
+        """Run a helper command, reusing the persistent process when enabled."""
+        if self.persistent:
+            return self._send_request(command, args)
+        return self._run_once(command, args)
+
+    def _run_once(self, command: str, args: List[str]) -> Dict[str, Any]:
+        """Run a helper command in a process of its own."""
+        result = subprocess.run(
+            [self.helper_path, command, *args],
+            capture_output=True,
+            text=True
+        )
+        return json.loads(result.stdout)
 
     def analyze_text(self, text: str, width: float = 375.0) -> Dict[str, Any]:
         """Analyze text using Swift helper."""
         try:
-            result = subprocess.run(
-                [self.helper_path, "analyze", text, str(width)],
-                capture_output=True,
-                text=True
-            )
-            return json.loads(result.stdout)
+            return self._run("analyze", [text, str(width)])
         except Exception as e:
             print(f"Error analyzing text: {e}")
             return {}
@@ -38,12 +167,7 @@ class SwiftBridge:
     def validate_translation(self, source: str, translation: str) -> Dict[str, Any]:
         """Validate translation using Swift helper."""
         try:
-            result = subprocess.run(
-                [self.helper_path, "validate", source, translation],
-                capture_output=True,
-                text=True
-            )
-            return json.loads(result.stdout)
+            return self._run("validate", [source, translation])
         except Exception as e:
             print(f"Error validating translation: {e}")
             return {}
@@ -51,12 +175,7 @@ class SwiftBridge:
     def check_layout(self, language: str, text: str) -> Dict[str, Any]:
         """Check layout considerations using Swift helper."""
         try:
-            result = subprocess.run(
-                [self.helper_path, "layout", language, text],
-                capture_output=True,
-                text=True
-            )
-            return json.loads(result.stdout)
+            return self._run("layout", [language, text])
         except Exception as e:
             print(f"Error checking layout: {e}")
             return {}
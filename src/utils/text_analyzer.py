@@ -1,62 +1,591 @@
-from typing import Dict, List
+import os
+import time
+from itertools import islice
+from operator import itemgetter
+from typing import AbstractSet, Dict, List, Iterable, Iterator, Optional, Sequence, Tuple
 from .swift_bridge import SwiftBridge
+from .python_backend import PythonBackend
+from .result_cache import ResultCache
+from .run_metrics import RunMetrics
+from .issue_store import CATEGORIES, Issue, IssueStore, format_issue, make_issue
+from .text_width import TruncationChecker
+from .source_profile import (OUTLIER_RATIO, SourceProfile, compare_column, compare_profile, describe_outlier,
+                             is_outlier, median_length, middle_length, profile_source)
+
+BACKENDS = ('auto', 'swift', 'python')
+# Translations longer than this multiple of the source are reported
+LENGTH_RATIO_THRESHOLD = 1.5
+# Catalogs are not split into shards smaller than this many keys
+MIN_SHARD_SIZE = 500
+# Shards per worker, so uneven shards still balance across the pool
+SHARDS_PER_JOB = 4
+# Keys analyzed together when consuming a record stream
+STREAM_CHUNK_KEYS = 10000
+# String unit states that need a translator's attention, with their report text
+REVIEW_STATES = {'stale': 'marked stale', 'needs_review': 'needs review'}
+
+def _analyze_shard(backend: str, translations: Dict, source_language: str,
+                   cache: Optional[ResultCache] = None, helper_path: Optional[str] = None,
+                   metrics: Optional[RunMetrics] = None,
+                   truncation: Optional[TruncationChecker] = None,
+                   key_languages: Optional[Dict[str, AbstractSet[str]]] = None) -> Tuple[List[Issue], int, int]:
+    """Analyze one shard of a catalog in a worker with its own backend.
+
+    Returns the issues with the worker's pair and unique pair counts.
+    """
+    analyzer = TextAnalyzer(backend=backend, cache=cache, helper_path=helper_path, metrics=metrics,
+                            truncation=truncation)
+    try:
+        records = analyzer.analyze_records(translations, source_language, key_languages)
+        return records, analyzer.pairs, analyzer.unique_pairs
+    finally:
+        analyzer.close()
 
 class TextAnalyzer:
-    def __init__(self):
-        self.swift_helper = SwiftBridge()
+    def __init__(self, backend: str = 'auto', jobs: int = 1, cache: Optional[ResultCache] = None,
+                 helper_path: Optional[str] = None, metrics: Optional[RunMetrics] = None,
+                 truncation: Optional[TruncationChecker] = None):
+        # Either a SwiftBridge or a PythonBackend; both expose the same methods
+        self.swift_helper = self._create_backend(backend, helper_path)
+        # Number of parallel workers for analyze_xcstrings; 0 uses every core
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        # Optional cache of per-pair backend results, shared across runs
+        self.cache = cache
+        # Optional instrumentation recording the latency of every backend call
+        self.metrics = metrics
+        # Optional UI width limits translations are measured against
+        self.truncation = truncation
+        # Translated pairs seen and distinct pairs actually sent to the backend
+        self.pairs = 0
+        self.unique_pairs = 0
+
+    @staticmethod
+    def _create_backend(backend: str, helper_path: Optional[str] = None):
+        """Create the analysis backend, falling back to Python when Swift is unavailable."""
+        if backend == 'python':
+            return PythonBackend()
+        if backend == 'swift':
+            return SwiftBridge(helper_path)
+        if backend == 'auto':
+            try:
+                bridge = SwiftBridge(helper_path)
+                bridge.start()
+                return bridge
+            except OSError:
+                # Helper missing, not built, or not runnable on this platform
+                return PythonBackend()
+        raise ValueError(f"Unknown analysis backend '{backend}'. Expected one of: {', '.join(BACKENDS)}")
+
+    def close(self) -> None:
+        """Release the analysis backend and flush the result cache."""
+        self.swift_helper.close()
+        if self.cache is not None:
+            self.cache.flush()
+
+    def _call_backend(self, kind: str, function, *args):
+        """Call the backend, timing the call when metrics are collected."""
+        if self.metrics is None:
+            return function(*args)
+        return self.metrics.timed_call(kind, function, *args)
+
+    def _cached(self, compute, kind: str, *parts: str) -> Dict:
+        """Return a cached backend result, computing and storing it on a miss."""
+        if self.cache is None:
+            return self._call_backend(kind, compute, *parts)
+        key = ResultCache.make_key(type(self.swift_helper).__name__, kind, *parts)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._call_backend(kind, compute, *parts)
+            # Empty results mean the backend failed; retry those next run
+            if result:
+                self.cache.put(key, result)
+        return result
 
     def analyze_translation(self, source_text: str, translated_text: str) -> Dict:
-        """Analyze translation using Swift helper."""
-        return self.swift_helper.validate_translation(source_text, translated_text)
+        """Analyze translation using the analysis backend."""
+        return self._cached(self.swift_helper.validate_translation, 'validate', source_text, translated_text)
 
     def analyze_layout(self, language: str, text: str) -> Dict:
         """Analyze layout considerations for a given language."""
-        return self.swift_helper.check_layout(language, text)
+        return self._cached(self.swift_helper.check_layout, 'layout', language, text)
+
+    def reset_dedup_stats(self) -> None:
+        """Start counting analyzed pairs from zero, e.g. at the start of a watch pass."""
+        self.pairs = 0
+        self.unique_pairs = 0
+
+    def dedup_stats(self) -> Dict[str, float]:
+        """Return how many translated pairs were analyzed and how many were duplicates."""
+        return {
+            "analyzed_pairs": self.pairs,
+            "unique_pairs": self.unique_pairs,
+            "dedup_ratio": round(1 - self.unique_pairs / self.pairs, 4) if self.pairs else 0.0
+        }
+
+    @staticmethod
+    def _new_issues() -> Dict[str, List[str]]:
+        """Return an empty issue dict with every category present."""
+        return {category: [] for category in CATEGORIES}
+
+    @staticmethod
+    def _profile(profiles: Dict[str, SourceProfile], source_text: str) -> SourceProfile:
+        """Return the profile of a source, computing it once per distinct source."""
+        profile = profiles.get(source_text)
+        if profile is None:
+            profile = profiles[source_text] = profile_source(source_text)
+        return profile
+
+    @staticmethod
+    def _inconsistencies(profile: SourceProfile, lang: str, text: str, median: Optional[float]) -> List[str]:
+        """Compare a translation with its source profile and with the other languages of its key."""
+        found = compare_profile(profile, lang, text)
+        if is_outlier(len(text), median):
+            found.append(describe_outlier(len(text), median))
+        return found
+
+    @staticmethod
+    def _state_problem(state: Optional[str], source_text: str, translated_text: str) -> Optional[str]:
+        """Describe what is wrong with the state of a translation, if anything."""
+        problem = REVIEW_STATES.get(state)
+        if (problem is None and state == 'translated' and translated_text == source_text
+                and any(char.isalpha() for char in translated_text)):
+            problem = 'marked translated but identical to the source'
+        return problem
+
+    @staticmethod
+    def _pair_issues(key: str, lang: str, length_ratio: float, specifiers_match: bool, is_rtl: bool,
+                     overflow: Optional[Dict[str, float]] = None, mismatches: Sequence[str] = (),
+                     inconsistencies: Sequence[str] = (), state_problem: Optional[str] = None) -> List[Issue]:
+        """Turn the analysis of one translation into issues.
+
+        `mismatches` describes what differs between the format specifiers,
+        when the backend reports it; `inconsistencies` what differs from the
+        source profile and the other languages of the key; `state_problem`
+        what is wrong with its string unit state.
+        """
+        found = []
+        # Check length issues
+        if length_ratio > LENGTH_RATIO_THRESHOLD:
+            found.append(make_issue(key, lang, 'length_issues', {'length_ratio': length_ratio}))
+
+        # Check the rendered width against the space of the key
+        if overflow is not None:
+            found.append(make_issue(key, lang, 'truncation_issues', overflow))
+
+        # Check format specifiers
+        if not specifiers_match:
+            found.append(make_issue(key, lang, 'format_issues',
+                                    {'mismatches': '; '.join(mismatches)} if mismatches else None))
+
+        # Check RTL considerations
+        if is_rtl:
+            found.append(make_issue(key, lang, 'rtl_issues'))
+
+        # Check the translation workflow state
+        if state_problem is not None:
+            found.append(make_issue(key, lang, 'state_issues', {'detail': state_problem}))
+
+        # Check whitespace, punctuation and length against the rest of the key
+        if inconsistencies:
+            found.append(make_issue(key, lang, 'consistency_issues', {'details': '; '.join(inconsistencies)}))
+        return found
+
+    @classmethod
+    def group_records(cls, records: Iterable[Issue]) -> Dict[str, List[str]]:
+        """Format issues into the per-category dict of report sentences."""
+        issues = cls._new_issues()
+        for issue in records:
+            issues.setdefault(issue.category, []).append(format_issue(issue))
+        return issues
 
     def analyze_xcstrings(self, translations: Dict, source_language: str) -> Dict:
         """Analyze all translations in an xcstrings file."""
-        issues = {
-            'missing_translations': [],
-            'length_issues': [],
-            'format_issues': [],
-            'rtl_issues': [],
-            'state_issues': []
-        }
+        return self.group_records(self.analyze_records(translations, source_language))
+
+    async def analyze_xcstrings_async(self, translations: Dict, source_language: str,
+                                      max_concurrency: Optional[int] = None,
+                                      timeout: Optional[float] = None) -> Dict:
+        """Analyze all translations with many Swift helper calls in flight at once.
+
+        Produces the same issues, in the same order, as analyze_xcstrings.
+        Up to `max_concurrency` helper processes run at the same time and
+        each call is abandoned after `timeout` seconds. The pure-Python
+        backend has nothing to wait on, so it analyzes the catalog directly.
+        """
+        return self.group_records(
+            await self.analyze_records_async(translations, source_language, max_concurrency, timeout)
+        )
+
+    async def analyze_records_async(self, translations: Dict, source_language: str,
+                                    max_concurrency: Optional[int] = None,
+                                    timeout: Optional[float] = None) -> List[Issue]:
+        """Async implementation behind analyze_xcstrings_async."""
+        if isinstance(self.swift_helper, PythonBackend):
+            return self.analyze_records(translations, source_language)
+
+        # Imported here so synchronous runs never load asyncio
+        import asyncio
+        from .async_swift_bridge import AsyncSwiftBridge, DEFAULT_CALL_TIMEOUT, DEFAULT_CONCURRENCY
 
+        bridge = AsyncSwiftBridge(
+            self.swift_helper.helper_path,
+            max_concurrency=max_concurrency or DEFAULT_CONCURRENCY,
+            timeout=timeout if timeout is not None else DEFAULT_CALL_TIMEOUT
+        )
+
+        # Cells in key-major order; None stands for a missing translation
+        cells = []
+        # Pending calls per (language, source, translation) and per (language, translation)
+        validations = {}
+        layouts = {}
+        profiles = {}
+        pairs = 0
         for key, translations_data in translations.items():
             source_text = translations_data.get(source_language, {}).get('value', '')
-            
+            profile = self._profile(profiles, source_text)
+            median = median_length(translations_data)
+
             for lang, trans_data in translations_data.items():
                 if lang == source_language:
                     continue
 
                 translated_text = trans_data.get('value', '')
                 if not translated_text:
-                    issues['missing_translations'].append(f"Missing translation for '{key}' in {lang}")
+                    cells.append((key, lang, None, None, None))
                     continue
 
-                # Analyze using Swift helper
-                analysis = self.analyze_translation(source_text, translated_text)
-                
-                # Check length issues
-                if analysis.get('lengthRatio', 1) > 1.5:
-                    issues['length_issues'].append(
-                        f"Text length issue in '{key}' for {lang}: "
-                        f"ratio {analysis['lengthRatio']:.2f}"
+                pairs += 1
+                cell = (lang, source_text, translated_text)
+                cells.append((key, lang, cell, self._inconsistencies(profile, lang, translated_text, median),
+                               self._state_problem(trans_data.get('state'), source_text, translated_text)))
+                if cell not in validations:
+                    validations[cell] = self._cached_async(
+                        bridge.validate_translation, 'validate', source_text, translated_text
                     )
-
-                # Check format specifiers
-                if not analysis.get('specifiersMatch', True):
-                    issues['format_issues'].append(
-                        f"Format specifier mismatch in '{key}' for {lang}"
+                if PythonBackend.is_rtl_language(lang) and (lang, translated_text) not in layouts:
+                    layouts[lang, translated_text] = self._cached_async(
+                        bridge.check_layout, 'layout', lang, translated_text
                     )
 
-                # Check RTL considerations
-                if lang.startswith(('ar', 'he', 'fa')):
-                    layout_analysis = self.analyze_layout(lang, translated_text)
-                    if layout_analysis.get('isRTL'):
-                        issues['rtl_issues'].append(
-                            f"RTL considerations needed for '{key}' in {lang}"
+        results = await asyncio.gather(*validations.values(), *layouts.values())
+        analyses = dict(zip(validations, results))
+        rtl = {layout: bool(result.get('isRTL')) for layout, result in zip(layouts, results[len(validations):])}
+
+        records = []
+        for key, lang, cell, inconsistencies, state_problem in cells:
+            if cell is None:
+                records.append(make_issue(key, lang, 'missing_translations'))
+                continue
+            analysis = analyses[cell]
+            records.extend(self._pair_issues(
+                key, lang,
+                analysis.get('lengthRatio', 1),
+                analysis.get('specifiersMatch', True),
+                rtl.get((lang, cell[2]), False),
+                self.truncation.check(key, cell[2]) if self.truncation is not None else None,
+                analysis.get('specifierMismatches', ()),
+                inconsistencies,
+                state_problem
+            ))
+
+        self.pairs += pairs
+        self.unique_pairs += len(validations)
+        return records
+
+    async def _cached_async(self, compute, kind: str, *parts: str) -> Dict:
+        """Async counterpart of _cached for AsyncSwiftBridge calls."""
+        if self.cache is not None:
+            # Cached under the synchronous backend's name, so both paths share entries
+            key = ResultCache.make_key(type(self.swift_helper).__name__, kind, *parts)
+            result = self.cache.get(key)
+            if result is not None:
+                return result
+        start = time.perf_counter()
+        result = await compute(*parts)
+        if self.metrics is not None:
+            self.metrics.record_call(kind, time.perf_counter() - start)
+        # Empty results mean the backend failed; retry those next run
+        if self.cache is not None and result:
+            self.cache.put(key, result)
+        return result
+
+    def analyze_issues(self, translations: Dict, source_language: str) -> IssueStore:
+        """Analyze all translations into an indexed issue store."""
+        return IssueStore(self.analyze_records(translations, source_language))
+
+    def analyze_records(self, translations: Dict, source_language: str,
+                        key_languages: Optional[Dict[str, AbstractSet[str]]] = None) -> List[Issue]:
+        """Analyze translations into a list of issues.
+
+        Issues come out in key-major order, which is the order of every
+        per-category list in analyze_xcstrings. Identical source and
+        translation pairs of a language are analyzed once and the result is
+        reused for every key that repeats them. `key_languages` restricts the
+        analysis of each key to the given target languages; the other
+        languages still count towards the key's median length.
+        """
+        if self.jobs > 1 and len(translations) >= 2 * MIN_SHARD_SIZE:
+            return self._parallel_records(translations, source_language, key_languages)
+        if isinstance(self.swift_helper, PythonBackend):
+            return self._batch_records(translations, source_language, key_languages=key_languages)
+
+        records = []
+        # Results per (language, source, translation) and per (language, translation)
+        validations = {}
+        layouts = {}
+        profiles = {}
+        pairs = 0
+
+        for key, translations_data in translations.items():
+            source_text = translations_data.get(source_language, {}).get('value', '')
+            # Source features and per-key statistics, computed once for every language
+            profile = self._profile(profiles, source_text)
+            median = median_length(translations_data)
+            wanted = key_languages.get(key, ()) if key_languages is not None else None
+            
+            for lang, trans_data in translations_data.items():
+                if lang == source_language or (wanted is not None and lang not in wanted):
+                    continue
+
+                translated_text = trans_data.get('value', '')
+                if not translated_text:
+                    records.append(make_issue(key, lang, 'missing_translations'))
+                    continue
+
+                # Analyze using the backend, once per distinct pair
+                pairs += 1
+                analysis = validations.get((lang, source_text, translated_text))
+                if analysis is None:
+                    analysis = validations[lang, source_text, translated_text] = self.analyze_translation(
+                        source_text, translated_text
+                    )
+                is_rtl = False
+                if PythonBackend.is_rtl_language(lang):
+                    is_rtl = layouts.get((lang, translated_text))
+                    if is_rtl is None:
+                        is_rtl = layouts[lang, translated_text] = bool(
+                            self.analyze_layout(lang, translated_text).get('isRTL')
                         )
 
-        return issues
+                records.extend(self._pair_issues(
+                    key, lang,
+                    analysis.get('lengthRatio', 1),
+                    analysis.get('specifiersMatch', True),
+                    is_rtl,
+                    self.truncation.check(key, translated_text) if self.truncation is not None else None,
+                    analysis.get('specifierMismatches', ()),
+                    self._inconsistencies(profile, lang, translated_text, median),
+                    self._state_problem(trans_data.get('state'), source_text, translated_text)
+                ))
+
+        self.pairs += pairs
+        self.unique_pairs += len(validations)
+        return records
+
+    def analyze_stream(self, records: Iterable[Tuple[str, str, str, str]], source_language: str,
+                       chunk_keys: int = STREAM_CHUNK_KEYS) -> Iterator[Issue]:
+        """Analyze a stream of (key, language, value, state) records.
+
+        Records of one key must be contiguous, as produced by
+        StringParser.stream_xcstrings_file. Keys are analyzed in chunks of
+        `chunk_keys`, so only one chunk is held in memory at a time.
+        """
+        chunk = {}
+        for key, lang, value, state in records:
+            entry = chunk.get(key)
+            if entry is None:
+                if len(chunk) >= chunk_keys:
+                    yield from self.analyze_records(chunk, source_language)
+                    chunk = {}
+                entry = chunk[key] = {}
+            entry[lang] = {'value': value, 'state': state}
+        if chunk:
+            yield from self.analyze_records(chunk, source_language)
+
+    def _validate_column(self, sources: List[str], translated: List[str],
+                         source_specifiers: Dict[str, List[str]]) -> Dict[str, Sequence]:
+        """Validate a column of pairs, in bulk when the backend supports it."""
+        if isinstance(self.swift_helper, PythonBackend):
+            return self._call_backend('validate_batch', self.swift_helper.validate_batch,
+                                      sources, translated, source_specifiers)
+
+        results = [self.analyze_translation(source, text) for source, text in zip(sources, translated)]
+        return {
+            'lengthRatio': [result.get('lengthRatio', 1) for result in results],
+            'specifiersMatch': [result.get('specifiersMatch', True) for result in results],
+            'specifierMismatches': [result.get('specifierMismatches', ()) for result in results]
+        }
+
+    def _check_rtl_column(self, lang: str, translated: List[str]) -> List[bool]:
+        """Check RTL layout for a column of translations in one language."""
+        if not PythonBackend.is_rtl_language(lang):
+            return [False] * len(translated)
+        if isinstance(self.swift_helper, PythonBackend):
+            # Direction only depends on the language, so the column shares one answer
+            return [True] * len(translated)
+        return [bool(self.analyze_layout(lang, text).get('isRTL')) for text in translated]
+
+    def analyze_xcstrings_batch(self, translations: Dict, source_language: str,
+                                languages: Optional[Iterable[str]] = None) -> Dict:
+        """Analyze translations one language column at a time.
+
+        Produces the same issues, in the same order, as the per-pair path.
+        `languages` restricts the analysis to a subset of target languages.
+        """
+        return self.group_records(self._batch_records(translations, source_language, languages))
+
+    def _batch_records(self, translations: Dict, source_language: str,
+                       languages: Optional[Iterable[str]] = None,
+                       key_languages: Optional[Dict[str, AbstractSet[str]]] = None) -> List[Issue]:
+        """Column-wise implementation behind analyze_xcstrings_batch.
+
+        `key_languages` restricts the languages per key, as in analyze_records.
+        """
+        languages = set(languages) if languages is not None else None
+        # Every record is tagged with the position of its cell in key-major
+        # order so the records can be put back into serial order at the end.
+        ordered = []
+        columns = {}
+        profiles = {}
+        # Median value length of every key that has one, gathered in the same pass
+        medians = {}
+        # Position -> state problem of the cells that have one
+        state_problems = {}
+
+        position = 0
+        for key, translations_data in translations.items():
+            source_text = translations_data.get(source_language, {}).get('value', '')
+            self._profile(profiles, source_text)
+            lengths = [len(source_text)]
+            wanted = key_languages.get(key, ()) if key_languages is not None else languages
+
+            for lang, trans_data in translations_data.items():
+                if lang == source_language:
+                    continue
+                translated_text = trans_data.get('value', '')
+                lengths.append(len(translated_text))
+                if wanted is not None and lang not in wanted:
+                    continue
+
+                if not translated_text:
+                    ordered.append((position, make_issue(key, lang, 'missing_translations')))
+                else:
+                    column = columns.get(lang)
+                    if column is None:
+                        column = columns[lang] = ([], [], [], [])
+                    column[0].append(position)
+                    column[1].append(key)
+                    column[2].append(source_text)
+                    column[3].append(translated_text)
+                    state = trans_data.get('state')
+                    # Most cells are translated and differ from their source
+                    if state != 'translated' or translated_text == source_text:
+                        problem = self._state_problem(state, source_text, translated_text)
+                        if problem is not None:
+                            state_problems[position] = problem
+                position += 1
+
+            median = middle_length(lengths)
+            if median is not None:
+                medians[key] = median
+
+        # Sources were parsed for their profiles; the backend reuses that
+        source_specifiers = {text: profile.format for text, profile in profiles.items()}
+        for lang, (positions, keys, sources, translated) in columns.items():
+            # Distinct (source, translation) pairs of the column in first-seen
+            # order, and the slot of every cell among them
+            unique = {}
+            slots = [unique.setdefault(pair, len(unique)) for pair in zip(sources, translated)]
+            self.pairs += len(slots)
+            self.unique_pairs += len(unique)
+            if len(unique) < len(slots):
+                sources = [source for source, _ in unique]
+                translated = [text for _, text in unique]
+            results = self._validate_column(sources, translated, source_specifiers)
+            rtl = self._check_rtl_column(lang, translated)
+            length_ratios, specifiers = results['lengthRatio'], results['specifiersMatch']
+            mismatches = results['specifierMismatches']
+            consistency = compare_column(list(map(profiles.__getitem__, sources)), lang, translated)
+            truncation = self.truncation
+            for position, key, slot in zip(positions, keys, slots):
+                length_ratio, specifiers_match, is_rtl = length_ratios[slot], specifiers[slot], rtl[slot]
+                overflow = truncation.check(key, translated[slot]) if truncation is not None else None
+                inconsistencies = consistency[slot]
+                median = medians.get(key)
+                if median is not None and len(translated[slot]) > OUTLIER_RATIO * median:
+                    inconsistencies = [*inconsistencies, describe_outlier(len(translated[slot]), median)]
+                state_problem = state_problems.get(position) if state_problems else None
+                if (length_ratio <= LENGTH_RATIO_THRESHOLD and specifiers_match and not is_rtl
+                        and overflow is None and not inconsistencies and state_problem is None):
+                    continue
+                for issue in self._pair_issues(key, lang, length_ratio, specifiers_match, is_rtl, overflow,
+                                               mismatches[slot], inconsistencies, state_problem):
+                    ordered.append((position, issue))
+
+        # The sort is stable, so issues of one cell keep their category order
+        ordered.sort(key=itemgetter(0))
+        return [record for _, record in ordered]
+
+    @staticmethod
+    def _shard(translations: Dict, shard_count: int) -> List[Dict]:
+        """Split translations into contiguous key ranges, preserving key order."""
+        shard_size = -(-len(translations) // shard_count)
+        items = iter(translations.items())
+        shards = []
+        while True:
+            shard = dict(islice(items, shard_size))
+            if not shard:
+                return shards
+            shards.append(shard)
+
+    def analyze_xcstrings_parallel(self, translations: Dict, source_language: str) -> Dict:
+        """Analyze translations across a pool of workers.
+
+        Keys are split into contiguous shards and the per-shard results are
+        concatenated in shard order, giving the same result as the serial path.
+        The Python backend is CPU-bound and runs in a process pool; the Swift
+        backend does its work in helper processes, so threads are enough and
+        each worker thread drives its own helper.
+        """
+        return self.group_records(self._parallel_records(translations, source_language))
+
+    def _parallel_records(self, translations: Dict, source_language: str,
+                          key_languages: Optional[Dict[str, AbstractSet[str]]] = None) -> List[Issue]:
+        """Pool-based implementation behind analyze_xcstrings_parallel."""
+        # Imported here to keep multiprocessing out of serial runs and startup
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        shard_count = max(1, min(self.jobs * SHARDS_PER_JOB, len(translations) // MIN_SHARD_SIZE))
+        shards = self._shard(translations, shard_count)
+        # Each worker only needs the languages of its own keys
+        shard_languages = ([{key: key_languages[key] for key in shard if key in key_languages} for shard in shards]
+                           if key_languages is not None else [None] * len(shards))
+
+        if isinstance(self.swift_helper, PythonBackend):
+            # Batch analysis is cheaper than cache lookups, so workers go
+            # uncached; their backend calls are not timed across processes
+            backend, executor_class, cache, helper_path, metrics = 'python', ProcessPoolExecutor, None, None, None
+        else:
+            backend, executor_class, cache, metrics = 'swift', ThreadPoolExecutor, self.cache, self.metrics
+            helper_path = self.swift_helper.helper_path
+
+        records = []
+        with executor_class(max_workers=min(self.jobs, len(shards))) as executor:
+            results = executor.map(
+                _analyze_shard,
+                [backend] * len(shards),
+                shards,
+                [source_language] * len(shards),
+                [cache] * len(shards),
+                [helper_path] * len(shards),
+                [metrics] * len(shards),
+                [self.truncation] * len(shards),
+                shard_languages
+            )
+            # Shards deduplicate independently, so pairs repeated across
+            # shards count once per shard
+            for shard_records, pairs, unique_pairs in results:
+                records.extend(shard_records)
+                self.pairs += pairs
+                self.unique_pairs += unique_pairs
+        return records
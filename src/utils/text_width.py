@@ -0,0 +1,177 @@
+import json
+import math
+import unicodedata
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
+from .python_backend import NEWLINE_PATTERN
+from .string_parser import split_variation_key
+
+# Advances of the printable ASCII characters in Helvetica, in 1/1000 em.
+# iOS and macOS system fonts are close enough to estimate label widths.
+HELVETICA_ADVANCES = dict(zip(
+    ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~',
+    (278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+     556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+     1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+     667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+     333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+     556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584)
+))
+# Fonts available without a glyph table file; "system" stands for SF Pro
+BUILTIN_FONTS = {'system': HELVETICA_ADVANCES, 'helvetica': HELVETICA_ADVANCES}
+# Advance of characters a table does not list, in 1/1000 em
+DEFAULT_ADVANCE = 556
+# Advance of full-width characters such as CJK ideographs and kana
+WIDE_ADVANCE = 1000
+# Point size of UILabel text when a width limit does not name one
+DEFAULT_FONT_SIZE = 17.0
+
+class GlyphTable:
+    """Glyph advances of one font in font units.
+
+    Characters missing from the table get an advance derived from their
+    Unicode properties the first time they are measured, which is then
+    stored in the table, so every distinct character is classified once.
+    """
+
+    __slots__ = ('name', 'units_per_em', 'advances', 'default')
+
+    def __init__(self, name: str, advances: Dict[str, float], units_per_em: float = 1000,
+                 default: float = DEFAULT_ADVANCE):
+        self.name = name
+        self.units_per_em = units_per_em
+        self.advances = dict(advances)
+        self.default = default
+
+    def advance(self, char: str) -> float:
+        """Return the advance of a character, classifying it on first use."""
+        advance = self.advances.get(char)
+        if advance is None:
+            if unicodedata.combining(char) or unicodedata.category(char) in ('Mn', 'Me', 'Cf'):
+                # Combining marks and format controls take no horizontal space
+                advance = 0
+            elif unicodedata.east_asian_width(char) in ('W', 'F'):
+                advance = WIDE_ADVANCE * self.units_per_em / 1000
+            else:
+                # Accented letters are as wide as their base letter
+                base = unicodedata.normalize('NFD', char)[0]
+                advance = self.advances.get(base, self.default) if base != char else self.default
+            self.advances[char] = advance
+        return advance
+
+    def line_width(self, line: str) -> float:
+        """Return the advance of a line of text in font units."""
+        try:
+            return sum(map(self.advances.__getitem__, line))
+        except KeyError:
+            return sum(map(self.advance, line))
+
+@lru_cache(maxsize=None)
+def load_glyph_table(font: str) -> GlyphTable:
+    """Load a glyph table once per process.
+
+    `font` is the name of a built-in font or the path of a JSON file with
+    `advances` (character -> advance) and optional `unitsPerEm` and `default`.
+    """
+    if font in BUILTIN_FONTS:
+        return GlyphTable(font, BUILTIN_FONTS[font])
+    with open(font, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return GlyphTable(
+        font, data['advances'],
+        units_per_em=data.get('unitsPerEm', 1000),
+        default=data.get('default', DEFAULT_ADVANCE * data.get('unitsPerEm', 1000) / 1000)
+    )
+
+class TextWidthEstimator:
+    """Estimates the rendered width of strings from glyph advance tables.
+
+    Line widths are memoized per (text, font) in font units, so the same
+    string is only measured once whatever point sizes it is checked at.
+    """
+
+    def __init__(self, font: str = 'system', size: float = DEFAULT_FONT_SIZE):
+        self.font = font
+        self.size = size
+        self._line_widths = {}
+
+    def line_widths(self, text: str, font: Optional[str] = None) -> Tuple[float, ...]:
+        """Return the width of every line of text in font units."""
+        font = font or self.font
+        widths = self._line_widths.get((text, font))
+        if widths is None:
+            widths = tuple(map(load_glyph_table(font).line_width, NEWLINE_PATTERN.split(text)))
+            self._line_widths[text, font] = widths
+        return widths
+
+    def scale(self, font: Optional[str] = None, size: Optional[float] = None) -> float:
+        """Return the points per font unit of a font at a point size."""
+        return (size or self.size) / load_glyph_table(font or self.font).units_per_em
+
+    def measure(self, text: str, font: Optional[str] = None, size: Optional[float] = None) -> float:
+        """Return the width of the widest line of text in points."""
+        return max(self.line_widths(text, font)) * self.scale(font, size)
+
+    def line_count(self, text: str, width: float, font: Optional[str] = None,
+                   size: Optional[float] = None) -> int:
+        """Return how many lines text wraps to in a label `width` points wide."""
+        scale = self.scale(font, size)
+        return sum(max(1, math.ceil(line * scale / width)) for line in self.line_widths(text, font))
+
+class WidthLimit(NamedTuple):
+    """Space available to the text of one key."""
+    width: float
+    font: str = 'system'
+    size: float = DEFAULT_FONT_SIZE
+    lines: int = 1
+
+class TruncationChecker:
+    """Flags translations that do not fit the UI space of their key.
+
+    Keys without a limit of their own use the default limit, if any;
+    plural and device variations use the limit of their key.
+    """
+
+    def __init__(self, default: Optional[WidthLimit] = None, limits: Optional[Dict[str, WidthLimit]] = None,
+                 estimator: Optional[TextWidthEstimator] = None):
+        self.default = default
+        self.limits = limits or {}
+        self.estimator = estimator or TextWidthEstimator()
+
+    @classmethod
+    def from_file(cls, path: str) -> 'TruncationChecker':
+        """Load limits from a JSON file.
+
+        The file gives a default `width`, `font`, `size` and `lines`, and
+        per-key limits under `keys`, each either a width or an object with
+        any of those fields.
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        defaults = {field: config[field] for field in WidthLimit._fields if field in config}
+        default = WidthLimit(**defaults) if 'width' in defaults else None
+
+        limits = {}
+        for key, limit in config.get('keys', {}).items():
+            if not isinstance(limit, dict):
+                limit = {'width': limit}
+            limits[key] = WidthLimit(**dict(defaults, **limit))
+        return cls(default, limits)
+
+    def check(self, key: str, text: str) -> Optional[Dict[str, float]]:
+        """Return the measured and available width if text overflows, else None."""
+        limit = self.limits.get(key)
+        if limit is None:
+            limit = self.limits.get(split_variation_key(key)[0], self.default)
+        if limit is None:
+            return None
+        if limit.lines == 1:
+            text_width = self.estimator.measure(text, limit.font, limit.size)
+            if text_width <= limit.width:
+                return None
+        else:
+            if self.estimator.line_count(text, limit.width, limit.font, limit.size) <= limit.lines:
+                return None
+            # Total width of the wrapped text against the space of all its lines
+            text_width = sum(self.estimator.line_widths(text, limit.font)) * self.estimator.scale(limit.font, limit.size)
+        return {'text_width': text_width, 'max_width': limit.width * limit.lines}
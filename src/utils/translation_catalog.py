@@ -0,0 +1,185 @@
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from .coverage_index import CoverageIndex
+
+# State codes of the string unit states Xcode writes; unknown states get
+# further codes assigned per catalog as they are seen.
+KNOWN_STATES = ('', 'new', 'translated', 'needs_review', 'stale')
+# Code stored for cells that have no string unit
+ABSENT = -1
+
+class TranslationCatalog:
+    """Columnar store of extracted translations.
+
+    Keys and languages are interned into index tables. Each language has one
+    value column (a list indexed by key, None where absent) and one state
+    column of small integer codes. Compared with a dict per cell this takes a
+    fraction of the memory and makes per-language iteration cheap.
+    """
+
+    __slots__ = ('source_language', 'keys', 'languages', 'state_names',
+                 '_key_index', '_language_index', '_state_codes', '_values', '_states')
+
+    def __init__(self, source_language: str = 'en'):
+        self.source_language = source_language
+        self.keys = []
+        self.languages = []
+        self.state_names = list(KNOWN_STATES)
+        self._key_index = {}
+        self._language_index = {}
+        self._state_codes = {name: code for code, name in enumerate(KNOWN_STATES)}
+        self._values = []
+        self._states = []
+
+    @classmethod
+    def from_records(cls, records: Iterable[Tuple[str, str, str, str]],
+                     source_language: str = 'en') -> 'TranslationCatalog':
+        """Build a catalog from (key, language, value, state) records."""
+        catalog = cls(source_language)
+        for key, lang, value, state in records:
+            catalog.set(key, lang, value, state)
+        return catalog
+
+    @classmethod
+    def from_translations(cls, translations: Dict, source_language: str = 'en') -> 'TranslationCatalog':
+        """Build a catalog from the nested dict returned by extract_translations."""
+        catalog = cls(source_language)
+        for key, translations_data in translations.items():
+            catalog.add_key(key)
+            for lang, trans_data in translations_data.items():
+                catalog.set(key, lang, trans_data.get('value', ''), trans_data.get('state', ''))
+        return catalog
+
+    def add_key(self, key: str) -> int:
+        """Register a key, even one without translations, and return its index."""
+        index = self._key_index.get(key)
+        if index is None:
+            index = self._key_index[key] = len(self.keys)
+            self.keys.append(sys.intern(key))
+        return index
+
+    def _language(self, lang: str) -> int:
+        """Return the column index of a language, adding an empty column if needed."""
+        index = self._language_index.get(lang)
+        if index is None:
+            index = self._language_index[lang] = len(self.languages)
+            self.languages.append(lang)
+            self._values.append([])
+            self._states.append(array('b'))
+        return index
+
+    def _state_code(self, state: str) -> int:
+        code = self._state_codes.get(state)
+        if code is None:
+            code = self._state_codes[state] = len(self.state_names)
+            self.state_names.append(state)
+        return code
+
+    def set(self, key: str, lang: str, value: str, state: str = '') -> None:
+        """Store the value and state of one cell."""
+        # Lookups are inlined; this runs once per cell of the catalog
+        row = self._key_index.get(key)
+        if row is None:
+            row = self.add_key(key)
+        column = self._language_index.get(lang)
+        if column is None:
+            column = self._language(lang)
+        code = self._state_codes.get(state)
+        if code is None:
+            code = self._state_code(state)
+        # Repeated short strings ("OK", "Cancel") share one object
+        if len(value) <= 32:
+            value = sys.intern(value)
+
+        values = self._values[column]
+        states = self._states[column]
+        size = len(values)
+        if row == size:
+            values.append(value)
+            states.append(code)
+            return
+        # Columns grow lazily, so languages only used by a few keys stay small
+        if row > size:
+            values.extend([None] * (row - size + 1))
+            states.extend([ABSENT] * (row - size + 1))
+        values[row] = value
+        states[row] = code
+
+    def get(self, key: str, lang: str) -> Optional[Tuple[str, str]]:
+        """Return (value, state) of a cell, or None if it has no string unit."""
+        row = self._key_index.get(key)
+        column = self._language_index.get(lang)
+        if row is None or column is None or row >= len(self._values[column]):
+            return None
+        value = self._values[column][row]
+        if value is None:
+            return None
+        return value, self.state_names[self._states[column][row]]
+
+    def entry(self, key: str) -> Dict[str, Dict[str, str]]:
+        """Return the translations of one key in the old {lang: {'value', 'state'}} shape."""
+        row = self._key_index[key]
+        entry = {}
+        for lang, values, states in zip(self.languages, self._values, self._states):
+            if row < len(values) and values[row] is not None:
+                entry[lang] = {'value': values[row], 'state': self.state_names[states[row]]}
+        return entry
+
+    def iter_language(self, lang: str) -> Iterator[Tuple[str, str, str]]:
+        """Yield (key, value, state) for every cell present in one language."""
+        column = self._language_index.get(lang)
+        if column is None:
+            return
+        keys = self.keys
+        state_names = self.state_names
+        for row, (value, code) in enumerate(zip(self._values[column], self._states[column])):
+            if value is not None:
+                yield keys[row], value, state_names[code]
+
+    def coverage(self) -> CoverageIndex:
+        """Index which keys every language has a string unit and a translation for, and their states."""
+        # State codes are small and ABSENT is -1, so the state arrays are already coverage columns
+        return CoverageIndex.from_columns(
+            self.keys, dict(zip(self.languages, self._values)),
+            {lang: states.tobytes() for lang, states in zip(self.languages, self._states)},
+            self.state_names, self.source_language
+        )
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._key_index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys)
+
+    def as_translations(self) -> 'TranslationsView':
+        """Return a read-only view in the shape produced by extract_translations."""
+        return TranslationsView(self)
+
+class TranslationsView(Mapping):
+    """Dict-shaped adapter over a TranslationCatalog.
+
+    Per-key dicts are built on access, so code written against
+    Dict[key, Dict[lang, {'value', 'state'}]] works without the catalog
+    ever materializing that structure.
+    """
+
+    __slots__ = ('catalog',)
+
+    def __init__(self, catalog: TranslationCatalog):
+        self.catalog = catalog
+
+    def __getitem__(self, key: str) -> Dict[str, Dict[str, str]]:
+        if key not in self.catalog:
+            raise KeyError(key)
+        return self.catalog.entry(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.catalog)
+
+    def __len__(self) -> int:
+        return len(self.catalog)
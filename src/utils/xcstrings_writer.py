@@ -0,0 +1,150 @@
+import os
+import re
+from json.encoder import encode_basestring
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Xcode indents string catalogs by two spaces and separates names from values with ' : '
+INDENT = '  '
+NAME_SEPARATOR = ' : '
+_DIGIT_RUNS = re.compile(r'(\d+)')
+
+def member_order(name: str) -> Tuple:
+    """Sort key of an object member in Xcode's order.
+
+    Xcode sorts members case-insensitively, comparing runs of digits by
+    their value, and breaks ties by the exact text.
+    """
+    parts = _DIGIT_RUNS.split(name.casefold())
+    # Split alternates text and digits, so the digit runs are the odd parts
+    parts[1::2] = [int(digits) for digits in parts[1::2]]
+    return parts, name
+
+def insert_member(obj: Dict, name: str, value: Any) -> None:
+    """Set a member of an object, putting a new member where Xcode's sorted order puts it.
+
+    Existing members keep their order, so a file written by Xcode only
+    changes where the member is added.
+    """
+    if name in obj:
+        obj[name] = value
+        return
+    order = member_order(name)
+    items = list(obj.items())
+    position = next((index for index, (other, _) in enumerate(items) if member_order(other) > order), len(items))
+    items.insert(position, (name, value))
+    # Reorder in place, since the object is referenced from its parent
+    obj.clear()
+    obj.update(items)
+
+def _encode(value: Any, indent: str, parts: List[str]) -> None:
+    """Append the Xcode-formatted JSON of a value to parts."""
+    if isinstance(value, str):
+        parts.append(encode_basestring(value))
+    elif isinstance(value, dict):
+        if not value:
+            # Xcode writes empty objects with a blank line inside
+            parts.append('{\n\n' + indent + '}')
+            return
+        inner = indent + INDENT
+        separator = '{\n' + inner
+        for name, item in value.items():
+            parts.append(separator)
+            parts.append(encode_basestring(name))
+            parts.append(NAME_SEPARATOR)
+            if isinstance(item, str):
+                parts.append(encode_basestring(item))
+            else:
+                _encode(item, inner, parts)
+            separator = ',\n' + inner
+        parts.append('\n' + indent + '}')
+    elif isinstance(value, list):
+        if not value:
+            parts.append('[\n\n' + indent + ']')
+            return
+        inner = indent + INDENT
+        separator = '[\n' + inner
+        for item in value:
+            parts.append(separator)
+            _encode(item, inner, parts)
+            separator = ',\n' + inner
+        parts.append('\n' + indent + ']')
+    elif value is True:
+        parts.append('true')
+    elif value is False:
+        parts.append('false')
+    elif value is None:
+        parts.append('null')
+    elif isinstance(value, int):
+        parts.append(int.__repr__(value))
+    elif isinstance(value, float):
+        parts.append(float.__repr__(value))
+    else:
+        raise TypeError(f"Object of type {type(value).__name__} cannot be written to a string catalog")
+
+def iter_xcstrings(xcstrings_data: Dict) -> Iterator[str]:
+    """Yield the Xcode-formatted text of a catalog in chunks, one per string entry.
+
+    Members are written in the order they are stored, which for a catalog
+    read with json.load is the order of the file, so rewriting a file saved
+    by Xcode reproduces it byte for byte.
+    """
+    if not xcstrings_data:
+        yield '{\n\n}'
+        return
+    separator = '{\n' + INDENT
+    for name, value in xcstrings_data.items():
+        parts = [separator, encode_basestring(name), NAME_SEPARATOR]
+        separator = ',\n' + INDENT
+        if name != 'strings' or not isinstance(value, dict) or not value:
+            _encode(value, INDENT, parts)
+            yield ''.join(parts)
+            continue
+        # The strings object holds nearly all of the catalog; yield it entry by entry
+        inner = INDENT * 2
+        entry_separator = '{\n' + inner
+        for key, string_data in value.items():
+            parts.append(entry_separator)
+            parts.append(encode_basestring(key))
+            parts.append(NAME_SEPARATOR)
+            _encode(string_data, inner, parts)
+            yield ''.join(parts)
+            parts = []
+            entry_separator = ',\n' + inner
+        yield '\n' + INDENT + '}'
+    # Xcode does not end the file with a newline
+    yield '\n}'
+
+def format_xcstrings(xcstrings_data: Dict) -> str:
+    """Return the Xcode-formatted text of a catalog."""
+    return ''.join(iter_xcstrings(xcstrings_data))
+
+def write_xcstrings(xcstrings_data: Dict, file_path: str) -> None:
+    """Write a catalog atomically in Xcode's formatting.
+
+    The text is streamed to a temporary file next to file_path, which then
+    replaces it, so readers see either the old or the new catalog and an
+    interrupted write leaves the old one in place. A replaced file keeps
+    its permissions.
+    """
+    # Imported here so reading catalogs never loads tempfile
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    try:
+        mode = os.stat(file_path).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+
+    handle, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(file_path)}.", suffix='.tmp', dir=directory)
+    try:
+        with open(handle, 'w', encoding='utf-8', newline='') as f:
+            f.writelines(iter_xcstrings(xcstrings_data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
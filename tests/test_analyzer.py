@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import MagicMock
 from src.utils.text_analyzer import TextAnalyzer
+from src.utils.python_backend import PythonBackend
 
 class TestTextAnalyzer(unittest.TestCase):
     def setUp(self):
@@ -49,7 +50,7 @@ class TestTextAnalyzer(unittest.TestCase):
             'specifiersMatch': True
         }
 
-        issues = self.analyze_xcstrings(translations, "en")
+        issues = self.analyzer.analyze_xcstrings(translations, "en")
         
         self.assertIn("Missing translation for 'greeting' in fr", issues['missing_translations'])
         self.assertEqual(len(issues['length_issues']), 0)
@@ -70,7 +71,7 @@ class TestTextAnalyzer(unittest.TestCase):
             'specifiersMatch': True
         }
 
-        issues = self.analyze_xcstrings(translations, "en")
+        issues = self.analyzer.analyze_xcstrings(translations, "en")
         
         self.assertIn("Text length issue in 'greeting' for fr: ratio 2.00", issues['length_issues'])
         self.assertEqual(len(issues['missing_translations']), 0)
@@ -91,7 +92,7 @@ class TestTextAnalyzer(unittest.TestCase):
             'specifiersMatch': False
         }
 
-        issues = self.analyze_xcstrings(translations, "en")
+        issues = self.analyzer.analyze_xcstrings(translations, "en")
         
         self.assertIn("Format specifier mismatch in 'welcome_message' for fr", issues['format_issues'])
         self.assertEqual(len(issues['missing_translations']), 0)
@@ -115,12 +116,209 @@ class TestTextAnalyzer(unittest.TestCase):
             'isRTL': True
         }
 
-        issues = self.analyze_xcstrings(translations, "en")
+        issues = self.analyzer.analyze_xcstrings(translations, "en")
         
         self.assertIn("RTL considerations needed for 'welcome_message' in ar", issues['rtl_issues'])
         self.assertEqual(len(issues['missing_translations']), 0)
         self.assertEqual(len(issues['length_issues']), 0)
         self.assertEqual(len(issues['format_issues']), 0)
 
+    def test_python_backend_selection(self):
+        """Test explicit selection of the in-process backend."""
+        analyzer = TextAnalyzer(backend='python')
+        self.assertIsInstance(analyzer.swift_helper, PythonBackend)
+
+        issues = analyzer.analyze_xcstrings({
+            "welcome_message": {
+                "en": {"value": "Welcome %@"},
+                "fr": {"value": "Bienvenue %d"}
+            }
+        }, "en")
+        self.assertIn("Format specifier mismatch in 'welcome_message' for fr: argument 1 changed type: %@ became %d",
+                      issues['format_issues'])
+
+    def test_batch_matches_serial(self):
+        """Test that column-wise batch analysis reports the same issues as the per-pair path."""
+        translations = {
+            "greeting": {
+                "en": {"value": "Hello %@"},
+                "ar": {"value": "مرحبا %@"},
+                "fr": {"value": "Bonjour %d"}
+            },
+            "farewell": {
+                "fr": {"value": "Au revoir"},
+                "en": {"value": "Bye"},
+                "de": {"value": ""},
+                "ar": {"value": "مع السلامة"}
+            }
+        }
+        self.analyzer.swift_helper = MagicMock(wraps=PythonBackend())
+        serial = self.analyzer.analyze_xcstrings(translations, "en")
+
+        batch = TextAnalyzer(backend='python').analyze_xcstrings_batch(translations, "en")
+
+        self.assertEqual(serial, batch)
+        self.assertEqual(batch['rtl_issues'], [
+            "RTL considerations needed for 'greeting' in ar",
+            "RTL considerations needed for 'farewell' in ar"
+        ])
+        self.assertEqual(len(batch['length_issues']), 2)
+
+    def test_batch_language_subset(self):
+        """Test restricting batch analysis to selected languages."""
+        translations = {
+            "greeting": {
+                "en": {"value": "Hello"},
+                "fr": {"value": ""},
+                "es": {"value": ""}
+            }
+        }
+        issues = TextAnalyzer(backend='python').analyze_xcstrings_batch(translations, "en", languages=["es"])
+
+        self.assertEqual(issues['missing_translations'], ["Missing translation for 'greeting' in es"])
+
+    def test_parallel_matches_serial(self):
+        """Test that sharded parallel analysis merges issues in serial order."""
+        translations = {
+            f"key_{i}": {
+                "en": {"value": f"Item %d of {i}"},
+                "fr": {"value": "" if i % 7 == 0 else f"Élément %d sur {i}"},
+                "ar": {"value": f"عنصر %@ من {i}" if i % 5 == 0 else f"عنصر %d من {i}"},
+                "de": {"value": f"Das ist ein sehr langer Eintrag Nummer {i}" if i % 3 == 0 else f"Eintrag %d {i}"}
+            }
+            for i in range(1200)
+        }
+        serial = TextAnalyzer(backend='python').analyze_xcstrings(translations, "en")
+        parallel = TextAnalyzer(backend='python', jobs=2).analyze_xcstrings_parallel(translations, "en")
+
+        self.assertEqual(serial, parallel)
+
+    def test_shard_preserves_order(self):
+        """Test that sharding splits keys into ordered contiguous ranges."""
+        translations = {f"key_{i}": {} for i in range(10)}
+        shards = TextAnalyzer._shard(translations, 3)
+
+        self.assertEqual([len(shard) for shard in shards], [4, 4, 2])
+        self.assertEqual([key for shard in shards for key in shard], list(translations))
+
+    def test_analyze_stream(self):
+        """Test that chunked stream analysis matches whole-catalog analysis."""
+        translations = {
+            f"key_{i}": {
+                "en": {"value": f"Item %d {i}", "state": "translated"},
+                "fr": {"value": "" if i % 3 == 0 else f"Élément %@ {i}", "state": "translated"}
+            }
+            for i in range(10)
+        }
+        records = [
+            (key, lang, data["value"], data["state"])
+            for key, langs in translations.items()
+            for lang, data in langs.items()
+        ]
+        analyzer = TextAnalyzer(backend='python')
+
+        streamed = TextAnalyzer.group_records(analyzer.analyze_stream(iter(records), "en", chunk_keys=3))
+
+        self.assertEqual(streamed, analyzer.analyze_xcstrings(translations, "en"))
+
+    def test_duplicate_pairs_analyzed_once(self):
+        """Test that repeated pairs reach the backend once and share their issues."""
+        translations = {
+            f"button_{i}": {
+                "en": {"value": "OK"},
+                "ar": {"value": "موافق"},
+                "fr": {"value": "D'accord, c'est bon"}
+            }
+            for i in range(4)
+        }
+        self.analyzer.swift_helper = MagicMock(wraps=PythonBackend())
+
+        issues = self.analyzer.analyze_xcstrings(translations, "en")
+
+        self.assertEqual(self.analyzer.swift_helper.validate_translation.call_count, 2)
+        self.assertEqual(self.analyzer.swift_helper.check_layout.call_count, 1)
+        self.assertEqual(len(issues['length_issues']), 8)
+        self.assertEqual(len(issues['rtl_issues']), 4)
+        self.assertEqual(self.analyzer.dedup_stats(), {
+            "analyzed_pairs": 8,
+            "unique_pairs": 2,
+            "dedup_ratio": 0.75
+        })
+        self.analyzer.reset_dedup_stats()
+        self.assertEqual(self.analyzer.dedup_stats()["analyzed_pairs"], 0)
+
+    def test_batch_dedup_matches_serial(self):
+        """Test that deduplicated batch analysis matches the per-pair path."""
+        translations = {
+            f"key_{i}": {
+                "en": {"value": "Cancel" if i % 2 else "Delete %d items"},
+                "fr": {"value": "Annuler" if i % 2 else "Supprimer %@ éléments"},
+                "de": {"value": "Abbrechen" if i % 2 else ""}
+            }
+            for i in range(6)
+        }
+        self.analyzer.swift_helper = MagicMock(wraps=PythonBackend())
+        serial = self.analyzer.analyze_xcstrings(translations, "en")
+        analyzer = TextAnalyzer(backend='python')
+
+        self.assertEqual(analyzer.analyze_xcstrings(translations, "en"), serial)
+        self.assertEqual(analyzer.dedup_stats(), self.analyzer.dedup_stats())
+        self.assertEqual(analyzer.dedup_stats()["unique_pairs"], 3)
+
+    def test_consistency_issues(self):
+        """Test whitespace, punctuation and length outliers against the rest of the key."""
+        translations = {
+            "name": {
+                "en": {"value": "Name: "},
+                "fr": {"value": "Nom :"},
+                "de": {"value": "Name: "},
+                "ja": {"value": "名前："}
+            },
+            "save": {
+                "en": {"value": "Save"},
+                "fr": {"value": "Enregistrer les modifications de ce document maintenant"},
+                "de": {"value": "Sichern"},
+                "es": {"value": "Guardar"}
+            }
+        }
+        self.analyzer.swift_helper = MagicMock(wraps=PythonBackend())
+        serial = self.analyzer.analyze_xcstrings(translations, "en")
+
+        self.assertEqual(serial['consistency_issues'], [
+            "Inconsistent translation of 'name' in fr: trailing whitespace dropped",
+            "Inconsistent translation of 'name' in ja: trailing whitespace dropped",
+            "Inconsistent translation of 'save' in fr: 7.9x the median length of the key"
+        ])
+        self.assertEqual(TextAnalyzer(backend='python').analyze_xcstrings(translations, "en"), serial)
+
+    def test_state_issues(self):
+        """Test that review states and untranslated copies are reported on every path."""
+        translations = {
+            "title": {
+                "en": {"value": "Settings", "state": "translated"},
+                "fr": {"value": "Réglages", "state": "stale"},
+                "de": {"value": "Settings", "state": "translated"},
+                "es": {"value": "Ajustes", "state": "needs_review"}
+            },
+            "version": {
+                "en": {"value": "1.0", "state": "translated"},
+                "fr": {"value": "1.0", "state": "translated"}
+            }
+        }
+        self.analyzer.swift_helper = MagicMock(wraps=PythonBackend())
+        serial = self.analyzer.analyze_xcstrings(translations, "en")
+
+        self.assertEqual(serial['state_issues'], [
+            "Translation state issue in 'title' for fr: marked stale",
+            "Translation state issue in 'title' for de: marked translated but identical to the source",
+            "Translation state issue in 'title' for es: needs review"
+        ])
+        self.assertEqual(TextAnalyzer(backend='python').analyze_xcstrings(translations, "en"), serial)
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend name is rejected."""
+        with self.assertRaises(ValueError):
+            TextAnalyzer(backend='ruby')
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,78 @@
+import asyncio
+import time
+import unittest
+from src.utils.async_swift_bridge import AsyncSwiftBridge
+from src.utils.text_analyzer import TextAnalyzer
+from tests import get_test_data_path
+
+class TestAsyncSwiftBridge(unittest.TestCase):
+    def setUp(self):
+        """Set up AsyncSwiftBridge against the stub helper."""
+        self.bridge = AsyncSwiftBridge(helper_path=get_test_data_path('stub_helper.py'), max_concurrency=4)
+
+    def test_validate_translation(self):
+        """Test translation validation through a helper process."""
+        result = asyncio.run(self.bridge.validate_translation("Hello %@", "Bonjour %d"))
+
+        self.assertFalse(result['specifiersMatch'])
+        self.assertEqual(result['lengthRatio'], len("Bonjour %d") / len("Hello %@"))
+
+    def test_concurrent_calls(self):
+        """Test that calls up to the concurrency limit run at the same time."""
+        async def run():
+            start = time.perf_counter()
+            results = await asyncio.gather(*(self.bridge._run("sleep", ["0.5"]) for _ in range(4)))
+            return results, time.perf_counter() - start
+
+        results, elapsed = asyncio.run(run())
+
+        self.assertEqual(results, [{'slept': 0.5}] * 4)
+        self.assertLess(elapsed, 1.5)
+
+    def test_timeout(self):
+        """Test that a call exceeding its timeout is abandoned."""
+        bridge = AsyncSwiftBridge(helper_path=get_test_data_path('stub_helper.py'), timeout=0.2)
+
+        start = time.perf_counter()
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(bridge._run("sleep", ["5"]))
+        self.assertLess(time.perf_counter() - start, 3)
+
+    def test_cancellation(self):
+        """Test that cancelling a call ends it without waiting for the helper."""
+        async def run():
+            task = asyncio.ensure_future(self.bridge._run("sleep", ["5"]))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        start = time.perf_counter()
+        asyncio.run(run())
+        self.assertLess(time.perf_counter() - start, 3)
+
+    def test_invalid_concurrency(self):
+        """Test that a concurrency limit below one is rejected."""
+        with self.assertRaises(ValueError):
+            AsyncSwiftBridge(helper_path=get_test_data_path('stub_helper.py'), max_concurrency=0)
+
+    def test_async_analysis_matches_serial(self):
+        """Test that async catalog analysis reports the same issues as the serial path."""
+        translations = {
+            f"key_{i}": {
+                "en": {"value": "OK" if i % 2 else f"Delete %d items {i}"},
+                "fr": {"value": "D'accord" if i % 2 else f"Supprimer %@ éléments {i}"},
+                "ar": {"value": "" if i % 3 == 0 else "موافق"}
+            }
+            for i in range(8)
+        }
+        analyzer = TextAnalyzer(backend='swift', helper_path=get_test_data_path('stub_helper.py'))
+        self.addCleanup(analyzer.close)
+
+        issues = asyncio.run(analyzer.analyze_xcstrings_async(translations, "en", max_concurrency=8))
+
+        self.assertEqual(issues, analyzer.analyze_xcstrings(translations, "en"))
+        self.assertEqual(len(issues['rtl_issues']), 5)
+
+if __name__ == '__main__':
+    unittest.main()
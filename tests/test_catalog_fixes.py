@@ -0,0 +1,102 @@
+import unittest
+from src.utils.catalog_fixes import (FIXED_STATE, PSEUDO_LANGUAGE, CatalogFix, apply_fixes, fix_translation,
+                                     pseudo_localize, pseudo_text)
+from src.utils.format_specifiers import check_translation, parse_source
+
+class TestCatalogFixes(unittest.TestCase):
+    def setUp(self):
+        """Set up a catalog with dropped specifiers, whitespace drift and a plural."""
+        self.xcstrings_data = {
+            "sourceLanguage": "en",
+            "strings": {
+                "welcome": {
+                    "localizations": {
+                        "en": {"stringUnit": {"state": "translated", "value": "Welcome, %@!"}},
+                        "fr": {"stringUnit": {"state": "translated", "value": "Bienvenue ! "}},
+                        "de": {"stringUnit": {"state": "translated", "value": "Willkommen, %@!"}}
+                    }
+                },
+                "files": {
+                    "localizations": {
+                        "en": {"variations": {"plural": {
+                            "one": {"stringUnit": {"state": "translated", "value": "%lld file"}},
+                            "other": {"stringUnit": {"state": "translated", "value": "%lld files"}}
+                        }}},
+                        "fr": {"variations": {"plural": {
+                            "one": {"stringUnit": {"state": "translated", "value": "%lld fichier"}},
+                            "many": {"stringUnit": {"value": "fichiers"}},
+                            "other": {"stringUnit": {"state": "translated", "value": "%lld fichiers"}}
+                        }}}
+                    }
+                },
+                "Legacy": {"shouldTranslate": False, "localizations": {
+                    "fr": {"stringUnit": {"state": "translated", "value": "Ancien "}}
+                }}
+            },
+            "version": "1.0"
+        }
+
+    def test_fix_translation(self):
+        """Test that dropped specifiers are restored and trailing whitespace follows the source."""
+        self.assertEqual(fix_translation("Hello %@", "Bonjour"), ("Bonjour %@", ("format_specifiers",)))
+        self.assertEqual(fix_translation("%d of %d", "%d sur"), ("%d sur %d", ("format_specifiers",)))
+        self.assertEqual(fix_translation("%1$@ and %2$@", "%2$@ et"), ("%2$@ et %1$@", ("format_specifiers",)))
+        self.assertEqual(fix_translation("%2$@ of %1$d", "Rien"), ("Rien %d %@", ("format_specifiers",)))
+        self.assertEqual(fix_translation("%2$@ items", "Éléments"), ("Éléments", ()))
+        self.assertEqual(fix_translation("Name ", "Nom"), ("Nom ", ("trailing_whitespace",)))
+        self.assertEqual(fix_translation("%@ files ", "fichiers"),
+                         ("fichiers %@ ", ("format_specifiers", "trailing_whitespace")))
+        # Restoring the first argument would need positional specifiers
+        self.assertEqual(fix_translation("%@ of %d", "sur %d"), ("sur %d", ()))
+        self.assertEqual(fix_translation("%@ and %d", "%d et"), ("%d et", ()))
+        self.assertEqual(fix_translation("Name", ""), ("", ()))
+
+    def test_percent_signs(self):
+        """Test that percent signs in text are never restored as specifiers."""
+        self.assertEqual(fix_translation("100% done", "Terminé à 100 pour cent"), ("Terminé à 100 pour cent", ()))
+        self.assertEqual(fix_translation("Save 20% on all items", "Jetzt sparen"), ("Jetzt sparen", ()))
+        self.assertEqual(fix_translation("100 % terminé", "Done"), ("Done", ()))
+        # A source with a bare % next to a real specifier is left to a translator
+        self.assertEqual(fix_translation("%d% off", "Rabatt"), ("Rabatt", ()))
+        self.assertEqual(fix_translation("%d%% off", "Rabatt"), ("Rabatt %d", ("format_specifiers",)))
+
+    def test_apply_fixes(self):
+        """Test that fixes are applied in place and fixed units are marked for review."""
+        fixes = apply_fixes(self.xcstrings_data)
+        strings = self.xcstrings_data["strings"]
+
+        self.assertEqual(fixes, [
+            CatalogFix("welcome", "fr", ("format_specifiers", "trailing_whitespace")),
+            CatalogFix("files[plural.many]", "fr", ("format_specifiers",))
+        ])
+        self.assertEqual(strings["welcome"]["localizations"]["fr"]["stringUnit"],
+                         {"state": FIXED_STATE, "value": "Bienvenue ! %@"})
+        # The form French adds is restored from the source's 'other' form; the state goes before the value
+        many = strings["files"]["localizations"]["fr"]["variations"]["plural"]["many"]["stringUnit"]
+        self.assertEqual(list(many.items()), [("state", FIXED_STATE), ("value", "fichiers %lld")])
+        self.assertEqual(strings["welcome"]["localizations"]["de"]["stringUnit"]["state"], "translated")
+        self.assertEqual(strings["Legacy"]["localizations"]["fr"]["stringUnit"]["value"], "Ancien ")
+        self.assertEqual(apply_fixes(self.xcstrings_data), [])
+
+    def test_pseudo_text(self):
+        """Test that pseudo-localized text is accented and expanded but keeps its specifiers."""
+        pseudo = pseudo_text("Delete %@?")
+        self.assertEqual(pseudo, "[Ðéļéţé %@? ~~~~~~~~~~]")
+        self.assertEqual(check_translation(parse_source("Delete %@?"), pseudo), [])
+        self.assertEqual(pseudo_text(" 100%% done\n"), " [100%% ðöñé ~~~~~~~~~~]\n")
+        long_text = "Your photos are backed up to the cloud every night while charging."
+        self.assertGreater(len(pseudo_text(long_text)), 1.3 * len(long_text))
+        self.assertEqual(pseudo_text(""), "")
+
+    def test_pseudo_localize(self):
+        """Test that every translatable key gets a pseudo-localization, forms included."""
+        self.assertEqual(pseudo_localize(self.xcstrings_data), 2)
+        localizations = self.xcstrings_data["strings"]["files"]["localizations"]
+
+        self.assertEqual(list(localizations), ["en", PSEUDO_LANGUAGE, "fr"])
+        plural = localizations[PSEUDO_LANGUAGE]["variations"]["plural"]
+        self.assertEqual(plural["other"]["stringUnit"], {"state": "translated", "value": "[%lld ƒîļéš ~~~~~~~~~~]"})
+        self.assertNotIn(PSEUDO_LANGUAGE, self.xcstrings_data["strings"]["Legacy"]["localizations"])
+
+if __name__ == '__main__':
+    unittest.main()
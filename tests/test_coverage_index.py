@@ -0,0 +1,95 @@
+import unittest
+from src.utils.coverage_index import CoverageIndex, iter_rows, popcount
+from src.utils.string_parser import StringParser
+from src.utils.translation_catalog import TranslationCatalog
+
+class TestCoverageIndex(unittest.TestCase):
+    def setUp(self):
+        """Set up a catalog where fr lacks a key entirely and de has an empty value."""
+        self.translations = {
+            "greeting": {"en": {"value": "Hello"}, "fr": {"value": "Bonjour"}, "de": {"value": "Hallo"}},
+            "farewell": {"en": {"value": "Bye"}, "de": {"value": ""}},
+            "thanks": {"en": {"value": "Thanks"}, "fr": {"value": "Merci"}, "de": {"value": "Danke"}},
+            "empty": {}
+        }
+
+    def test_bitsets(self):
+        """Test the bitset helpers."""
+        self.assertEqual(list(iter_rows(0b101001)), [0, 3, 5])
+        self.assertEqual(list(iter_rows(0)), [])
+        self.assertEqual(popcount(0b101001), 3)
+
+    def test_missing_and_completion(self):
+        """Test per-language missing keys and completion, counting absent languages."""
+        coverage = CoverageIndex.from_translations(self.translations, "en")
+
+        self.assertEqual(coverage.languages, ["en", "fr", "de"])
+        self.assertEqual(coverage.missing_keys("fr"), ["farewell", "empty"])
+        self.assertEqual(coverage.missing_keys("de"), ["farewell", "empty"])
+        self.assertEqual(coverage.key_names(coverage.absent("de")), ["empty"])
+        self.assertEqual(coverage.completion("fr"), 50.0)
+        self.assertEqual(coverage.completion_by_language(), {"fr": 50.0, "de": 50.0})
+        self.assertEqual(coverage.missing_counts(), {"fr": 2, "de": 2})
+        self.assertEqual(coverage.key_names(coverage.missing_anywhere()), ["farewell", "empty"])
+        self.assertEqual(list(coverage.absent_cells()), [("farewell", "fr"), ("empty", "fr"), ("empty", "de")])
+
+    def test_catalog_coverage(self):
+        """Test that a catalog's columns give the same index as the nested dict."""
+        catalog = TranslationCatalog.from_translations(self.translations, "en")
+        expected = CoverageIndex.from_translations(self.translations, "en")
+        coverage = catalog.coverage()
+
+        self.assertEqual(coverage.keys, expected.keys)
+        for lang in expected.languages:
+            self.assertEqual(coverage.missing(lang), expected.missing(lang))
+            self.assertEqual(coverage.absent(lang), expected.absent(lang))
+        self.assertEqual(list(coverage.absent_cells()), list(expected.absent_cells()))
+
+    def test_states(self):
+        """Test per-language state counts and keys from the catalog's state columns."""
+        self.translations["greeting"]["fr"]["state"] = "stale"
+        self.translations["thanks"]["fr"]["state"] = "needs_review"
+        self.translations["thanks"]["de"]["state"] = "stale"
+        coverage = TranslationCatalog.from_translations(self.translations, "en").coverage()
+
+        self.assertEqual(coverage.state_counts("stale"), {"fr": 1, "de": 1})
+        self.assertEqual(coverage.state_counts("needs_review"), {"fr": 1, "de": 0})
+        self.assertEqual(coverage.state_keys("de", "stale"), ["thanks"])
+        self.assertEqual(coverage.state_keys("fr", "unknown"), [])
+
+    def test_variations(self):
+        """Test that plural forms and device variations a language does not need are not missing."""
+        plural = {"variations": {"plural": {
+            "one": {"stringUnit": {"state": "translated", "value": "%lld file"}},
+            "other": {"stringUnit": {"state": "translated", "value": "%lld files"}}
+        }}}
+        coverage = StringParser.extract_catalog({"sourceLanguage": "en", "strings": {
+            "files": {"localizations": {
+                "en": plural,
+                "ja": {"variations": {"plural": {"other": {"stringUnit": {"state": "translated", "value": "%lld 件"}}}}}
+            }},
+            "tap": {"localizations": {
+                "en": {"variations": {"device": {
+                    "iphone": {"stringUnit": {"state": "translated", "value": "Tap"}},
+                    "mac": {"stringUnit": {"state": "translated", "value": "Click"}}
+                }}},
+                "ja": {"stringUnit": {"state": "translated", "value": "タップ"}}
+            }},
+            "photos": {"localizations": {"en": plural}}
+        }}).coverage()
+
+        self.assertEqual(coverage.completion("ja"), 66.67)
+        self.assertEqual(coverage.key_names(coverage.missing_anywhere()), ["photos[plural.other]"])
+        self.assertEqual(list(coverage.absent_cells()), [("photos[plural.other]", "ja")])
+
+    def test_add_invalidates_bitsets(self):
+        """Test that cells added after a query are seen by the next one."""
+        coverage = CoverageIndex.from_translations(self.translations, "en")
+        self.assertEqual(coverage.completion("fr"), 50.0)
+
+        coverage.add("farewell", "fr", "Au revoir")
+
+        self.assertEqual(coverage.missing_keys("fr"), ["empty"])
+
+if __name__ == '__main__':
+    unittest.main()
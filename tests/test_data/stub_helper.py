@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Stand-in for the LocalizationHelper binary used by the test suite.
+Speaks the same command line and `serve` protocol as the Swift helper.
+"""
+
+import json
+import os
+import re
+import sys
+import time
+
+SPECIFIER_PATTERN = re.compile(r'%[0-9]*(@|d|f|s)')
+
+def analyze(text):
+    return {
+        'length': len(text),
+        'lines': len(text.splitlines()) or 1,
+        'words': len(text.split()),
+        'hasDirectionalOverrides': any(c in text for c in '\u202a\u202b\u202c\u202d\u202e'),
+        'formatSpecifiers': [m.group(0) for m in SPECIFIER_PATTERN.finditer(text)],
+        'pid': os.getpid()
+    }
+
+def validate(source, translation):
+    source_specifiers = analyze(source)['formatSpecifiers']
+    translated_specifiers = analyze(translation)['formatSpecifiers']
+    ratio = len(translation) / len(source) if source else 1.0
+    recommendations = []
+    if ratio > 1.5:
+        recommendations.append(f"Translation is {int(ratio * 100)}% longer than source - consider shortening")
+    if source_specifiers != translated_specifiers:
+        recommendations.append("Format specifiers don't match - please verify")
+    return {
+        'lengthRatio': ratio,
+        'specifiersMatch': source_specifiers == translated_specifiers,
+        'recommendation': '; '.join(recommendations) or 'No issues found'
+    }
+
+def layout(language, text):
+    return {
+        'isRTL': language.startswith(('ar', 'he', 'fa')),
+        'textAnalysis': analyze(text)
+    }
+
+def sleep(seconds):
+    # Slow request, for exercising timeouts and concurrency
+    time.sleep(float(seconds))
+    return {'slept': float(seconds)}
+
+COMMANDS = {'analyze': analyze, 'validate': validate, 'layout': layout, 'sleep': sleep}
+
+def handle(command, args):
+    if command == 'crash':
+        sys.exit(1)
+    if command == 'analyze':
+        args = args[:1]
+    return COMMANDS[command](*args)
+
+def serve():
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        response = {'id': request.get('id')}
+        try:
+            response['result'] = handle(request.get('command'), request.get('args', []))
+        except (KeyError, TypeError) as e:
+            response['error'] = f"Invalid request: {e}"
+        print(json.dumps(response), flush=True)
+
+if __name__ == '__main__':
+    if sys.argv[1] == 'serve' and os.environ.get('STUB_HELPER_NO_SERVE'):
+        # Behave like a helper built before serve mode existed
+        print(f"Unknown command: {sys.argv[1]}")
+        sys.exit(1)
+    if sys.argv[1] == 'serve':
+        serve()
+    else:
+        print(json.dumps(handle(sys.argv[1], sys.argv[2:])))
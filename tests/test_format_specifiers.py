@@ -0,0 +1,88 @@
+import unittest
+from src.utils.format_specifiers import (FormatSpecifier, SpecifierChecker, SpecifierMismatch,
+                                         check_translation_specifiers, compare_specifiers, parse_source,
+                                         parse_specifiers)
+
+class TestParseSpecifiers(unittest.TestCase):
+    def test_conversions(self):
+        """Test argument types of common conversions and length modifiers."""
+        self.assertEqual(parse_specifiers("%@ has %d of %lld, %.2f%% done"), (
+            FormatSpecifier(1, 'object', '%@'),
+            FormatSpecifier(2, 'int', '%d'),
+            FormatSpecifier(3, 'long', '%lld'),
+            FormatSpecifier(4, 'double', '%.2f')
+        ))
+
+    def test_positional(self):
+        """Test that explicit positions are ordered by argument index."""
+        self.assertEqual(parse_specifiers("%2$@ by %1$ld"), (
+            FormatSpecifier(1, 'long', '%1$ld'),
+            FormatSpecifier(2, 'object', '%2$@')
+        ))
+
+    def test_width_and_precision(self):
+        """Test flags, widths and star arguments."""
+        self.assertEqual(parse_specifiers("%-5d"), (FormatSpecifier(1, 'int', '%-5d'),))
+        self.assertEqual(parse_specifiers("%*.3f"), (
+            FormatSpecifier(1, 'int', '*'),
+            FormatSpecifier(2, 'double', '%*.3f')
+        ))
+
+    def test_plain_text(self):
+        """Test that text without specifiers and literal percents consume no arguments."""
+        self.assertEqual(parse_specifiers("Hello"), ())
+        self.assertEqual(parse_specifiers("100%%"), ())
+
+    def test_percent_signs(self):
+        """Test that percent signs followed by whitespace are text, not arguments."""
+        self.assertEqual(parse_specifiers("50% off"), ())
+        self.assertEqual(parse_specifiers("100% done"), ())
+        self.assertEqual(parse_specifiers("100 % terminé"), ())
+        self.assertEqual(parse_specifiers("%d% off"), (FormatSpecifier(1, 'int', '%d'),))
+
+class TestCompareSpecifiers(unittest.TestCase):
+    def setUp(self):
+        self.checker = SpecifierChecker()
+
+    def test_match(self):
+        """Test equivalent specifiers that differ in spelling."""
+        self.assertEqual(self.checker.check("%@ and %d", "%1$@ et %2$i"), [])
+        self.assertEqual(self.checker.check("%d items", "%5d éléments"), [])
+        self.assertEqual(self.checker.check("%1$@ by %2$@", "%2$@ von %1$@"), [])
+
+    def test_missing_and_extra(self):
+        """Test arguments dropped from or added to a translation."""
+        self.assertEqual(self.checker.check("%@ has %d", "%@ a"),
+                         [SpecifierMismatch('missing', 2, '%d', None)])
+        self.assertEqual(self.checker.check("Hello", "Bonjour %@"),
+                         [SpecifierMismatch('extra', 1, None, '%@')])
+        self.assertEqual(self.checker.check("%1$@ has %2$d", "Rien"),
+                         [SpecifierMismatch('missing', 1, '%1$@', None), SpecifierMismatch('missing', 2, '%2$d', None)])
+
+    def test_translation_specifiers(self):
+        """Test that the check also returns the parsed specifiers of the translation."""
+        source = parse_source("%@ has %d")
+        self.assertEqual(check_translation_specifiers(source, "%@ a %d"), ([], source.specifiers))
+        self.assertEqual(check_translation_specifiers(source, "%@ a"),
+                         ([SpecifierMismatch('missing', 2, '%d', None)], (FormatSpecifier(1, 'object', '%@'),)))
+
+    def test_type_changed(self):
+        """Test an argument read with another type."""
+        self.assertEqual(self.checker.check("%d files", "%lld fichiers"),
+                         [SpecifierMismatch('type_changed', 1, '%d', '%lld')])
+
+    def test_reordered(self):
+        """Test swapped arguments without positional specifiers."""
+        mismatches = self.checker.check("%@ has %d", "%d hat %@")
+
+        self.assertEqual([mismatch.kind for mismatch in mismatches], ['reordered', 'reordered'])
+        self.assertEqual(mismatches[0].describe(), "argument 1 reordered: %@ became %d")
+
+    def test_source_cache(self):
+        """Test that each source is parsed once."""
+        first = self.checker.source_format("%@ items")
+        self.assertIs(self.checker.source_format("%@ items"), first)
+        self.assertEqual(compare_specifiers(first.specifiers, parse_specifiers("%@ éléments")), [])
+
+if __name__ == '__main__':
+    unittest.main()
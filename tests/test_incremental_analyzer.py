@@ -0,0 +1,107 @@
+import unittest
+from unittest.mock import MagicMock
+from src.utils.incremental_analyzer import IncrementalAnalyzer
+from src.utils.python_backend import PythonBackend
+from src.utils.text_analyzer import TextAnalyzer
+
+class TestIncrementalAnalyzer(unittest.TestCase):
+    def setUp(self):
+        """Set up an incremental analyzer over a spied Python backend."""
+        self.analyzer = TextAnalyzer(backend='python')
+        self.analyzer.swift_helper = MagicMock(wraps=PythonBackend())
+        self.incremental = IncrementalAnalyzer(self.analyzer)
+        self.translations = {
+            "greeting": {
+                "en": {"value": "Hello %@", "state": "translated"},
+                "fr": {"value": "Bonjour %d", "state": "translated"},
+                "ar": {"value": "مرحبا %@", "state": "translated"}
+            },
+            "farewell": {
+                "en": {"value": "Bye", "state": "translated"},
+                "fr": {"value": "", "state": "new"}
+            }
+        }
+
+    def _copy(self):
+        return {key: {lang: dict(data) for lang, data in langs.items()} for key, langs in self.translations.items()}
+
+    def test_diff(self):
+        """Test detection of changed keys and languages."""
+        new = self._copy()
+        new["greeting"]["fr"]["value"] = "Bonjour %@"
+        new["farewell"]["en"]["value"] = "Goodbye"
+        new["thanks"] = {"en": {"value": "Thanks"}, "de": {"value": "Danke"}}
+
+        changed = IncrementalAnalyzer.diff(self.translations, new, "en")
+
+        self.assertEqual(changed, {"greeting": {"fr"}, "farewell": {"fr"}, "thanks": {"de"}})
+
+    def test_update_reanalyzes_only_changes(self):
+        """Test that an update only re-validates changed entries and matches a full pass."""
+        self.incremental.update(self.translations, "en")
+        self.assertEqual(self.incremental.issues(), self.analyzer.analyze_xcstrings(self.translations, "en"))
+
+        new = self._copy()
+        new["greeting"]["fr"]["value"] = "Bonjour %@"
+        new["farewell"]["fr"]["value"] = "Au revoir"
+        self.analyzer.swift_helper.validate_translation.reset_mock()
+
+        changed = self.incremental.update(new, "en")
+
+        self.assertEqual(changed, {"greeting": {"fr"}, "farewell": {"fr"}})
+        self.assertEqual(self.analyzer.swift_helper.validate_translation.call_count, 2)
+        self.assertEqual(self.incremental.issues(), self.analyzer.analyze_xcstrings(new, "en"))
+        self.assertEqual(self.incremental.store(), self.analyzer.analyze_issues(new, "en"))
+
+    def test_outlier_follows_median(self):
+        """Test that languages whose outlier status moves with the median are re-analyzed."""
+        self.translations["save"] = {
+            "en": {"value": "Save"},
+            "de": {"value": "Sichern"},
+            "fr": {"value": "Enregistrer les modifications"}
+        }
+        self.incremental.update(self.translations, "en")
+        new = self._copy()
+        new["save"]["de"]["value"] = "Speichern und schließen"
+
+        changed = self.incremental.update(new, "en")
+
+        self.assertEqual(changed, {"save": {"de", "fr"}})
+        self.assertEqual(self.incremental.issues(), self.analyzer.analyze_xcstrings(new, "en"))
+
+    def test_median_of_whole_key(self):
+        """Test that a changed language is compared with the median of every language of its key."""
+        self.translations["hello"] = {
+            "en": {"value": "Hello"},
+            "fr": {"value": "Salut"},
+            "de": {"value": "Hallo"},
+            "es": {"value": "Hola"},
+            "it": {"value": "Ciao"}
+        }
+        self.incremental.update(self.translations, "en")
+        new = self._copy()
+        new["hello"]["fr"]["value"] = "Salut salut salut salut salut"
+
+        changed = self.incremental.update(new, "en")
+
+        self.assertEqual(changed, {"hello": {"fr"}})
+        self.assertEqual(self.incremental.issues(), self.analyzer.analyze_xcstrings(new, "en"))
+        self.assertIn("Inconsistent translation of 'hello' in fr: 5.8x the median length of the key",
+                      self.incremental.issues()['consistency_issues'])
+
+    def test_removed_entries(self):
+        """Test that issues of removed keys and languages disappear."""
+        self.incremental.update(self.translations, "en")
+        new = self._copy()
+        del new["farewell"]
+        del new["greeting"]["ar"]
+
+        self.assertEqual(self.incremental.update(new, "en"), {})
+        issues = self.incremental.issues()
+        self.assertEqual(issues['missing_translations'], [])
+        self.assertEqual(issues['rtl_issues'], [])
+        self.assertEqual(issues['format_issues'],
+                         ["Format specifier mismatch in 'greeting' for fr: argument 1 changed type: %@ became %d"])
+
+if __name__ == '__main__':
+    unittest.main()
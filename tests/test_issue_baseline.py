@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+from src.utils.issue_baseline import IssueBaseline
+from src.utils.issue_store import make_issue
+
+class TestIssueBaseline(unittest.TestCase):
+    def setUp(self):
+        """Set up a baseline file with two accepted issues."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "baseline.db")
+        self.baseline = IssueBaseline(self.path)
+        self.missing = make_issue("greeting", "fr", "missing_translations")
+        self.length = make_issue("welcome", "de", "length_issues", {"length_ratio": 2.0})
+        self.entries = [(self.missing, "Hello", ""), (self.length, "Welcome", "Herzlich willkommen")]
+        self.baseline.accept(self.entries)
+
+    def tearDown(self):
+        self.baseline.close()
+        self.temp_dir.cleanup()
+
+    def test_accepted_issues_are_known(self):
+        """Test that a run with only accepted issues has no new or resolved ones."""
+        diff = self.baseline.compare(self.entries)
+
+        self.assertEqual(len(diff.new_issues), 0)
+        self.assertEqual(diff.resolved, [])
+        self.assertEqual(diff.known, 2)
+
+    def test_new_and_resolved(self):
+        """Test that changed texts make an issue new and vanished issues resolved."""
+        rtl = make_issue("greeting", "ar", "rtl_issues")
+        diff = self.baseline.compare([
+            (self.length, "Welcome", "Willkommen in unserer App"),
+            (rtl, "Hello", "مرحبا")
+        ])
+
+        self.assertEqual(list(diff.new_issues), [self.length, rtl])
+        self.assertEqual(diff.resolved, [
+            "Missing translation for 'greeting' in fr",
+            "Text length issue in 'welcome' for de: ratio 2.00"
+        ])
+        self.assertEqual(diff.known, 0)
+
+    def test_resolved_order(self):
+        """Test that resolved issues are sorted across lookup chunks."""
+        entries = [(make_issue(f"key_{i:04d}", "fr", "missing_translations"), f"Text {i}", "")
+                   for i in range(1200)]
+        self.baseline.accept(entries)
+
+        resolved = self.baseline.compare([]).resolved
+
+        self.assertEqual(resolved, [f"Missing translation for 'key_{i:04d}' in fr" for i in range(1200)])
+
+    def test_persistence(self):
+        """Test that accepting replaces the stored baseline and survives reopening."""
+        self.assertEqual(self.baseline.accept(self.entries[:1]), 1)
+        self.baseline.close()
+
+        self.baseline = IssueBaseline(self.path)
+        self.assertEqual(len(self.baseline), 1)
+        self.assertEqual(self.baseline.compare(self.entries).known, 1)
+
+    def test_content_hash(self):
+        """Test that the content hash depends on both texts."""
+        self.assertEqual(IssueBaseline.content_hash("a", "b"), IssueBaseline.content_hash("a", "b"))
+        self.assertNotEqual(IssueBaseline.content_hash("a", "b"), IssueBaseline.content_hash("ab", ""))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from src.utils.issue_store import Issue, IssueStore, format_issue, make_issue
+from src.utils.text_analyzer import TextAnalyzer
+
+class TestIssueStore(unittest.TestCase):
+    def setUp(self):
+        """Set up a store with issues in two keys and languages."""
+        self.store = IssueStore([
+            make_issue("greeting", "fr", "missing_translations"),
+            make_issue("greeting", "de", "length_issues", {"length_ratio": 1.75}),
+            make_issue("greeting", "ar", "rtl_issues"),
+            make_issue("welcome", "de", "format_issues"),
+            make_issue("welcome", "de", "length_issues", {"length_ratio": 2.0})
+        ])
+
+    def test_make_issue(self):
+        """Test that severity follows the category."""
+        self.assertEqual(make_issue("k", "fr", "missing_translations").severity, "error")
+        self.assertEqual(make_issue("k", "ar", "rtl_issues").severity, "info")
+        self.assertEqual(make_issue("k", "fr", "custom").severity, "warning")
+
+    def test_format_issue(self):
+        """Test that issues are rendered as the report sentences."""
+        self.assertEqual(format_issue(make_issue("greeting", "fr", "missing_translations")),
+                         "Missing translation for 'greeting' in fr")
+        self.assertEqual(format_issue(make_issue("greeting", "de", "length_issues", {"length_ratio": 1.754})),
+                         "Text length issue in 'greeting' for de: ratio 1.75")
+        self.assertEqual(format_issue(Issue("k", "fr", "custom_check", "info")), "Custom check in 'k' for fr")
+
+    def test_filter(self):
+        """Test filtering on indexed and unindexed fields."""
+        self.assertEqual([issue.key for issue in self.store.filter(language="de")], ["greeting", "welcome", "welcome"])
+        self.assertEqual(len(self.store.filter(key="welcome", category="length_issues")), 1)
+        self.assertEqual(len(self.store.filter(severity="error")), 2)
+        self.assertEqual(self.store.filter(key="missing"), [])
+        self.assertEqual(len(self.store.filter()), 5)
+
+    def test_count_and_group(self):
+        """Test counting and grouping."""
+        self.assertEqual(self.store.count(), 5)
+        self.assertEqual(self.store.count(category="length_issues"), 2)
+        self.assertEqual(self.store.count(language="de", severity="warning"), 2)
+        self.assertEqual(self.store.counts_by("severity"), {"error": 2, "warning": 2, "info": 1})
+        self.assertEqual(list(self.store.group_by("key")), ["greeting", "welcome"])
+        self.assertEqual(len(self.store.group_by("language")["de"]), 3)
+
+    def test_messages(self):
+        """Test formatting into the per-category dict with every category present."""
+        messages = self.store.messages()
+        self.assertEqual(messages["state_issues"], [])
+        self.assertEqual(messages["length_issues"], [
+            "Text length issue in 'greeting' for de: ratio 1.75",
+            "Text length issue in 'welcome' for de: ratio 2.00"
+        ])
+
+    def test_analyzer_store(self):
+        """Test that the analyzer's store formats to the same issues as analyze_xcstrings."""
+        analyzer = TextAnalyzer(backend='python')
+        translations = {
+            "greeting": {"en": {"value": "Hello %@"}, "fr": {"value": "Bonjour %d"}, "ar": {"value": "مرحبا %@"}},
+            "farewell": {"en": {"value": "Bye"}, "de": {"value": "Auf Wiedersehen"}, "es": {"value": ""}}
+        }
+        store = analyzer.analyze_issues(translations, "en")
+
+        self.assertEqual(store.messages(), analyzer.analyze_xcstrings(translations, "en"))
+        self.assertEqual(store.filter(category="length_issues")[0].metrics, {"length_ratio": 5.0})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,10 @@
 import unittest
 import json
 import os
+import tempfile
 from unittest.mock import mock_open, patch
-from src.utils.string_parser import StringParser
+from src.utils.string_parser import StringParser, XcstringsReader, split_variation_key, variation_key
+from src.utils.plural_rules import plural_categories
 
 class TestStringParser(unittest.TestCase):
     def setUp(self):
@@ -96,5 +98,133 @@ class TestStringParser(unittest.TestCase):
         self.assertNotIn("fr", translations["greeting"])
         self.assertEqual(translations["greeting"]["en"]["value"], "Hello")
 
+    def _write_catalog(self, data) -> str:
+        """Write catalog data to a temporary .xcstrings file."""
+        handle, path = tempfile.mkstemp(suffix=".xcstrings")
+        with os.fdopen(handle, "w", encoding="utf-8") as f:
+            f.write(data if isinstance(data, str) else json.dumps(data, indent=2, ensure_ascii=False))
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_stream_xcstrings_file(self):
+        """Test that streaming yields the same records as full extraction."""
+        path = self._write_catalog(self.sample_xcstrings_data)
+
+        reader = StringParser.stream_xcstrings_file(path)
+        records = list(reader)
+
+        self.assertEqual(reader.source_language, "en")
+        self.assertEqual(reader.key_count, 2)
+        self.assertEqual(records, [
+            ("greeting", "en", "Hello", "approved"),
+            ("greeting", "fr", "Bonjour", "approved"),
+            ("farewell", "en", "Goodbye", "approved"),
+            ("farewell", "es", "Adiós", "approved"),
+        ])
+
+    def test_stream_small_chunks_and_mmap(self):
+        """Test streaming with chunk boundaries inside strings and multi-byte characters."""
+        path = self._write_catalog(self.sample_xcstrings_data)
+        expected = list(XcstringsReader(path).records())
+
+        for use_mmap in (False, True):
+            reader = XcstringsReader(path, use_mmap=use_mmap, chunk_size=5)
+            self.assertEqual(list(reader.records()), expected)
+
+    def test_stream_source_language_after_strings(self):
+        """Test that the source language is found when it follows the strings."""
+        data = {"strings": self.sample_xcstrings_data["strings"], "sourceLanguage": "fr"}
+        path = self._write_catalog(data)
+
+        reader = StringParser.stream_xcstrings_file(path)
+
+        self.assertEqual(reader.source_language, "fr")
+        self.assertEqual(len(list(reader)), 4)
+
+    def _plural_catalog(self):
+        """Catalog with a plural key, a device key and a substitution."""
+        def plural(**forms):
+            return {"plural": {form: {"stringUnit": {"value": value, "state": "translated"}}
+                               for form, value in forms.items()}}
+        return {
+            "sourceLanguage": "en",
+            "strings": {
+                "files": {"localizations": {
+                    "en": {"variations": plural(one="%lld file", other="%lld files")},
+                    "ru": {"variations": plural(one="%lld файл", few="%lld файла", other="%lld файлов")},
+                }},
+                "tap": {"localizations": {
+                    "en": {"variations": {"device": {
+                        "iphone": {"stringUnit": {"value": "Tap", "state": "translated"}},
+                        "mac": {"stringUnit": {"value": "Click", "state": "translated"}},
+                    }}},
+                    "fr": {"variations": {"device": {
+                        "iphone": {"stringUnit": {"value": "Touchez", "state": "translated"}},
+                    }}},
+                }},
+                "photos": {"localizations": {
+                    "en": {
+                        "stringUnit": {"value": "%#@count@ in %@", "state": "translated"},
+                        "substitutions": {"count": {"variations": plural(one="%arg photo", other="%arg photos")}},
+                    },
+                    "fr": {"stringUnit": {"value": "%#@count@ dans %@", "state": "translated"}},
+                }},
+                "greeting": self.sample_xcstrings_data["strings"]["greeting"],
+            }
+        }
+
+    def test_variation_keys(self):
+        """Test that entry keys round-trip through their key and variation path."""
+        self.assertEqual(variation_key("files", ""), "files")
+        self.assertEqual(variation_key("files", "plural.one"), "files[plural.one]")
+        self.assertEqual(split_variation_key("photos[substitutions.count/plural.one]"),
+                         ("photos", "substitutions.count/plural.one"))
+        self.assertEqual(split_variation_key("Items [beta]"), ("Items [beta]", ""))
+
+    def test_plural_categories(self):
+        """Test CLDR plural categories of regional and unknown languages."""
+        self.assertEqual(plural_categories("pt-BR"), {"one", "many", "other"})
+        self.assertEqual(plural_categories("zh_Hans"), {"other"})
+        self.assertEqual(plural_categories("ar"), {"zero", "one", "two", "few", "many", "other"})
+        self.assertEqual(plural_categories("xx"), {"other"})
+
+    def test_extract_variations(self):
+        """Test that plural, device and substitution units become entries of their own."""
+        translations, _ = StringParser.extract_translations(self._plural_catalog())
+
+        self.assertEqual(translations["files[plural.few]"], {
+            "en": {"value": "%lld files", "state": "translated"},
+            "ru": {"value": "%lld файла", "state": "translated"},
+        })
+        # Russian needs a 'many' form the translation does not have
+        self.assertEqual(translations["files[plural.many]"]["ru"], {"value": "", "state": "new"})
+        self.assertEqual(translations["files[plural.one]"]["ru"]["value"], "%lld файл")
+        self.assertNotIn("fr", translations["tap[device.mac]"])
+        self.assertEqual(translations["tap[device.iphone]"]["fr"]["value"], "Touchez")
+        self.assertEqual(translations["photos"]["fr"]["value"], "%#@count@ dans %@")
+        self.assertEqual(translations["photos[substitutions.count/plural.other]"]["en"]["value"], "%arg photos")
+        self.assertEqual(translations["greeting"]["fr"]["value"], "Bonjour")
+        self.assertNotIn("files", translations)
+
+    def test_extract_catalog_variations(self):
+        """Test that the catalog and the reader flatten variations like extract_translations."""
+        data = self._plural_catalog()
+        expected, _ = StringParser.extract_translations(data)
+        self.assertEqual(dict(StringParser.extract_catalog(data).as_translations()), expected)
+
+        # The source language is needed before the first variation is flattened
+        path = self._write_catalog({"strings": data["strings"], "sourceLanguage": "en"})
+        streamed = {}
+        for key, lang, value, state in StringParser.stream_xcstrings_file(path):
+            streamed.setdefault(key, {})[lang] = {"value": value, "state": state}
+        self.assertEqual(streamed, expected)
+
+    def test_stream_invalid_json(self):
+        """Test that malformed catalogs raise ValueError while streaming."""
+        path = self._write_catalog('{"sourceLanguage": "en", "strings": {"greeting": {')
+
+        with self.assertRaises(ValueError):
+            list(StringParser.stream_xcstrings_file(path))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+from src.utils.python_backend import PythonBackend
+
+class TestPythonBackend(unittest.TestCase):
+    def setUp(self):
+        """Set up the in-process backend."""
+        self.backend = PythonBackend()
+
+    def test_analyze_text(self):
+        """Test basic text analysis."""
+        result = self.backend.analyze_text("Hello World", 375.0)
+
+        self.assertEqual(result['length'], 11)
+        self.assertEqual(result['words'], 2)
+        self.assertEqual(result['lines'], 1)
+        self.assertFalse(result['hasDirectionalOverrides'])
+
+    def test_validate_translation(self):
+        """Test translation validation result keys."""
+        result = self.backend.validate_translation("Hello World", "Bonjour le monde")
+
+        self.assertIn('lengthRatio', result)
+        self.assertTrue(result['specifiersMatch'])
+        self.assertEqual(result['recommendation'], 'No issues found')
+
+    def test_format_specifiers(self):
+        """Test format specifier mismatch detection."""
+        result = self.backend.validate_translation("Hello %@", "Bonjour %d")
+
+        self.assertFalse(result['specifiersMatch'])
+        self.assertEqual(result['sourceSpecifiers'], ['%@'])
+        self.assertEqual(result['translatedSpecifiers'], ['%d'])
+        self.assertIn('format', result['recommendation'].lower())
+
+    def test_percent_signs(self):
+        """Test that percent signs in text do not count as specifiers."""
+        result = self.backend.validate_translation("100% done", "100 % terminé")
+
+        self.assertTrue(result['specifiersMatch'])
+        self.assertEqual(result['translatedSpecifiers'], [])
+
+    def test_long_text(self):
+        """Test length ratio and recommendation for long translations."""
+        source = "This is a short text"
+        translation = "This is a much longer text that should trigger a length warning in the analysis"
+
+        result = self.backend.validate_translation(source, translation)
+
+        self.assertGreater(result['lengthRatio'], 1.5)
+        self.assertIn('longer', result['recommendation'].lower())
+
+    def test_empty_strings(self):
+        """Test that empty source text does not divide by zero."""
+        result = self.backend.validate_translation("", "")
+        self.assertEqual(result['lengthRatio'], 1.0)
+
+    def test_special_characters(self):
+        """Test handling of special characters."""
+        result = self.backend.analyze_text("Hello\n世界\t🌍")
+
+        self.assertGreater(result['length'], 0)
+        self.assertEqual(result['lines'], 2)
+
+    def test_validate_batch(self):
+        """Test that bulk validation agrees with per-pair validation."""
+        sources = ["Hello %@", "Hi", "", "%d items"]
+        translations = ["Bonjour %@", "Salut tout le monde", "Vide", "%@ éléments"]
+
+        result = self.backend.validate_batch(sources, translations)
+
+        for i, (source, translation) in enumerate(zip(sources, translations)):
+            single = self.backend.validate_translation(source, translation)
+            self.assertAlmostEqual(result['lengthRatio'][i], single['lengthRatio'])
+            self.assertEqual(result['specifiersMatch'][i], single['specifiersMatch'])
+            self.assertEqual(list(result['specifierMismatches'][i]), single['specifierMismatches'])
+
+    def test_specifier_mismatches(self):
+        """Test that mismatched specifiers are described."""
+        result = self.backend.validate_translation("%1$@ has %2$lld", "%2$d hat")
+
+        self.assertFalse(result['specifiersMatch'])
+        self.assertEqual(result['specifierMismatches'], [
+            "missing %1$@ (argument 1)",
+            "argument 2 changed type: %2$lld became %2$d"
+        ])
+
+    def test_rtl_layout(self):
+        """Test RTL layout analysis."""
+        result = self.backend.check_layout("ar", "مرحبا بكم")
+
+        self.assertTrue(result['isRTL'])
+        self.assertIn('textAnalysis', result)
+        self.assertFalse(self.backend.check_layout("fr", "Bonjour")['isRTL'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+from src.localization_tester import LocalizationTester
+from src.utils.issue_store import IssueStore, make_issue
+from src.utils.query_server import QueryServer
+
+class CatalogTester:
+    """Stands in for LocalizationTester: re-analysis publishes whatever issues were queued."""
+
+    def __init__(self, issues):
+        self.issues = IssueStore()
+        self.stats = {"total_strings": 0, "issues_found": 0}
+        self.pending = issues
+        self.closed = False
+
+    def refresh(self):
+        if self.pending is None:
+            return None
+        self.issues = IssueStore(self.pending)
+        self.stats["total_strings"] = len({issue.key for issue in self.pending})
+        self.stats["issues_found"] = len(self.pending)
+        changed = {issue.key: [issue.language] for issue in self.pending}
+        self.pending = None
+        return changed
+
+    def close(self):
+        self.closed = True
+
+class FailingTester(CatalogTester):
+    """A catalog whose re-analysis always fails."""
+
+    def refresh(self):
+        raise ValueError("catalog is corrupt")
+
+class TestQueryServer(unittest.TestCase):
+    def setUp(self):
+        """Start a server on a free port with two catalogs."""
+        self.app = CatalogTester([
+            make_issue("greeting", "fr", "missing_translations"),
+            make_issue("greeting", "de", "length_issues", {"length_ratio": 1.75}),
+            make_issue("welcome", "de", "format_issues", {"mismatches": "argument 1 is missing"})
+        ])
+        self.widget = CatalogTester([make_issue("title", "ar", "rtl_issues")])
+        self.server = QueryServer({"App.xcstrings": self.app, "Widget.xcstrings": self.widget},
+                                  port=0, interval=0.01).start()
+
+    def tearDown(self):
+        self.server.close()
+
+    def get(self, path):
+        try:
+            with urllib.request.urlopen(self.server.url + path, timeout=5) as response:
+                return response.status, json.loads(response.read().decode('utf-8'))
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read().decode('utf-8'))
+
+    def test_issues(self):
+        """Test that issues are filtered by key, language, category and catalog."""
+        status, body = self.get("/issues?language=de")
+        self.assertEqual(status, 200)
+        self.assertEqual(body["total"], 2)
+        self.assertEqual([issue["key"] for issue in body["issues"]], ["greeting", "welcome"])
+        self.assertEqual(body["issues"][1]["message"],
+                         "Format specifier mismatch in 'welcome' for de: argument 1 is missing")
+        self.assertEqual(body["issues"][0]["metrics"], {"length_ratio": 1.75})
+
+        _, body = self.get("/issues?key=greeting&category=missing_translations")
+        self.assertEqual([(issue["catalog"], issue["language"]) for issue in body["issues"]],
+                         [("App.xcstrings", "fr")])
+        _, body = self.get("/issues?catalog=Widget.xcstrings")
+        self.assertEqual([issue["key"] for issue in body["issues"]], ["title"])
+        _, body = self.get("/issues?severity=error&limit=1&offset=1")
+        self.assertEqual(body["total"], 2)
+        self.assertEqual([issue["key"] for issue in body["issues"]], ["welcome"])
+
+    def test_stats(self):
+        """Test that stats are served per catalog and for every catalog."""
+        status, body = self.get("/stats?catalog=App.xcstrings")
+        self.assertEqual(status, 200)
+        self.assertEqual(body, {"total_strings": 2, "issues_found": 3})
+        _, body = self.get("/stats")
+        self.assertEqual(set(body["catalogs"]), {"App.xcstrings", "Widget.xcstrings"})
+        _, body = self.get("/catalogs")
+        self.assertEqual(body["catalogs"][1], {"name": "Widget.xcstrings", "total_strings": 1, "issues_found": 1})
+
+    def test_errors(self):
+        """Test that bad queries are answered with an error status."""
+        self.assertEqual(self.get("/unknown")[0], 404)
+        self.assertEqual(self.get("/stats?catalog=Missing.xcstrings")[0], 404)
+        self.assertEqual(self.get("/issues?category=typos")[0], 400)
+        status, body = self.get("/issues?limit=-1")
+        self.assertEqual(status, 400)
+        self.assertIn("limit", body["error"])
+
+    def test_refresh(self):
+        """Test that changed catalogs are re-analyzed and published by the poller."""
+        self.assertEqual(self.server.refresh(), [])
+        self.app.pending = [make_issue("greeting", "fr", "missing_translations")]
+        deadline = time.monotonic() + 5
+        while self.get("/issues?catalog=App.xcstrings")[1]["total"] != 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.get("/issues?catalog=App.xcstrings")[1]["total"], 1)
+        self.assertEqual(self.get("/stats?catalog=App.xcstrings")[1]["issues_found"], 1)
+
+    def test_refresh_error(self):
+        """Test that a catalog failing to re-analyze does not stop the others from being refreshed."""
+        self.server.catalogs = {"Broken.xcstrings": FailingTester([]), **self.server.catalogs}
+        self.app.pending = [make_issue("greeting", "fr", "missing_translations")]
+        self.assertEqual(self.server.refresh(), ["App.xcstrings"])
+        self.assertEqual(self.get("/issues?catalog=App.xcstrings")[1]["total"], 1)
+        self.assertEqual(self.get("/stats?catalog=Broken.xcstrings")[0], 404)
+
+    def test_concurrent_clients(self):
+        """Test that concurrent clients all get complete answers."""
+        results = []
+
+        def client():
+            for _ in range(10):
+                results.append(self.get("/issues?language=de")[1]["total"])
+
+        threads = [threading.Thread(target=client) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [2] * 80)
+
+    def test_close(self):
+        """Test that closing the server shuts down every catalog."""
+        self.server.close()
+        self.assertTrue(self.app.closed and self.widget.closed)
+
+class TestServeBaseline(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.strings_file = os.path.join(self.directory.name, "App.xcstrings")
+        self.write_catalog("Bonjour %@")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_catalog(self, translation):
+        with open(self.strings_file, 'w', encoding='utf-8') as f:
+            json.dump({"sourceLanguage": "en", "version": "1.0", "strings": {"greeting": {"localizations": {
+                "en": {"stringUnit": {"state": "translated", "value": "Hello %@"}},
+                "fr": {"stringUnit": {"state": "translated", "value": translation}}
+            }}}}, f)
+
+    def test_edit_with_baseline(self):
+        """Test that a catalog served with a baseline is re-analyzed on the poller thread after an edit."""
+        tester = LocalizationTester(self.strings_file, backend='python',
+                                    baseline_file=os.path.join(self.directory.name, "baseline.sqlite"))
+        server = QueryServer({"App.xcstrings": tester}, port=0, interval=0.01).start()
+        try:
+            self.assertEqual(server.snapshots["App.xcstrings"].stats["new_issues"], 0)
+            self.write_catalog("Bonjour")
+            deadline = time.monotonic() + 5
+            while server.snapshots["App.xcstrings"].stats["new_issues"] != 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(server.snapshots["App.xcstrings"].stats["new_issues"], 1)
+            # Only the edited pair is counted for the second pass
+            self.assertEqual(server.snapshots["App.xcstrings"].stats["analyzed_pairs"], 1)
+        finally:
+            server.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from src.utils.report_generator import ReportGenerator, open_report_file
+from src.utils.issue_store import IssueStore, make_issue
+
+class TestReportGenerator(unittest.TestCase):
+    def setUp(self):
+        """Set up issues and stats for a single catalog."""
+        self.issues = {
+            'missing_translations': ["Missing translation for 'greeting' in fr"],
+            'length_issues': [],
+            'format_issues': ["Format specifier mismatch in 'welcome' for de"],
+            'rtl_issues': [],
+            'state_issues': []
+        }
+        self.stats = {
+            "total_strings": 2,
+            "languages": ["en", "fr", "de"],
+            "missing_translations": 1,
+            "issues_found": 2
+        }
+
+    def test_markdown_report(self):
+        """Test that only non-empty categories are rendered."""
+        report = ReportGenerator(self.issues, self.stats).generate_markdown_report()
+
+        self.assertIn("## Issues by Category", report)
+        self.assertIn("### Missing Translations", report)
+        self.assertIn("- ⚠️  Format specifier mismatch in 'welcome' for de", report)
+        self.assertNotIn("### Length Issues", report)
+        self.assertNotIn("## Catalogs", report)
+
+    def test_project_report(self):
+        """Test the per-catalog breakdown of an aggregated project report."""
+        catalogs = {
+            "App/Localizable.xcstrings": {"issues": self.issues, "stats": self.stats},
+            "Kit/Kit.xcstrings": {"issues": {}, "stats": dict(self.stats, issues_found=0)}
+        }
+        generator = ReportGenerator({}, {"total_catalogs": 2}, catalogs=catalogs)
+
+        report = generator.generate_markdown_report()
+        self.assertIn("| App/Localizable.xcstrings | 2 | 3 | 1 | 2 |", report)
+        self.assertIn("### Kit/Kit.xcstrings", report)
+        self.assertIn("#### Format Issues", report)
+        self.assertNotIn("## Issues by Category", report)
+
+        data = json.loads(generator.generate_json_report())
+        self.assertEqual(set(data["catalogs"]), set(catalogs))
+
+    def test_metrics(self):
+        """Test that run metrics get their own section instead of a summary line."""
+        self.stats["metrics"] = {
+            "stages": {"parse": {"wall_seconds": 0.25, "cpu_seconds": 0.2, "runs": 1}},
+            "backend_calls": {
+                "validate": {"count": 4, "total_seconds": 0.004, "mean_ms": 1.0, "max_ms": 2.5,
+                             "histogram": {"<=1ms": 3, "<=5ms": 1}}
+            }
+        }
+        generator = ReportGenerator(self.issues, self.stats)
+
+        report = generator.generate_markdown_report()
+        self.assertNotIn("**metrics**", report)
+        self.assertIn("| parse | 0.250 | 0.200 | 1 |", report)
+        self.assertIn("| validate | 4 | 1.000 | 2.500 | <=1ms: 3, <=5ms: 1 |", report)
+        self.assertIn("parse: 0.250s wall", generator.generate_console_report())
+        self.assertEqual(json.loads(generator.generate_json_report())["stats"]["metrics"], self.stats["metrics"])
+
+    def test_streaming_writers(self):
+        """Test that streamed reports match the generated ones."""
+        generator = ReportGenerator(self.issues, self.stats)
+        for report_format, generate in (('markdown', generator.generate_markdown_report),
+                                        ('console', generator.generate_console_report),
+                                        ('json', generator.generate_json_report)):
+            stream = io.StringIO()
+            generator.write(stream, report_format)
+            self.assertEqual(stream.getvalue(), generate())
+
+        with self.assertRaises(ValueError):
+            generator.write(io.StringIO(), 'html')
+
+    def test_jsonl_report(self):
+        """Test one summary line followed by one line per issue."""
+        catalogs = {"Kit/Kit.xcstrings": {"issues": self.issues, "stats": self.stats}}
+        stream = io.StringIO()
+        ReportGenerator(self.issues, self.stats, catalogs=catalogs).write_jsonl(stream)
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(lines[0]["type"], "summary")
+        self.assertEqual(lines[0]["stats"]["issues_found"], 2)
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(lines[1], {"type": "issue", "category": "missing_translations",
+                                    "message": "Missing translation for 'greeting' in fr"})
+        self.assertEqual(lines[4]["catalog"], "Kit/Kit.xcstrings")
+
+    def test_issue_store(self):
+        """Test that stored issues render like their sentences and keep their fields in JSON."""
+        store = IssueStore([
+            make_issue("greeting", "fr", "missing_translations"),
+            make_issue("welcome", "de", "format_issues")
+        ])
+        from_store = ReportGenerator(store, self.stats)
+        from_messages = ReportGenerator(self.issues, self.stats)
+        from_store.timestamp = from_messages.timestamp
+
+        self.assertEqual(from_store.generate_markdown_report(), from_messages.generate_markdown_report())
+        self.assertEqual(from_store.generate_console_report(), from_messages.generate_console_report())
+        issue = json.loads(from_store.generate_json_report())["issues"]["format_issues"][0]
+        self.assertEqual(issue["key"], "welcome")
+        self.assertEqual(issue["severity"], "error")
+        self.assertEqual(issue["message"], "Format specifier mismatch in 'welcome' for de")
+
+    def test_gzip_report_file(self):
+        """Test that .gz report files are compressed."""
+        generator = ReportGenerator(self.issues, self.stats)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "report.md.gz")
+            with open_report_file(path) as stream:
+                generator.write_markdown(stream)
+
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                self.assertEqual(f.read(), generator.generate_markdown_report())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from src.utils.result_cache import ResultCache
+from src.utils.text_analyzer import TextAnalyzer
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        """Set up a temporary directory for cache files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.cache_path = os.path.join(self.temp_dir.name, 'cache.sqlite')
+
+    def test_make_key(self):
+        """Test that keys depend on every part and on part boundaries."""
+        self.assertEqual(ResultCache.make_key('a', 'b'), ResultCache.make_key('a', 'b'))
+        self.assertNotEqual(ResultCache.make_key('a', 'b'), ResultCache.make_key('b', 'a'))
+        self.assertNotEqual(ResultCache.make_key('ab', ''), ResultCache.make_key('a', 'b'))
+
+    def test_hit_and_miss_counters(self):
+        """Test hit/miss accounting in the memory layer."""
+        cache = ResultCache()
+        self.assertIsNone(cache.get('key'))
+        cache.put('key', {'lengthRatio': 1.0})
+
+        self.assertEqual(cache.get('key'), {'lengthRatio': 1.0})
+        self.assertEqual(cache.stats(), {'cache_hits': 1, 'cache_misses': 1})
+
+    def test_memory_lru_eviction(self):
+        """Test that the memory layer evicts the least recently used entry."""
+        cache = ResultCache(memory_entries=2)
+        cache.put('a', {'v': 1})
+        cache.put('b', {'v': 2})
+        cache.get('a')
+        cache.put('c', {'v': 3})
+
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+
+    def test_persists_across_instances(self):
+        """Test that flushed results are read back from disk."""
+        cache = ResultCache(self.cache_path)
+        cache.put('key', {'specifiersMatch': False})
+        cache.close()
+
+        reopened = ResultCache(self.cache_path)
+        self.addCleanup(reopened.close)
+        self.assertEqual(reopened.get('key'), {'specifiersMatch': False})
+
+    def test_periodic_commit(self):
+        """Test that writes are committed every commit_interval writes, before any flush."""
+        cache = ResultCache(self.cache_path, commit_interval=2)
+        self.addCleanup(cache.close)
+        cache.put('a', {'v': 1})
+        reader = ResultCache(self.cache_path)
+        self.addCleanup(reader.close)
+        self.assertIsNone(reader.get('a'))
+
+        cache.put('b', {'v': 2})
+        self.assertEqual(reader.get('a'), {'v': 1})
+        self.assertEqual(cache._db.execute("PRAGMA journal_mode").fetchone()[0], 'wal')
+
+    def test_disk_eviction(self):
+        """Test size-bounded eviction of least recently used entries on disk."""
+        cache = ResultCache(self.cache_path, memory_entries=1, max_entries=2)
+        cache.put('a', {'v': 1})
+        cache.put('b', {'v': 2})
+        cache.get('a')
+        cache.put('c', {'v': 3})
+        cache.close()
+
+        reopened = ResultCache(self.cache_path)
+        self.addCleanup(reopened.close)
+        self.assertIsNotNone(reopened.get('a'))
+        self.assertIsNone(reopened.get('b'))
+        self.assertIsNotNone(reopened.get('c'))
+
+    def test_warm_run_skips_backend(self):
+        """Test that a rerun on an unchanged catalog makes no backend calls."""
+        translations = {
+            "greeting": {
+                "en": {"value": "Hello"},
+                "ar": {"value": "مرحبا"}
+            }
+        }
+        cache = ResultCache(self.cache_path)
+        analyzer = TextAnalyzer(cache=cache)
+        analyzer.swift_helper = MagicMock()
+        analyzer.swift_helper.validate_translation.return_value = {'lengthRatio': 1.0, 'specifiersMatch': True}
+        analyzer.swift_helper.check_layout.return_value = {'isRTL': True}
+        first = analyzer.analyze_xcstrings(translations, "en")
+        analyzer.close()
+        cache.close()
+
+        warm = TextAnalyzer(cache=ResultCache(self.cache_path))
+        warm.swift_helper = MagicMock()
+        second = warm.analyze_xcstrings(translations, "en")
+        warm.cache.close()
+
+        self.assertEqual(first, second)
+        warm.swift_helper.validate_translation.assert_not_called()
+        warm.swift_helper.check_layout.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import json
+import unittest
+from src.utils.run_metrics import RunMetrics
+from src.utils.text_analyzer import TextAnalyzer
+
+class TestRunMetrics(unittest.TestCase):
+    def test_stage_timers(self):
+        """Test that repeated runs of a stage accumulate."""
+        metrics = RunMetrics()
+        for _ in range(2):
+            with metrics.stage("parse"):
+                sum(range(1000))
+
+        stage = metrics.as_dict()["stages"]["parse"]
+        self.assertEqual(stage["runs"], 2)
+        self.assertGreater(stage["wall_seconds"], 0)
+
+    def test_backend_call_histogram(self):
+        """Test call counts and latency bucketing."""
+        metrics = RunMetrics()
+        metrics.record_call("validate", 0.00005)
+        metrics.record_call("validate", 0.003)
+        metrics.record_call("validate", 2.0)
+
+        calls = metrics.as_dict()["backend_calls"]["validate"]
+        self.assertEqual(calls["count"], 3)
+        self.assertEqual(calls["max_ms"], 2000.0)
+        self.assertEqual(calls["histogram"]["<=0.1ms"], 1)
+        self.assertEqual(calls["histogram"]["<=5ms"], 1)
+        self.assertEqual(calls["histogram"][">1000ms"], 1)
+
+    def test_analyzer_records_backend_calls(self):
+        """Test that the analyzer times its backend calls."""
+        metrics = RunMetrics()
+        analyzer = TextAnalyzer(backend='python', metrics=metrics)
+        analyzer.analyze_xcstrings({"greeting": {"en": {"value": "Hello"}, "fr": {"value": "Bonjour"}}}, "en")
+        analyzer.analyze_translation("Hello", "Bonjour")
+
+        calls = metrics.as_dict()["backend_calls"]
+        self.assertEqual(calls["validate_batch"]["count"], 1)
+        self.assertEqual(calls["validate"]["count"], 1)
+
+    def test_profiling(self):
+        """Test that profiling captures peak memory and a function summary."""
+        metrics = RunMetrics(profile=True)
+        metrics.start_profiling()
+        data = [str(i) for i in range(10000)]
+        summary = metrics.stop_profiling()
+
+        self.assertIn("function calls", summary)
+        self.assertGreater(metrics.as_dict()["peak_memory_bytes"], 0)
+        json.dumps(metrics.as_dict())
+        del data
+
+    def test_profiling_disabled(self):
+        """Test that capture is a no-op without the profile flag."""
+        metrics = RunMetrics()
+        metrics.start_profiling()
+        self.assertIsNone(metrics.stop_profiling())
+        self.assertNotIn("peak_memory_bytes", metrics.as_dict())
+
+if __name__ == '__main__':
+    unittest.main()
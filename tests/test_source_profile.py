@@ -0,0 +1,51 @@
+import unittest
+from src.utils.source_profile import compare_profile, is_outlier, median_length, profile_source
+
+class TestSourceProfile(unittest.TestCase):
+    def test_profile_source(self):
+        """Test the features computed for a source string."""
+        profile = profile_source(" Delete %d items... ")
+
+        self.assertEqual(profile.length, 20)
+        self.assertEqual(profile.format.texts, ["%d"])
+        self.assertEqual(profile.script, "LATIN")
+        self.assertTrue(profile.leading_space)
+        self.assertTrue(profile.trailing_space)
+        self.assertEqual((profile.ending, profile.ending_text), ("ellipsis", "..."))
+        self.assertIsNone(profile_source("%@ – %@").script)
+
+    def test_compare_punctuation(self):
+        """Test that equivalent punctuation of other scripts is accepted."""
+        question = profile_source("Delete this file?")
+
+        self.assertEqual(compare_profile(question, "ar", "حذف هذا الملف؟"), [])
+        self.assertEqual(compare_profile(question, "ja", "このファイルを削除しますか？"), [])
+        self.assertEqual(compare_profile(question, "fr", "Supprimer ce fichier ?"), [])
+        self.assertEqual(compare_profile(question, "de", "Diese Datei löschen."), ["ends with '.' instead of '?'"])
+        self.assertEqual(compare_profile(question, "de", "Diese Datei löschen"), ["missing final '?'"])
+        self.assertEqual(compare_profile(profile_source("Done"), "de", "Fertig!"), ["adds final '!'"])
+        # Thai does not end sentences with a full stop
+        self.assertEqual(compare_profile(profile_source("Saved."), "th", "บันทึกแล้ว"), [])
+
+    def test_compare_whitespace(self):
+        """Test that leading and trailing whitespace must match the source."""
+        profile = profile_source("Name: ")
+
+        self.assertEqual(compare_profile(profile, "de", "Name: "), [])
+        self.assertEqual(compare_profile(profile, "fr", " Nom :"),
+                         ["leading whitespace added", "trailing whitespace dropped"])
+
+    def test_outliers(self):
+        """Test the per-key median and the outlier threshold."""
+        key = {"en": {"value": "Save"}, "de": {"value": "Sichern"}, "fr": {"value": "Enregistrer"},
+               "it": {"value": ""}}
+
+        self.assertEqual(median_length(key), 7)
+        self.assertIsNone(median_length({"en": {"value": "Save"}, "de": {"value": "Sichern"}}))
+        self.assertEqual(median_length(dict(key, es={"value": "Guardar"})), 7)
+        self.assertTrue(is_outlier(22, 7))
+        self.assertFalse(is_outlier(21, 7))
+        self.assertFalse(is_outlier(100, None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+import unittest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+# Modules `import localization_tester` may load, its own included. Counted rather
+# than timed, so the budget does not depend on the speed of the machine; the
+# import time itself is tracked by the startup stage of benchmarks/bench_catalog.py
+IMPORT_MODULE_BUDGET = 100
+# Modules that must only be loaded when a feature actually needs them
+DEFERRED_MODULES = ('tkinter', 'markdown', 'sqlite3', 'concurrent.futures', 'multiprocessing', 'http.server')
+
+class TestStartup(unittest.TestCase):
+    def _import_entry_point(self, code: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=SRC_DIR,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+    def test_deferred_imports(self):
+        """Test that importing the entry point does not load GUI or optional modules."""
+        result = self._import_entry_point(
+            "import sys, localization_tester; "
+            f"print([m for m in {DEFERRED_MODULES!r} if m in sys.modules])"
+        )
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_import_module_budget(self):
+        """Test that importing the entry point loads no more modules than its budget."""
+        result = self._import_entry_point(
+            "import sys; before = set(sys.modules); import localization_tester; "
+            "print(len(set(sys.modules) - before))"
+        )
+        self.assertLessEqual(int(result.stdout), IMPORT_MODULE_BUDGET)
+
+if __name__ == '__main__':
+    unittest.main()
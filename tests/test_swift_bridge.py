@@ -1,6 +1,8 @@
 import unittest
 import os
+from unittest.mock import patch
 from src.utils.swift_bridge import SwiftBridge
+from tests import get_test_data_path
 
 class TestSwiftBridge(unittest.TestCase):
     def setUp(self):
@@ -99,5 +101,65 @@ class TestSwiftBridge(unittest.TestCase):
         self.assertTrue(result['specifiersMatch'])
         self.assertIn('No issues found', result['recommendation'])
 
+class TestPersistentSwiftBridge(unittest.TestCase):
+    def setUp(self):
+        """Set up SwiftBridge against the stub helper in persistent mode."""
+        self.bridge = SwiftBridge(helper_path=get_test_data_path('stub_helper.py'))
+        self.addCleanup(self.bridge.close)
+
+    def test_reuses_single_process(self):
+        """Test that consecutive requests are served by the same helper process."""
+        first = self.bridge.analyze_text("Hello World")
+        second = self.bridge.check_layout("ar", "مرحبا بكم")
+
+        self.assertEqual(first['words'], 2)
+        self.assertTrue(second['isRTL'])
+        self.assertEqual(first['pid'], second['textAnalysis']['pid'])
+
+    def test_validate_translation(self):
+        """Test translation validation over the request protocol."""
+        result = self.bridge.validate_translation("Hello %@", "Bonjour %d\nle monde")
+
+        self.assertFalse(result['specifiersMatch'])
+        self.assertIn('format', result['recommendation'].lower())
+
+    def test_restart_after_crash(self):
+        """Test that the helper is restarted transparently after it dies."""
+        first_pid = self.bridge.analyze_text("Hello")['pid']
+        self.bridge._process.kill()
+        self.bridge._process.wait()
+
+        second_pid = self.bridge.analyze_text("Hello")['pid']
+        self.assertNotEqual(first_pid, second_pid)
+
+    def test_close(self):
+        """Test clean shutdown and lazy restart of the helper process."""
+        self.bridge.analyze_text("Hello")
+        process = self.bridge._process
+        self.bridge.close()
+
+        self.assertEqual(process.returncode, 0)
+        self.assertIsNone(self.bridge._process)
+        self.assertEqual(self.bridge.analyze_text("Hello")['length'], 5)
+
+    def test_one_shot_mode(self):
+        """Test the non-persistent per-call mode."""
+        bridge = SwiftBridge(helper_path=get_test_data_path('stub_helper.py'), persistent=False)
+        result = bridge.validate_translation("Hello", "Bonjour")
+
+        self.assertTrue(result['specifiersMatch'])
+        self.assertIsNone(bridge._process)
+
+    @patch.dict(os.environ, {'STUB_HELPER_NO_SERVE': '1'})
+    def test_helper_without_serve_mode(self):
+        """Test that a helper without serve mode is run once per call instead."""
+        bridge = SwiftBridge(helper_path=get_test_data_path('stub_helper.py'))
+        result = bridge.validate_translation("Hello %@", "Bonjour")
+
+        self.assertFalse(bridge.persistent)
+        self.assertFalse(result['specifiersMatch'])
+        self.assertEqual(bridge.analyze_text("Hello")['length'], 5)
+        self.assertIsNone(bridge._process)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from src.utils.python_backend import PythonBackend
+from src.utils.text_width import TextWidthEstimator, TruncationChecker, WidthLimit, load_glyph_table
+from src.utils.text_analyzer import TextAnalyzer
+
+class TestTextWidthEstimator(unittest.TestCase):
+    def setUp(self):
+        self.estimator = TextWidthEstimator(size=10.0)
+
+    def test_measure_ascii(self):
+        """Test that widths add up the glyph advances at the point size."""
+        # H 722 + i 222 in 1/1000 em at 10pt
+        self.assertAlmostEqual(self.estimator.measure("Hi"), 9.44)
+        self.assertAlmostEqual(self.estimator.measure("Hi", size=20.0), 18.88)
+
+    def test_unicode_classes(self):
+        """Test advances of accented, combining and full-width characters."""
+        self.assertAlmostEqual(self.estimator.measure("é"), self.estimator.measure("e"))
+        self.assertAlmostEqual(self.estimator.measure("e\u0301"), self.estimator.measure("e"))
+        self.assertAlmostEqual(self.estimator.measure("日本"), 20.0)
+
+    def test_multiline(self):
+        """Test that the widest line is measured and wrapped lines are counted."""
+        self.assertAlmostEqual(self.estimator.measure("ii\nHH"), 14.44)
+        self.assertEqual(self.estimator.line_count("H" * 10 + "\nok", 30.0), 4)
+
+    def test_memoized(self):
+        """Test that each string is measured once per font."""
+        self.estimator.measure("Cancel")
+        self.estimator.measure("Cancel", size=30.0)
+        self.assertEqual(list(self.estimator._line_widths), [("Cancel", "system")])
+
+    def test_glyph_table_file(self):
+        """Test loading a custom glyph table once."""
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            json.dump({"unitsPerEm": 2048, "advances": {"a": 1024}, "default": 2048}, f)
+        self.addCleanup(os.remove, f.name)
+
+        self.assertIs(load_glyph_table(f.name), load_glyph_table(f.name))
+        self.assertAlmostEqual(self.estimator.measure("ab", font=f.name), 15.0)
+
+class TestTruncationChecker(unittest.TestCase):
+    def test_from_file(self):
+        """Test the default and per-key limits of a widths file."""
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            json.dump({"width": 100, "size": 10, "keys": {"ok": 20, "body": {"width": 50, "lines": 2}}}, f)
+        self.addCleanup(os.remove, f.name)
+
+        checker = TruncationChecker.from_file(f.name)
+
+        self.assertEqual(checker.default, WidthLimit(100, size=10))
+        self.assertEqual(checker.limits["ok"], WidthLimit(20, size=10))
+        self.assertEqual(checker.limits["body"], WidthLimit(50, size=10, lines=2))
+
+    def test_check(self):
+        """Test flagging text that overflows its key's width."""
+        checker = TruncationChecker(limits={"ok": WidthLimit(20, size=10), "body": WidthLimit(30, size=10, lines=2)})
+
+        self.assertIsNone(checker.check("ok", "OK"))
+        self.assertIsNone(checker.check("title", "Anything without a limit"))
+        overflow = checker.check("ok", "D'accord")
+        self.assertEqual(overflow["max_width"], 20)
+        self.assertGreater(overflow["text_width"], 20)
+        self.assertIsNone(checker.check("body", "H" * 7))
+        self.assertEqual(checker.check("body", "H" * 9)["max_width"], 60)
+        # Variations of a key share its limit
+        self.assertEqual(checker.check("ok[plural.other]", "D'accord"), overflow)
+
+    def test_analyzer_reports_truncation(self):
+        """Test that every analysis path reports truncated translations."""
+        translations = {
+            "ok": {"en": {"value": "OK"}, "fr": {"value": "D'accord"}, "de": {"value": "OK"}},
+            "cancel": {"en": {"value": "Cancel"}, "fr": {"value": "Annuler"}}
+        }
+        checker = TruncationChecker(limits={"ok": WidthLimit(20, size=10)})
+
+        issues = TextAnalyzer(backend='python', truncation=checker).analyze_xcstrings(translations, "en")
+
+        self.assertEqual(issues['truncation_issues'], ["Text too wide in 'ok' for fr: 39pt of 20pt"])
+        serial = TextAnalyzer(backend='python', truncation=checker)
+        # A backend that is not a PythonBackend takes the per-pair path
+        serial.swift_helper = MagicMock(wraps=PythonBackend())
+        self.assertEqual(serial.analyze_xcstrings(translations, "en"), issues)
+
+if __name__ == '__main__':
+    unittest.main()
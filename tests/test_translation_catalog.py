@@ -0,0 +1,73 @@
+import unittest
+from src.utils.string_parser import StringParser
+from src.utils.translation_catalog import TranslationCatalog
+
+class TestTranslationCatalog(unittest.TestCase):
+    def setUp(self):
+        """Set up a catalog with sparse languages and a custom state."""
+        self.xcstrings_data = {
+            "sourceLanguage": "en",
+            "strings": {
+                "greeting": {
+                    "localizations": {
+                        "en": {"stringUnit": {"value": "Hello", "state": "translated"}},
+                        "fr": {"stringUnit": {"value": "Bonjour", "state": "needs_review"}}
+                    }
+                },
+                "empty": {},
+                "farewell": {
+                    "localizations": {
+                        "en": {"stringUnit": {"value": "Goodbye", "state": "approved"}},
+                        "es": {"stringUnit": {"value": "Adiós", "state": "translated"}}
+                    }
+                }
+            }
+        }
+        self.catalog = StringParser.extract_catalog(self.xcstrings_data)
+
+    def test_lookup(self):
+        """Test cell lookups by key and language."""
+        self.assertEqual(len(self.catalog), 3)
+        self.assertEqual(self.catalog.source_language, "en")
+        self.assertEqual(self.catalog.languages, ["en", "fr", "es"])
+        self.assertEqual(self.catalog.get("greeting", "fr"), ("Bonjour", "needs_review"))
+        self.assertEqual(self.catalog.get("farewell", "en"), ("Goodbye", "approved"))
+        self.assertIsNone(self.catalog.get("farewell", "fr"))
+        self.assertIsNone(self.catalog.get("empty", "en"))
+        self.assertIsNone(self.catalog.get("unknown", "en"))
+
+    def test_iter_language(self):
+        """Test iterating one language column."""
+        self.assertEqual(list(self.catalog.iter_language("en")), [
+            ("greeting", "Hello", "translated"),
+            ("farewell", "Goodbye", "approved")
+        ])
+        self.assertEqual(list(self.catalog.iter_language("de")), [])
+
+    def test_dict_adapter(self):
+        """Test that the view matches the extract_translations dict shape."""
+        translations, _ = StringParser.extract_translations(self.xcstrings_data)
+        view = self.catalog.as_translations()
+
+        self.assertEqual(dict(view), translations)
+        self.assertEqual(list(view), ["greeting", "empty", "farewell"])
+        self.assertIsNone(view.get("unknown"))
+
+    def test_round_trip(self):
+        """Test building a catalog from records and from the dict shape."""
+        translations, _ = StringParser.extract_translations(self.xcstrings_data)
+        records = [
+            (key, lang, data["value"], data["state"])
+            for key, langs in translations.items()
+            for lang, data in langs.items()
+        ]
+
+        from_dict = TranslationCatalog.from_translations(translations)
+        from_records = TranslationCatalog.from_records(records)
+
+        self.assertEqual(dict(from_dict.as_translations()), translations)
+        self.assertEqual(from_records.get("farewell", "es"), ("Adiós", "translated"))
+        self.assertNotIn("empty", from_records)
+
+if __name__ == '__main__':
+    unittest.main()
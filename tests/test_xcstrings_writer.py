@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+import unittest
+from src.utils.string_parser import StringParser
+from src.utils.xcstrings_writer import format_xcstrings, insert_member, member_order
+
+# A catalog as Xcode saves it
+XCODE_CATALOG = '''{
+  "sourceLanguage" : "en",
+  "strings" : {
+    "" : {
+
+    },
+    "Delete \\"%@\\"?" : {
+      "extractionState" : "manual",
+      "localizations" : {
+        "ar" : {
+          "stringUnit" : {
+            "state" : "translated",
+            "value" : "حذف \\"%@\\"؟"
+          }
+        },
+        "en" : {
+          "stringUnit" : {
+            "state" : "translated",
+            "value" : "Delete \\"%@\\"?\\n"
+          }
+        }
+      }
+    },
+    "Legacy" : {
+      "shouldTranslate" : false
+    }
+  },
+  "version" : "1.0"
+}'''
+
+class TestXcstringsWriter(unittest.TestCase):
+    def setUp(self):
+        """Set up a temporary directory for written catalogs."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "Localizable.xcstrings")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_format_round_trip(self):
+        """Test that a catalog saved by Xcode is reproduced byte for byte."""
+        self.assertEqual(format_xcstrings(json.loads(XCODE_CATALOG)), XCODE_CATALOG)
+
+    def test_write_xcstrings_file(self):
+        """Test that catalogs are written atomically and keep the file's permissions."""
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('{}')
+        os.chmod(self.path, 0o640)
+
+        StringParser.write_xcstrings_file(json.loads(XCODE_CATALOG), self.path)
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), XCODE_CATALOG.encode('utf-8'))
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o640)
+        self.assertEqual(os.listdir(self.temp_dir.name), ["Localizable.xcstrings"])
+
+    def test_failed_write_keeps_file(self):
+        """Test that a write that fails leaves the old catalog and no temporary file."""
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(XCODE_CATALOG)
+        with self.assertRaises(TypeError):
+            StringParser.write_xcstrings_file({"strings": {"key": {"comment": object()}}}, self.path)
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), XCODE_CATALOG)
+        self.assertEqual(os.listdir(self.temp_dir.name), ["Localizable.xcstrings"])
+
+    def test_insert_member(self):
+        """Test that new members go where Xcode's order puts them, and existing ones stay."""
+        localizations = {"de": 1, "en": 2, "fr": 3, "zh-Hans": 4}
+        insert_member(localizations, "en-XA", 5)
+        insert_member(localizations, "fr", 6)
+        self.assertEqual(list(localizations.items()), [("de", 1), ("en", 2), ("en-XA", 5), ("fr", 6), ("zh-Hans", 4)])
+        self.assertEqual(sorted(["item10", "Item2", "item1"], key=member_order), ["item1", "Item2", "item10"])
+
+if __name__ == '__main__':
+    unittest.main()